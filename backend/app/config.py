@@ -2,14 +2,16 @@
 Application configuration settings.
 Uses environment variables for sensitive data.
 """
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, NoDecode, SettingsConfigDict
 from pydantic import field_validator
-from typing import Literal
-from functools import lru_cache
+from typing import Annotated, Literal
+import json
 
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
+
+    model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", frozen=True)
     
     # API Keys
     gemini_api_key: str = ""
@@ -20,7 +22,7 @@ class Settings(BaseSettings):
     debug: bool = False
     
     # CORS settings
-    cors_origins: list[str] = [
+    cors_origins: Annotated[list[str], NoDecode] = [
         "http://localhost:5173",
         "http://127.0.0.1:5173",
         "http://localhost:3000",
@@ -39,11 +41,41 @@ class Settings(BaseSettings):
     # LLM settings
     gemini_model: str = "gemini-3-flash-preview"
     max_retries: int = 3
-    
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
+    # Build the Gemini client and response schemas at startup instead of on
+    # the first request. Off by default to keep serverless cold starts lean.
+    llm_warmup: bool = False
+    # Max Gemini requests in flight at once, across all pipelines
+    llm_concurrency: int = 4
+    # First backoff delay after a rate-limit/overload error; doubles on each
+    # retry, plus up to one base delay of random jitter
+    llm_retry_base_delay: float = 1.0
+
+    # Extraction caches (CV / job description / uploaded file content hash ->
+    # parsed facts or text).
+    # Set the size to 0 to disable.
+    extraction_cache_size: int = 256
+    extraction_cache_ttl_seconds: int = 3600
+    # Bullet rewrite cache (bullet + job keywords/responsibilities + user
+    # instructions -> rewrite). Shares the extraction cache TTL; 0 disables.
+    rewrite_cache_size: int = 1024
+    # Rendered exports (format + tailored CV/cover letter -> file bytes), so
+    # repeat downloads skip re-rendering. Shares the extraction cache TTL.
+    export_cache_size: int = 32
+    # Exact-match Gemini replies per client (model + system instruction +
+    # prompt -> reply text). Shares the extraction cache TTL; 0 disables.
+    llm_cache_size: int = 256
+
+    # PDF text extraction: "pdfium" (PDFium C library via pypdfium2) or
+    # "pypdf2" (pure Python; also used if pypdfium2 isn't installed)
+    pdf_parser: Literal["pdfium", "pypdf2"] = "pdfium"
 
+    # CVs at least this long are extracted per section (experience vs the
+    # rest) in two parallel LLM calls. Set to 0 to always use a single call.
+    cv_section_extraction_min_chars: int = 8000
+
+    # Max tailoring pipelines run at once for a /tailor/batch call
+    batch_concurrency: int = 3
+    
     @field_validator("cors_origins", mode="before")
     @classmethod
     def parse_cors_origins(cls, value):
@@ -53,12 +85,15 @@ class Settings(BaseSettings):
             if not cleaned:
                 return []
             if cleaned.startswith("["):
-                return value
+                return json.loads(cleaned)
             return [origin.strip() for origin in cleaned.split(",") if origin.strip()]
         return value
 
 
-@lru_cache()
+# Loaded once at import; settings are immutable for the life of the process.
+settings = Settings()
+
+
 def get_settings() -> Settings:
-    """Get cached settings instance."""
-    return Settings()
+    """Get the application settings instance."""
+    return settings
@@ -2,51 +2,68 @@
 FastAPI application entry point.
 """
 import asyncio
-from fastapi import FastAPI
+import json
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 
-from .config import get_settings
+from .config import settings
 from .routers import tailor
+from .utils.health import HealthCheckMiddleware
 from .utils.rate_limit import limiter, rate_limit_handler
 
-settings = get_settings()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if settings.llm_warmup:
+        from .models.cv_facts import CVFacts, ExperienceSection
+        from .models.job_requirements import JobRequirements
+        from .utils.llm_client import warm_up
+
+        await asyncio.to_thread(warm_up, (CVFacts, ExperienceSection, JobRequirements))
+    yield
+
 
 app = FastAPI(
     title=settings.app_name,
     version=settings.app_version,
     description="Intelligent CV tailoring system that customizes CVs for specific job descriptions",
+    lifespan=lifespan,
 )
 
 # Rate limiting
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, rate_limit_handler)
 
-# Configure CORS
+# Health checks are answered before routing. Starlette's CORSMiddleware is
+# already pure ASGI; it is added last so it stays outermost.
 app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.cors_origins,
-    allow_origin_regex=settings.cors_origin_regex,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    HealthCheckMiddleware,
+    payload={
+        "status": "healthy",
+        "app": settings.app_name,
+        "version": settings.app_version,
+    },
 )
 
+# Configure CORS. Same-origin deployments can set both CORS_ORIGINS and
+# CORS_ORIGIN_REGEX to empty to drop the middleware layer entirely.
+if settings.cors_origins or settings.cors_origin_regex:
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=settings.cors_origins,
+        allow_origin_regex=settings.cors_origin_regex or None,
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
 # Include routers
 app.include_router(tailor.router, prefix="/api", tags=["tailor"])
 
 
-@app.get("/health")
-async def health_check():
-    """Health check endpoint."""
-    return {
-        "status": "healthy",
-        "app": settings.app_name,
-        "version": settings.app_version,
-    }
-
-
 @app.get("/debug/pipeline-steps")
 async def debug_pipeline_steps():
     """Debug endpoint — test each Gemini call individually."""
@@ -114,12 +131,24 @@ async def debug_pipeline_steps():
     return results
 
 
+@app.get("/debug/llm-stats")
+async def debug_llm_stats():
+    """Reply cache hit rate, Gemini call latency and concurrency since startup."""
+    from .utils.llm_client import get_llm_client
+
+    return get_llm_client().stats.snapshot()
+
+
+# Settings don't change after startup, so the root payload is serialized once.
+ROOT_BODY = json.dumps({
+    "message": f"Welcome to {settings.app_name}",
+    "version": settings.app_version,
+    "docs_url": "/docs",
+    "health_url": "/health"
+}).encode()
+
+
 @app.get("/")
 async def root():
     """Root endpoint with API info."""
-    return {
-        "message": f"Welcome to {settings.app_name}",
-        "version": settings.app_version,
-        "docs_url": "/docs",
-        "health_url": "/health"
-    }
+    return Response(content=ROOT_BODY, media_type="application/json")
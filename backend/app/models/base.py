@@ -0,0 +1,38 @@
+"""
+Shared base for internal Pydantic models.
+"""
+from functools import partial
+from typing import Annotated
+
+from pydantic import AfterValidator, BaseModel, ConfigDict
+from pydantic.dataclasses import dataclass
+
+
+class DeferredModel(BaseModel):
+    """
+    Base for nested models that are only validated from LLM output.
+
+    The validator is built on first use instead of at import time, which keeps
+    application startup cheap. Top-level request/response models stay on
+    plain BaseModel so they are ready before the first request.
+    """
+
+    model_config = ConfigDict(defer_build=True, extra="ignore")
+
+
+# Leaf records allocated per bullet/evidence/change (often hundreds per
+# request) are slotted, immutable pydantic dataclasses instead of models:
+# no per-instance __dict__ or fields-set bookkeeping. kw_only lets required
+# fields follow optional ones, matching the BaseModel field order.
+leaf_dataclass = partial(
+    dataclass,
+    slots=True,
+    frozen=True,
+    kw_only=True,
+    config=ConfigDict(defer_build=True, extra="ignore"),
+)
+
+
+# Keyword/skill lists behave like sets but their order is meaningful (priority,
+# display order, top-N slicing), so duplicates are dropped order-preservingly.
+UniqueStrList = Annotated[list[str], AfterValidator(lambda v: list(dict.fromkeys(v)))]
@@ -1,16 +1,21 @@
 """
 Pydantic models for extracted CV facts.
 """
-from pydantic import BaseModel, Field
+from pydantic import Field, PrivateAttr, field_validator
 from typing import Literal, Optional
 from datetime import date
 import uuid
+from .base import DeferredModel, UniqueStrList, leaf_dataclass
 
 
-class PersonalInfo(BaseModel):
+# Spellings the LLM uses for a role that hasn't ended
+PRESENT_ALIASES = frozenset({"present", "current", "now", "ongoing", "today"})
+
+
+class PersonalInfo(DeferredModel):
     """Personal/contact information from CV."""
     
-    name: str = Field(..., description="Full name")
+    name: str
     email: Optional[str] = None
     phone: Optional[str] = None
     location: Optional[str] = None
@@ -18,24 +23,26 @@ class PersonalInfo(BaseModel):
     website: Optional[str] = None
 
 
-class ExtractedFacts(BaseModel):
+@leaf_dataclass
+class ExtractedFacts:
     """Facts extracted from a responsibility."""
     
-    action: str = Field(..., description="What they did")
+    action: str  # What they did
     context: Optional[str] = None
     result: Optional[str] = None
     technologies: list[str] = Field(default_factory=list)
     scope: Optional[str] = None
 
 
-class ResponsibilityFact(BaseModel):
+@leaf_dataclass
+class ResponsibilityFact:
     """A responsibility with extracted facts."""
     
-    original_text: str = Field(..., description="Original text from CV")
+    original_text: str  # Original text from CV
     extracted_facts: ExtractedFacts
 
 
-class AchievementMetrics(BaseModel):
+class AchievementMetrics(DeferredModel):
     """Quantified metrics from an achievement."""
     
     type: Literal["percentage", "number", "currency", "time", "other"]
@@ -43,7 +50,8 @@ class AchievementMetrics(BaseModel):
     context: str
 
 
-class Achievement(BaseModel):
+@leaf_dataclass
+class Achievement:
     """An achievement with optional metrics."""
     
     original_text: str
@@ -51,35 +59,42 @@ class Achievement(BaseModel):
     metrics: Optional[AchievementMetrics] = None
 
 
-class Experience(BaseModel):
+class Experience(DeferredModel):
     """A work experience entry."""
     
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=lambda: uuid.uuid4().hex)
     company: str
     title: str
-    start_date: str = Field(..., description="YYYY-MM")
-    end_date: str = Field(..., description="YYYY-MM or 'present'")
+    start_date: str  # YYYY-MM
+    end_date: str  # YYYY-MM or 'present'
     duration_months: Optional[int] = None
     location: Optional[str] = None
     responsibilities: list[ResponsibilityFact] = Field(default_factory=list)
     achievements: list[Achievement] = Field(default_factory=list)
 
+    @field_validator("end_date")
+    @classmethod
+    def normalize_end_date(cls, value: str) -> str:
+        """Canonicalize open-ended dates ('Present', 'current', ...) to 'present'."""
+        value = value.strip()
+        return "present" if value.casefold() in PRESENT_ALIASES else value
 
-class InferredSkill(BaseModel):
+
+class InferredSkill(DeferredModel):
     """A skill inferred from experience."""
     
     skill: str
-    evidence_source: str = Field(..., description="Experience ID")
+    evidence_source: str  # Experience ID
 
 
-class Skills(BaseModel):
+class Skills(DeferredModel):
     """Skills section of CV."""
     
-    explicitly_listed: list[str] = Field(default_factory=list)
+    explicitly_listed: UniqueStrList = Field(default_factory=list)
     inferred_from_experience: list[InferredSkill] = Field(default_factory=list)
 
 
-class Education(BaseModel):
+class Education(DeferredModel):
     """An education entry."""
     
     institution: str
@@ -89,7 +104,7 @@ class Education(BaseModel):
     achievements: list[str] = Field(default_factory=list)
 
 
-class Certification(BaseModel):
+class Certification(DeferredModel):
     """A certification entry."""
     
     name: str
@@ -98,7 +113,7 @@ class Certification(BaseModel):
     status: Literal["completed", "in_progress", "expired"] = "completed"
 
 
-class Project(BaseModel):
+class Project(DeferredModel):
     """A project entry."""
     
     name: str
@@ -108,21 +123,21 @@ class Project(BaseModel):
     outcomes: list[str] = Field(default_factory=list)
 
 
-class Language(BaseModel):
+class Language(DeferredModel):
     """A language proficiency."""
     
     language: str
     proficiency: Optional[str] = None
 
 
-class ProfessionalSummary(BaseModel):
+class ProfessionalSummary(DeferredModel):
     """Professional summary section."""
     
     original_text: Optional[str] = None
     extracted_claims: list[str] = Field(default_factory=list)
 
 
-class CVFacts(BaseModel):
+class CVFacts(DeferredModel):
     """Complete extracted CV facts."""
     
     personal_info: PersonalInfo
@@ -133,3 +148,16 @@ class CVFacts(BaseModel):
     certifications: list[Certification] = Field(default_factory=list)
     projects: list[Project] = Field(default_factory=list)
     languages: list[Language] = Field(default_factory=list)
+
+    # Per-instance memo for lookups derived from the facts above (search
+    # corpus, evidence index, ...). Facts aren't mutated once extraction
+    # post-processing is done, so entries never go stale.
+    _memo: dict = PrivateAttr(default_factory=dict)
+
+
+class ExperienceSection(DeferredModel):
+    """Experience entries extracted on their own from a long CV's experience section."""
+    
+    experience: list[Experience] = Field(default_factory=list)
+    # Skills inferred from these entries; evidence_source is an entry's id
+    inferred_skills: list[InferredSkill] = Field(default_factory=list)
@@ -1,128 +1,73 @@
 """
 Pydantic models for parsed job description data.
 """
-from pydantic import BaseModel, Field
+from pydantic import Field
 from typing import Literal, Optional
-from enum import Enum
+from .base import DeferredModel, UniqueStrList
 
 
-class RequirementCategory(str, Enum):
-    """Categories for job requirements."""
-    TECHNICAL_SKILL = "technical_skill"
-    SOFT_SKILL = "soft_skill"
-    EXPERIENCE = "experience"
-    CERTIFICATION = "certification"
-    EDUCATION = "education"
+# Categories for job requirements
+RequirementCategory = Literal[
+    "technical_skill",
+    "soft_skill",
+    "experience",
+    "certification",
+    "education",
+]
 
 
-class Requirement(BaseModel):
+class Requirement(DeferredModel):
     """A single job requirement."""
     
-    category: RequirementCategory = Field(
-        ...,
-        description="Category of the requirement"
-    )
-    description: str = Field(
-        ...,
-        description="Full description of the requirement"
-    )
-    keywords: list[str] = Field(
-        default_factory=list,
-        description="Keywords associated with this requirement"
-    )
-    years_required: Optional[int] = Field(
-        default=None,
-        description="Years of experience required, if specified"
-    )
-    specificity: Literal["exact", "flexible"] = Field(
-        default="flexible",
-        description="Whether the requirement is exact or flexible"
-    )
+    category: RequirementCategory
+    description: str  # Full description of the requirement
+    keywords: list[str] = Field(default_factory=list)  # Keywords associated with this requirement
+    years_required: Optional[int] = None  # Years of experience required, if specified
+    # Whether the requirement is exact or flexible
+    specificity: Literal["exact", "flexible"] = "flexible"
 
 
-class Responsibility(BaseModel):
+class Responsibility(DeferredModel):
     """A job responsibility with implied skills."""
     
-    description: str = Field(
-        ...,
-        description="Description of the responsibility"
-    )
-    implied_skills: list[str] = Field(
-        default_factory=list,
-        description="Skills implied by this responsibility"
-    )
+    description: str
+    implied_skills: list[str] = Field(default_factory=list)  # Skills implied by this responsibility
 
 
-class ATSKeywords(BaseModel):
+class ATSKeywords(DeferredModel):
     """ATS keywords categorized by priority."""
     
-    high_priority: list[str] = Field(
-        default_factory=list,
-        description="Keywords that appear multiple times or in requirements"
-    )
-    medium_priority: list[str] = Field(
-        default_factory=list,
-        description="Keywords that appear once in key sections"
-    )
-    contextual: list[str] = Field(
-        default_factory=list,
-        description="Industry/role standard terms"
-    )
+    # Keywords that appear multiple times or in requirements
+    high_priority: UniqueStrList = Field(default_factory=list)
+    # Keywords that appear once in key sections
+    medium_priority: UniqueStrList = Field(default_factory=list)
+    contextual: UniqueStrList = Field(default_factory=list)  # Industry/role standard terms
 
 
-class CultureSignals(BaseModel):
+class CultureSignals(DeferredModel):
     """Culture signals extracted from the job description."""
     
-    work_style: list[str] = Field(
-        default_factory=list,
-        description="Work style indicators (e.g., 'fast-paced', 'collaborative')"
-    )
-    values: list[str] = Field(
-        default_factory=list,
-        description="Company values (e.g., 'innovation', 'customer-first')"
-    )
+    # Work style indicators (e.g., 'fast-paced', 'collaborative')
+    work_style: list[str] = Field(default_factory=list)
+    # Company values (e.g., 'innovation', 'customer-first')
+    values: list[str] = Field(default_factory=list)
 
 
-class JobRequirements(BaseModel):
+class JobRequirements(DeferredModel):
     """Complete parsed job requirements."""
     
-    job_title: str = Field(
-        ...,
-        description="The job title"
-    )
-    company: Optional[str] = Field(
-        default=None,
-        description="Company name if mentioned"
-    )
-    department: Optional[str] = Field(
-        default=None,
-        description="Department if mentioned"
-    )
+    job_title: str
+    company: Optional[str] = None  # Company name if mentioned
+    department: Optional[str] = None  # Department if mentioned
     
-    must_have: list[Requirement] = Field(
-        default_factory=list,
-        description="Required qualifications"
-    )
-    nice_to_have: list[Requirement] = Field(
-        default_factory=list,
-        description="Preferred qualifications"
-    )
-    inferred: list[Requirement] = Field(
-        default_factory=list,
-        description="Requirements implied but not explicitly stated"
-    )
+    must_have: list[Requirement] = Field(default_factory=list)  # Required qualifications
+    nice_to_have: list[Requirement] = Field(default_factory=list)  # Preferred qualifications
+    # Requirements implied but not explicitly stated
+    inferred: list[Requirement] = Field(default_factory=list)
     
-    responsibilities: list[Responsibility] = Field(
-        default_factory=list,
-        description="Job responsibilities"
-    )
+    responsibilities: list[Responsibility] = Field(default_factory=list)
     
-    ats_keywords: ATSKeywords = Field(
-        default_factory=ATSKeywords,
-        description="ATS-relevant keywords"
-    )
+    ats_keywords: ATSKeywords = Field(default_factory=ATSKeywords)  # ATS-relevant keywords
     
-    culture_signals: CultureSignals = Field(
-        default_factory=CultureSignals,
-        description="Culture and work environment signals"
-    )
+    # Culture and work environment signals
+    culture_signals: CultureSignals = Field(default_factory=CultureSignals)
@@ -1,116 +1,78 @@
 """
 Pydantic models for requirements-to-evidence mapping.
 """
-from pydantic import BaseModel, Field
+from pydantic import Field
 from typing import Literal, Optional
+from .base import DeferredModel, UniqueStrList, leaf_dataclass
 
 
-class EvidenceItem(BaseModel):
+@leaf_dataclass
+class EvidenceItem:
     """Evidence from CV that supports a requirement."""
     
-    source_type: Literal["experience", "skill", "project", "certification", "education"] = Field(
-        ..., description="Type of source in CV"
-    )
-    source_id: str = Field(..., description="ID of the source item")
-    original_text: str = Field(..., description="Original text from CV")
-    relevance_score: int = Field(
-        ..., ge=0, le=100,
-        description="How relevant this evidence is (0-100)"
-    )
-    match_type: Literal["direct", "transferable", "partial", "learning"] = Field(
-        ..., description="Type of match"
-    )
-
-
-class MitigationOption(BaseModel):
+    source_type: Literal["experience", "skill", "project", "certification", "education"]
+    source_id: str  # ID of the source item
+    original_text: str  # Original text from CV
+    relevance_score: int = Field(..., ge=0, le=100)  # How relevant this evidence is (0-100)
+    match_type: Literal["direct", "transferable", "partial", "learning"]
+
+
+class MitigationOption(DeferredModel):
     """Strategy to mitigate a gap in requirements."""
     
-    strategy: Literal["reframe_existing", "highlight_learning", "show_adjacent", "acknowledge_gap"] = Field(
-        ..., description="Mitigation strategy type"
-    )
-    suggestion: str = Field(..., description="Specific suggestion for addressing the gap")
-    requires_user_confirmation: bool = Field(
-        default=False,
-        description="Whether this needs user confirmation"
-    )
+    strategy: Literal["reframe_existing", "highlight_learning", "show_adjacent", "acknowledge_gap"]
+    suggestion: str  # Specific suggestion for addressing the gap
+    requires_user_confirmation: bool = False  # Whether this needs user confirmation
 
 
-class GapAnalysis(BaseModel):
+class GapAnalysis(DeferredModel):
     """Analysis of a gap between requirement and CV."""
     
-    has_gap: bool = Field(..., description="Whether there is a gap")
-    gap_severity: Literal["critical", "moderate", "minor", "none"] = Field(
-        ..., description="Severity of the gap"
-    )
-    mitigation_options: list[MitigationOption] = Field(
-        default_factory=list,
-        description="Options to mitigate the gap"
-    )
+    has_gap: bool
+    gap_severity: Literal["critical", "moderate", "minor", "none"]
+    mitigation_options: list[MitigationOption] = Field(default_factory=list)
 
 
-class RequirementRef(BaseModel):
+class RequirementRef(DeferredModel):
     """Reference to a job requirement."""
     
-    text: str = Field(..., description="Requirement text")
-    priority: Literal["must_have", "nice_to_have", "inferred"] = Field(
-        ..., description="Priority level"
-    )
-    category: str = Field(..., description="Requirement category")
+    text: str
+    priority: Literal["must_have", "nice_to_have", "inferred"]
+    category: str
 
 
-class MappingEntry(BaseModel):
+class MappingEntry(DeferredModel):
     """A single mapping between requirement and evidence."""
     
-    requirement: RequirementRef = Field(..., description="The requirement")
-    evidence: list[EvidenceItem] = Field(
-        default_factory=list,
-        description="Evidence supporting this requirement"
-    )
-    gap_analysis: GapAnalysis = Field(..., description="Gap analysis for this requirement")
+    requirement: RequirementRef
+    evidence: list[EvidenceItem] = Field(default_factory=list)
+    gap_analysis: GapAnalysis
 
 
-class OverallMatch(BaseModel):
+class OverallMatch(DeferredModel):
     """Overall match statistics."""
     
-    score: int = Field(..., ge=0, le=100, description="Overall match score")
-    must_have_coverage: str = Field(..., description="X/Y format coverage")
-    nice_to_have_coverage: str = Field(..., description="X/Y format coverage")
-    strongest_matches: list[str] = Field(
-        default_factory=list,
-        description="Best matching areas"
-    )
-    critical_gaps: list[str] = Field(
-        default_factory=list,
-        description="Critical missing requirements"
-    )
-
-
-class KeywordCoverage(BaseModel):
+    score: int = Field(..., ge=0, le=100)
+    must_have_coverage: str  # X/Y format coverage
+    nice_to_have_coverage: str  # X/Y format coverage
+    strongest_matches: list[str] = Field(default_factory=list)  # Best matching areas
+    critical_gaps: list[str] = Field(default_factory=list)  # Critical missing requirements
+
+
+class KeywordCoverage(DeferredModel):
     """ATS keyword coverage analysis."""
     
-    present_in_cv: list[str] = Field(
-        default_factory=list,
-        description="Keywords already in CV"
-    )
-    missing_but_addressable: list[str] = Field(
-        default_factory=list,
-        description="Keywords that can be added based on real experience"
-    )
-    genuinely_missing: list[str] = Field(
-        default_factory=list,
-        description="Keywords that cannot be ethically added"
-    )
-
-
-class MappingResult(BaseModel):
+    present_in_cv: UniqueStrList = Field(default_factory=list)  # Keywords already in CV
+    # Keywords that can be added based on real experience
+    missing_but_addressable: UniqueStrList = Field(default_factory=list)
+    # Keywords that cannot be ethically added
+    genuinely_missing: UniqueStrList = Field(default_factory=list)
+
+
+class MappingResult(DeferredModel):
     """Complete mapping result."""
     
-    mapping_table: list[MappingEntry] = Field(
-        default_factory=list,
-        description="All requirement-evidence mappings"
-    )
-    overall_match: OverallMatch = Field(..., description="Overall match statistics")
-    keyword_coverage: KeywordCoverage = Field(
-        default_factory=KeywordCoverage,
-        description="Keyword coverage analysis"
-    )
+    # All requirement-evidence mappings
+    mapping_table: list[MappingEntry] = Field(default_factory=list)
+    overall_match: OverallMatch
+    keyword_coverage: KeywordCoverage = Field(default_factory=KeywordCoverage)
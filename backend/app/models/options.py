@@ -3,6 +3,7 @@ Pydantic models for tailoring options and request/response structures.
 """
 from pydantic import BaseModel, Field
 from typing import Literal, Optional
+from dataclasses import dataclass
 
 
 class TailorOptions(BaseModel):
@@ -50,6 +51,17 @@ class TailorRequest(BaseModel):
     )
 
 
+class TailorBatchRequest(BaseModel):
+    """Request model for tailoring several CV/job pairs in one call."""
+    
+    requests: list[TailorRequest] = Field(
+        ...,
+        min_length=1,
+        max_length=10,
+        description="Independent tailoring requests, processed concurrently"
+    )
+
+
 class ExtractJobRequest(BaseModel):
     """Request model for extracting job requirements."""
 
@@ -80,8 +92,9 @@ class ApiKeyRequest(BaseModel):
     )
 
 
-class StrictnessConfig(BaseModel):
-    """Configuration for each strictness level."""
+@dataclass(slots=True, frozen=True)
+class StrictnessConfig:
+    """Configuration for each strictness level (read-only lookup table entry)."""
     
     allow_inferred_skills: bool
     allow_reframing: Literal["minimal", "with_same_facts", "extensive"]
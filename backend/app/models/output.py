@@ -3,177 +3,156 @@ Pydantic models for tailored CV output.
 """
 from pydantic import BaseModel, Field
 from typing import Literal, Optional
+from functools import cached_property
+from .base import DeferredModel, UniqueStrList, leaf_dataclass
 
 
-class TailoredHeader(BaseModel):
+class ContactInfo(DeferredModel):
+    """Contact details shown in the CV header."""
+    
+    email: Optional[str] = None
+    phone: Optional[str] = None
+    location: Optional[str] = None
+    linkedin: Optional[str] = None
+    website: Optional[str] = None
+
+
+class TailoredHeader(DeferredModel):
     """Tailored header section."""
     
-    name: str = Field(..., description="Full name")
-    title: str = Field(..., description="Professional title aligned to job")
-    contact: dict = Field(default_factory=dict, description="Contact information")
+    name: str
+    title: str  # Professional title aligned to job
+    contact: ContactInfo = Field(default_factory=ContactInfo)
 
 
-class TailoredExperienceBullet(BaseModel):
+@leaf_dataclass
+class TailoredExperienceBullet:
     """A single experience bullet point."""
     
-    text: str = Field(..., description="The bullet text")
-    keywords_used: list[str] = Field(
-        default_factory=list,
-        description="Keywords integrated in this bullet"
-    )
+    text: str
+    keywords_used: UniqueStrList = Field(default_factory=list)  # Keywords integrated in this bullet
 
 
-class TailoredExperience(BaseModel):
+class TailoredExperience(DeferredModel):
     """A tailored experience entry."""
     
-    company: str = Field(..., description="Company name")
-    title: str = Field(..., description="Job title")
-    dates: str = Field(..., description="Date range")
-    location: Optional[str] = Field(default=None, description="Location")
-    bullets: list[TailoredExperienceBullet] = Field(
-        default_factory=list,
-        description="Experience bullets"
-    )
+    company: str
+    title: str
+    dates: str  # Date range
+    location: Optional[str] = None
+    bullets: list[TailoredExperienceBullet] = Field(default_factory=list)
 
 
-class TailoredSkills(BaseModel):
+class TailoredSkills(DeferredModel):
     """Tailored skills section."""
     
-    primary: list[str] = Field(
-        default_factory=list,
-        description="Primary skills (most relevant to job)"
-    )
-    secondary: list[str] = Field(
-        default_factory=list,
-        description="Secondary skills"
-    )
-    tools: list[str] = Field(
-        default_factory=list,
-        description="Tools and technologies"
-    )
+    primary: UniqueStrList = Field(default_factory=list)  # Primary skills (most relevant to job)
+    secondary: UniqueStrList = Field(default_factory=list)
+    tools: UniqueStrList = Field(default_factory=list)
 
 
-class TailoredEducation(BaseModel):
+class TailoredEducation(DeferredModel):
     """A tailored education entry."""
     
-    institution: str = Field(..., description="School name")
-    degree: str = Field(..., description="Degree")
-    field: str = Field(..., description="Field of study")
-    year: Optional[str] = Field(default=None, description="Graduation year")
-    highlights: list[str] = Field(
-        default_factory=list,
-        description="Relevant highlights"
-    )
+    institution: str  # School name
+    degree: str
+    field: str  # Field of study
+    year: Optional[str] = None  # Graduation year
+    highlights: list[str] = Field(default_factory=list)
 
 
-class TailoredCertification(BaseModel):
+class TailoredCertification(DeferredModel):
     """A tailored certification entry."""
     
-    name: str = Field(..., description="Certification name")
-    issuer: str = Field(..., description="Issuer")
-    date: Optional[str] = Field(default=None, description="Date")
+    name: str
+    issuer: str
+    date: Optional[str] = None
 
 
-class TailoredProject(BaseModel):
+class TailoredProject(DeferredModel):
     """A tailored project entry."""
     
-    name: str = Field(..., description="Project name")
-    description: str = Field(..., description="Tailored description")
-    technologies: list[str] = Field(
-        default_factory=list,
-        description="Technologies used"
-    )
+    name: str
+    description: str  # Tailored description
+    technologies: list[str] = Field(default_factory=list)
 
 
-class TailoredCV(BaseModel):
+class TailoredCV(DeferredModel):
     """Complete tailored CV."""
     
-    header: TailoredHeader = Field(..., description="Header section")
-    summary: str = Field(..., description="Professional summary")
-    experience: list[TailoredExperience] = Field(
-        default_factory=list,
-        description="Experience section"
-    )
-    skills: TailoredSkills = Field(
-        default_factory=TailoredSkills,
-        description="Skills section"
-    )
-    education: list[TailoredEducation] = Field(
-        default_factory=list,
-        description="Education section"
-    )
-    certifications: list[TailoredCertification] = Field(
-        default_factory=list,
-        description="Certifications"
-    )
-    projects: list[TailoredProject] = Field(
-        default_factory=list,
-        description="Projects section"
-    )
+    header: TailoredHeader
+    summary: str
+    experience: list[TailoredExperience] = Field(default_factory=list)
+    skills: TailoredSkills = Field(default_factory=TailoredSkills)
+    education: list[TailoredEducation] = Field(default_factory=list)
+    certifications: list[TailoredCertification] = Field(default_factory=list)
+    projects: list[TailoredProject] = Field(default_factory=list)
 
 
-class ChangeLogEntry(BaseModel):
+@leaf_dataclass
+class ChangeLogEntry:
     """A single change made during tailoring."""
     
-    section: str = Field(..., description="Section where change occurred")
-    change_type: Literal["reorder", "rewrite", "add_keyword", "quantify", "remove"] = Field(
-        ..., description="Type of change"
-    )
-    original: Optional[str] = Field(default=None, description="Original content")
-    new: str = Field(..., description="New content")
-    justification: str = Field(..., description="Why this change was made")
-    confidence: Literal["high", "medium", "low"] = Field(
-        ..., description="Confidence in this change"
-    )
-    requires_review: bool = Field(
-        default=False,
-        description="Whether user should review this"
-    )
+    section: str  # Section where change occurred
+    change_type: Literal["reorder", "rewrite", "add_keyword", "quantify", "remove"]
+    original: Optional[str] = None
+    new: str
+    justification: str  # Why this change was made
+    confidence: Literal["high", "medium", "low"]  # Confidence in this change
+    requires_review: bool = False  # Whether user should review this
 
 
-class BorderlineItem(BaseModel):
+class BorderlineItem(DeferredModel):
     """An item that needs user review."""
     
-    content: str = Field(..., description="The content in question")
-    category: Literal["inferred_but_reasonable", "reframed_significantly", "gap_mitigation"] = Field(
-        ..., description="Category of borderline content"
-    )
-    original_evidence: str = Field(..., description="What this is based on")
-    risk_level: Literal["low", "medium", "high"] = Field(
-        ..., description="Risk level"
-    )
-    user_prompt: str = Field(..., description="Question for user confirmation")
+    content: str  # The content in question
+    category: Literal["inferred_but_reasonable", "reframed_significantly", "gap_mitigation"]
+    original_evidence: str  # What this is based on
+    risk_level: Literal["low", "medium", "high"]
+    user_prompt: str  # Question for user confirmation
 
 
-class CoverLetter(BaseModel):
+class CoverLetter(DeferredModel):
     """Generated cover letter."""
     
-    hook: str = Field(..., description="Opening paragraph")
-    value_proposition: str = Field(..., description="Main body paragraph")
-    fit_narrative: str = Field(..., description="Why you're a good fit")
-    closing: str = Field(..., description="Closing paragraph")
+    hook: str  # Opening paragraph
+    value_proposition: str  # Main body paragraph
+    fit_narrative: str  # Why you're a good fit
+    closing: str  # Closing paragraph
     
-    @property
+    @cached_property
     def full_text(self) -> str:
-        """Get the complete cover letter text."""
+        """Get the complete cover letter text (computed once per instance)."""
         return f"{self.hook}\n\n{self.value_proposition}\n\n{self.fit_narrative}\n\n{self.closing}"
 
 
-class MatchScoreBreakdown(BaseModel):
+class MatchScoreBreakdown(DeferredModel):
     """Breakdown of the match score calculation."""
     
-    must_have_component: float = Field(..., description="Score from must-have matches")
-    nice_to_have_component: float = Field(..., description="Score from nice-to-have matches")
-    bonuses: list[str] = Field(default_factory=list, description="Score bonuses applied")
-    penalties: list[str] = Field(default_factory=list, description="Score penalties applied")
+    must_have_component: float  # Score from must-have matches
+    nice_to_have_component: float  # Score from nice-to-have matches
+    bonuses: list[str] = Field(default_factory=list)  # Score bonuses applied
+    penalties: list[str] = Field(default_factory=list)  # Score penalties applied
 
 
-class MatchScore(BaseModel):
+class MatchScore(DeferredModel):
     """Match score with explanation."""
     
-    score: int = Field(..., ge=0, le=100, description="Final score")
-    breakdown: MatchScoreBreakdown = Field(..., description="Score breakdown")
-    explanation: str = Field(..., description="Human-readable explanation")
+    score: int = Field(..., ge=0, le=100)
+    breakdown: MatchScoreBreakdown
+    explanation: str  # Human-readable explanation
+
+
+class MappingSummary(DeferredModel):
+    """Condensed mapping statistics returned alongside the tailored CV."""
+    
+    overall_score: int
+    must_have_coverage: str = "0/0"  # X/Y format coverage
+    nice_to_have_coverage: str = "0/0"  # X/Y format coverage
+    strongest_matches: list[str] = Field(default_factory=list)
+    critical_gaps: list[str] = Field(default_factory=list)
+    keywords_present: list[str] = Field(default_factory=list)
+    keywords_missing: list[str] = Field(default_factory=list)
 
 
 class TailorResult(BaseModel):
@@ -195,7 +174,28 @@ class TailorResult(BaseModel):
     match_score: MatchScore = Field(..., description="Match score")
     
     # Include analysis data
-    mapping_summary: Optional[dict] = Field(
+    mapping_summary: Optional[MappingSummary] = Field(
         default=None,
         description="Summary of requirement-evidence mapping"
     )
+
+
+class BatchItemError(BaseModel):
+    """Error for a single failed item in a batch."""
+    
+    error: str = Field(..., description="Error type, as in single-request error details")
+    message: str = Field(..., description="Human-readable error message")
+    details: list = Field(default_factory=list, description="Additional error details")
+
+
+class TailorBatchItem(BaseModel):
+    """Outcome of one request in a batch: either a result or an error."""
+    
+    result: Optional[TailorResult] = Field(default=None, description="Tailoring result")
+    error: Optional[BatchItemError] = Field(default=None, description="Set if this item failed")
+
+
+class TailorBatchResult(BaseModel):
+    """Batch tailoring results, in request order."""
+    
+    items: list[TailorBatchItem] = Field(default_factory=list, description="One entry per request")
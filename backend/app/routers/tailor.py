@@ -4,36 +4,48 @@ API endpoints for CV tailoring.
 from fastapi import APIRouter, HTTPException, UploadFile, File, Form, Response, Request
 from fastapi.responses import StreamingResponse
 from typing import Optional, AsyncGenerator
+import asyncio
 import json
 import logging
-from pydantic import ValidationError
+import os
+from pydantic import BaseModel, ValidationError
 
-from ..config import get_settings
+from ..config import settings
 from ..models.options import (
     TailorRequest,
+    TailorBatchRequest,
     TailorOptions,
     ExtractJobRequest,
     ExtractCVRequest,
     ApiKeyRequest,
 )
-from ..models.output import TailorResult
+from ..models.output import TailorResult, TailorBatchResult
 from ..models.job_requirements import JobRequirements
 from ..models.cv_facts import CVFacts
 
 from ..services.job_extractor import extract_job_requirements
 from ..services.cv_extractor import extract_cv_facts
-from ..services.tailoring_pipeline import run_tailoring_pipeline, TailoringError
+from ..services.tailoring_pipeline import run_tailoring_pipeline, run_tailoring_batch, TailoringError
 
+from ..utils.cache import LRUCache, content_key, stream_key
 from ..utils.document_parser import extract_text, clean_extracted_text
-from ..utils.exporters import generate_markdown, generate_docx, generate_pdf
+from ..utils.exporters import generate_markdown, generate_docx, generate_pdf, iter_chunks
 from ..utils.llm_client import set_llm_api_key
 from ..utils.rate_limit import limiter
 
 logger = logging.getLogger(__name__)
-settings = get_settings()
 
 router = APIRouter()
 
+# Re-uploads of the same CV file reuse its parsed text
+_upload_cache: LRUCache[str] = LRUCache(
+    settings.extraction_cache_size, settings.extraction_cache_ttl_seconds
+)
+# Downloading the same result again (or after a re-render) reuses its bytes
+_export_cache: LRUCache[bytes] = LRUCache(
+    settings.export_cache_size, settings.extraction_cache_ttl_seconds
+)
+
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -53,11 +65,63 @@ def _validate_file(filename: Optional[str]) -> None:
         )
 
 
+def _upload_key(cv_file: UploadFile) -> str:
+    """Cache key for an upload: a hash of its bytes and file extension (blocking)."""
+    cv_file.file.seek(0)
+    extension = os.path.splitext(cv_file.filename or "upload.txt")[1].lower()
+    return stream_key(cv_file.file, extension)
+
+
+def _extract_and_clean(cv_file: UploadFile) -> str:
+    """Parse an uploaded CV straight from its spooled temp file (blocking)."""
+    cv_file.file.seek(0)
+    return clean_extracted_text(extract_text(cv_file.file, cv_file.filename or "upload.txt"))
+
+
+async def _read_upload(cv_file: UploadFile) -> str:
+    """Extract text from an upload on a worker thread.
+
+    Starlette already spools uploads to a temp file, so the parsers read from
+    that rather than a second in-memory copy, and the CPU-bound PDF/DOCX
+    parsing doesn't block other requests on the event loop. The file is
+    closed straight after, releasing its buffer for the rest of the pipeline
+    rather than when the response finishes. Files seen before (by content
+    hash) skip parsing.
+    """
+    try:
+        key = await asyncio.to_thread(_upload_key, cv_file)
+        text = _upload_cache.get(key)
+        if text is None:
+            text = await asyncio.to_thread(_extract_and_clean, cv_file)
+            _upload_cache.set(key, text)
+        return text
+    finally:
+        await cv_file.close()
+
+
 def _sse(data: dict) -> str:
     """Format a dict as an SSE data line."""
     return f"data: {json.dumps(data)}\n\n"
 
 
+def _sse_result(result: TailorResult) -> str:
+    """Format the final pipeline result as an SSE data line.
+
+    The result is serialized by pydantic-core straight to JSON rather than
+    through model_dump() + json.dumps, which walks the whole tree in Python.
+    """
+    return f'data: {{"complete": true, "result": {result.model_dump_json()}}}\n\n'
+
+
+def _json_response(result: BaseModel) -> Response:
+    """Return a result model serialized in one pydantic-core pass.
+
+    Returning a Response makes FastAPI skip its response_model validate and
+    serialize steps; response_model is still declared for the OpenAPI docs.
+    """
+    return Response(content=result.model_dump_json(), media_type="application/json")
+
+
 def _sse_headers() -> dict:
     """Standard SSE response headers."""
     return {
@@ -80,7 +144,7 @@ async def tailor_cv(request: Request, tailor_request: TailorRequest):
     Runs the full pipeline and returns the result synchronously.
     """
     try:
-        return await run_tailoring_pipeline(tailor_request)
+        return _json_response(await run_tailoring_pipeline(tailor_request))
     except TailoringError as e:
         raise HTTPException(
             status_code=400,
@@ -94,6 +158,19 @@ async def tailor_cv(request: Request, tailor_request: TailorRequest):
         )
 
 
+@router.post("/tailor/batch", response_model=TailorBatchResult)
+@limiter.limit("2/minute")
+async def tailor_cv_batch(request: Request, batch_request: TailorBatchRequest):
+    """
+    Tailor several CV/job pairs in one call.
+
+    Items run concurrently; a failed item carries its error instead of a
+    result and doesn't fail the rest of the batch.
+    """
+    items = await run_tailoring_batch(batch_request.requests)
+    return _json_response(TailorBatchResult.model_construct(items=items))
+
+
 @router.post("/tailor/stream")
 @limiter.limit("10/minute")
 async def tailor_cv_stream(request: Request, tailor_request: TailorRequest):
@@ -112,7 +189,7 @@ async def tailor_cv_stream(request: Request, tailor_request: TailorRequest):
             # Yield collected progress events, then final result
             for evt in events:
                 yield evt
-            yield _sse({"complete": True, "result": result.model_dump()})
+            yield _sse_result(result)
 
         except TailoringError as e:
             yield _sse({"error": True, "message": e.message, "details": e.details})
@@ -147,8 +224,7 @@ async def tailor_cv_with_upload_stream(
         try:
             # Read file
             yield _sse({"step": 0, "total": 7, "message": "Reading uploaded CV file..."})
-            content = await cv_file.read()
-            cv_text = clean_extracted_text(extract_text(content, cv_file.filename or "upload.txt"))
+            cv_text = await _read_upload(cv_file)
 
             options = TailorOptions(
                 generate_cover_letter=generate_cover_letter,
@@ -172,7 +248,7 @@ async def tailor_cv_with_upload_stream(
 
             for evt in events:
                 yield evt
-            yield _sse({"complete": True, "result": result.model_dump()})
+            yield _sse_result(result)
 
         except ValidationError as e:
             yield _sse({"error": True, "message": "Invalid options", "details": e.errors()})
@@ -189,7 +265,7 @@ async def tailor_cv_with_upload_stream(
     )
 
 
-@router.post("/tailor/upload")
+@router.post("/tailor/upload", response_model=TailorResult)
 @limiter.limit("10/minute")
 async def tailor_cv_with_upload(
     request: Request,
@@ -206,8 +282,7 @@ async def tailor_cv_with_upload(
     _validate_file(cv_file.filename)
 
     try:
-        content = await cv_file.read()
-        cv_text = clean_extracted_text(extract_text(content, cv_file.filename or "upload.txt"))
+        cv_text = await _read_upload(cv_file)
     except Exception as e:
         raise HTTPException(
             status_code=400,
@@ -233,7 +308,7 @@ async def tailor_cv_with_upload(
         options=options,
     )
 
-    return await run_tailoring_pipeline(tailor_req)
+    return _json_response(await run_tailoring_pipeline(tailor_req))
 
 
 @router.post("/extract-job", response_model=JobRequirements)
@@ -286,11 +361,26 @@ async def export_result(
 
     try:
         gen_fn, media_type, filename = exporters[format]
-        content = gen_fn(result.tailored_cv, result.cover_letter)
-        return Response(
-            content=content,
+        cache_key = content_key(
+            format,
+            result.tailored_cv.model_dump_json(),
+            result.cover_letter.model_dump_json() if result.cover_letter else "",
+        )
+        content = _export_cache.get(cache_key)
+        if content is None:
+            # Rendering is synchronous and CPU-bound; keep it off the event loop
+            content = await asyncio.to_thread(gen_fn, result.tailored_cv, result.cover_letter)
+            if isinstance(content, str):
+                content = content.encode("utf-8")
+            _export_cache.set(cache_key, content)
+        # Send in chunks so the first bytes go out without one big write
+        return StreamingResponse(
+            iter_chunks(content),
             media_type=media_type,
-            headers={"Content-Disposition": f"attachment; filename={filename}"},
+            headers={
+                "Content-Disposition": f"attachment; filename={filename}",
+                "Content-Length": str(len(content)),
+            },
         )
     except Exception as e:
         logger.exception(f"Failed to export as {format}")
@@ -3,18 +3,67 @@ Module 6: Cover Letter Generator
 
 Generates a compelling cover letter that complements the tailored CV.
 """
+from dataclasses import dataclass
 from typing import Optional
 from ..models.job_requirements import JobRequirements
 from ..models.cv_facts import CVFacts
 from ..models.mapping import MappingResult
 from ..models.output import CoverLetter
 from ..models.options import StrictnessConfig, STRICTNESS_CONFIGS
-from ..utils.llm_client import get_llm_client
+from ..utils.llm_client import extract_json_object, get_llm_client
 from .cv_extractor import get_total_experience_years
 import logging
+import re
 
 logger = logging.getLogger(__name__)
 
+# Culture-signal words that set the letter's tone (substring matches)
+_ENERGETIC_TONE_RE = re.compile(r"startup|dynamic", re.IGNORECASE)
+_FORMAL_TONE_RE = re.compile(r"formal|traditional", re.IGNORECASE)
+
+
+def _as_text(value) -> str:
+    """Use an LLM-supplied paragraph if it's a string, else an empty one."""
+    return value if isinstance(value, str) else ""
+
+
+@dataclass(slots=True, frozen=True)
+class _CandidateFacts:
+    """CV-derived inputs shared by the LLM and template cover letters."""
+    
+    name: str
+    current_title: str
+    years: float
+    key_achievements: tuple[str, ...]  # Quantified, from the two latest roles
+
+
+def _candidate_facts(cv_facts: CVFacts) -> _CandidateFacts:
+    """Gather the candidate facts once per CVFacts instance."""
+    facts = cv_facts._memo.get("cover_letter_facts")
+    if facts is not None:
+        return facts
+    
+    current_title = ""
+    key_achievements = []
+    
+    if cv_facts.experience:
+        current_title = cv_facts.experience[0].title
+        
+        for exp in cv_facts.experience[:2]:
+            for ach in exp.achievements:
+                if ach.quantified:
+                    key_achievements.append(ach.original_text)
+            if len(key_achievements) >= 3:
+                break
+    
+    facts = cv_facts._memo["cover_letter_facts"] = _CandidateFacts(
+        name=cv_facts.personal_info.name,
+        current_title=current_title,
+        years=get_total_experience_years(cv_facts),
+        key_achievements=tuple(key_achievements),
+    )
+    return facts
+
 
 COVER_LETTER_PROMPT = """
 Write a compelling cover letter for this job application.
@@ -112,29 +161,18 @@ async def generate_cover_letter(
     client = get_llm_client()
     
     # Gather data for cover letter
-    current_title = ""
-    key_achievements = []
-    
-    if cv_facts.experience:
-        current_title = cv_facts.experience[0].title
-        
-        for exp in cv_facts.experience[:2]:
-            for ach in exp.achievements:
-                if ach.quantified:
-                    key_achievements.append(ach.original_text)
-            if len(key_achievements) >= 3:
-                break
+    candidate = _candidate_facts(cv_facts)
     
     # Get relevant skills
     relevant_skills = mapping.keyword_coverage.present_in_cv[:5]
     
     # Determine tone from culture signals
     tone = "professional"
-    if requirements.culture_signals.work_style:
-        if any("startup" in w.lower() or "dynamic" in w.lower() for w in requirements.culture_signals.work_style):
-            tone = "energetic and dynamic"
-        elif any("formal" in w.lower() or "traditional" in w.lower() for w in requirements.culture_signals.work_style):
-            tone = "formal and traditional"
+    work_style = " ".join(requirements.culture_signals.work_style)
+    if _ENERGETIC_TONE_RE.search(work_style):
+        tone = "energetic and dynamic"
+    elif _FORMAL_TONE_RE.search(work_style):
+        tone = "formal and traditional"
     
     # Format requirements
     req_text = "; ".join([r.description for r in requirements.must_have[:5]])
@@ -160,11 +198,11 @@ async def generate_cover_letter(
         company=requirements.company or "the company",
         requirements=req_text,
         culture=culture_text,
-        name=cv_facts.personal_info.name,
-        current_title=current_title,
-        years=f"{get_total_experience_years(cv_facts):.1f}",
+        name=candidate.name,
+        current_title=candidate.current_title,
+        years=f"{candidate.years:.1f}",
         skills=", ".join(relevant_skills) or "Various relevant skills",
-        achievements="; ".join(key_achievements) if key_achievements else "Various accomplishments",
+        achievements="; ".join(candidate.key_achievements) or "Various accomplishments",
         match_score=mapping.overall_match.score,
         strongest=", ".join(mapping.overall_match.strongest_matches[:3]) if mapping.overall_match.strongest_matches else "Multiple areas",
         gaps=gaps_text or "No critical gaps",
@@ -181,17 +219,14 @@ async def generate_cover_letter(
         response = await client.generate_text(prompt)
         
         # Parse JSON response
-        import json
-        if "{" in response:
-            start = response.index("{")
-            end = response.rindex("}") + 1
-            data = json.loads(response[start:end])
-            
-            return CoverLetter(
-                hook=data.get("hook", ""),
-                value_proposition=data.get("value_proposition", ""),
-                fit_narrative=data.get("fit_narrative", ""),
-                closing=data.get("closing", "")
+        data = extract_json_object(response)
+        if data is not None:
+            # Every field is a plain string, so coerce here and skip validation
+            return CoverLetter.model_construct(
+                hook=_as_text(data.get("hook")),
+                value_proposition=_as_text(data.get("value_proposition")),
+                fit_narrative=_as_text(data.get("fit_narrative")),
+                closing=_as_text(data.get("closing"))
             )
     
     except Exception as e:
@@ -200,13 +235,13 @@ async def generate_cover_letter(
     
     # Fallback to basic generation
     return await _generate_basic_cover_letter(
-        requirements, cv_facts, mapping, user_instructions
+        requirements, candidate, mapping, user_instructions
     )
 
 
 async def _generate_basic_cover_letter(
     requirements: JobRequirements,
-    cv_facts: CVFacts,
+    candidate: _CandidateFacts,
     mapping: MappingResult,
     user_instructions: Optional[str] = None
 ) -> CoverLetter:
@@ -216,14 +251,10 @@ async def _generate_basic_cover_letter(
     User notes have limited effect here since no LLM is used.
     """
     
-    name = cv_facts.personal_info.name
     job_title = requirements.job_title
     company = requirements.company or "your organization"
-    years = get_total_experience_years(cv_facts)
-    
-    current_title = ""
-    if cv_facts.experience:
-        current_title = cv_facts.experience[0].title
+    years = candidate.years
+    current_title = candidate.current_title
     
     hook = (
         f"I am writing to express my strong interest in the {job_title} position at {company}. "
@@ -232,11 +263,7 @@ async def _generate_basic_cover_letter(
     )
     
     # Build value proposition from achievements
-    achievements = []
-    for exp in cv_facts.experience[:2]:
-        for ach in exp.achievements:
-            if ach.quantified:
-                achievements.append(ach.original_text)
+    achievements = candidate.key_achievements
     
     if achievements:
         value_proposition = (
@@ -267,7 +294,7 @@ async def _generate_basic_cover_letter(
         f"contribute to your team's success. Thank you for considering my application."
     )
     
-    return CoverLetter(
+    return CoverLetter.model_construct(
         hook=hook,
         value_proposition=value_proposition,
         fit_narrative=fit_narrative,
@@ -8,31 +8,92 @@ from ..models.cv_facts import (
     CVFacts, PersonalInfo, ProfessionalSummary,
     Experience, ResponsibilityFact, ExtractedFacts,
     Achievement, AchievementMetrics, Skills, InferredSkill,
-    Education, Certification, Project, Language,
+    Education, Certification, Project, Language, ExperienceSection,
+    PRESENT_ALIASES,
 )
+from ..config import settings
+from ..utils.cache import LRUCache, content_key
+from ..utils.concurrency import gather_or_cancel
 from ..utils.llm_client import get_llm_client
+from datetime import datetime
+import re
+from typing import Iterable, NamedTuple
 import logging
 
 logger = logging.getLogger(__name__)
 
+# The same CV is commonly tailored to many jobs; skip re-extracting it.
+_cv_cache: LRUCache[CVFacts] = LRUCache(
+    settings.extraction_cache_size, settings.extraction_cache_ttl_seconds
+)
+
 CV_EXTRACTION_PROMPT = """Extract ALL verifiable facts from this CV as structured JSON.
 Rules: Preserve exact wording. Use YYYY-MM dates. Mark inferred skills with evidence link.
 
 CV:
 {cv_text}"""
 
+CV_EXPERIENCE_PROMPT = """Extract EVERY work experience entry from this CV section as structured JSON.
+Rules: Preserve exact wording. Use YYYY-MM dates. Give each entry a unique id and link each inferred skill to the id of the entry it comes from.
+
+CV section:
+{cv_text}"""
+
+# Common CV section headings, by the section they start
+_SECTION_HEADINGS = {
+    "experience": (
+        "experience", "work experience", "professional experience", "employment",
+        "employment history", "work history", "career history",
+    ),
+    "education": ("education", "academic background"),
+    "skills": ("skills", "technical skills", "core competencies"),
+    "projects": ("projects", "personal projects"),
+    "certifications": ("certifications", "certificates", "licenses & certifications"),
+    "summary": ("summary", "professional summary", "profile", "objective", "about me"),
+    "languages": ("languages",),
+    "other": ("awards", "publications", "volunteer", "volunteering", "interests", "references"),
+}
+_HEADING_SECTION = {
+    heading: section for section, headings in _SECTION_HEADINGS.items() for heading in headings
+}
+# A heading is a line holding only a known title (optionally markdown '#' or a trailing ':')
+_HEADING_RE = re.compile(
+    r"^[ \t]*(?:#{1,6}[ \t]*)?("
+    + "|".join(re.escape(h) for h in sorted(_HEADING_SECTION, key=len, reverse=True))
+    + r")[ \t]*:?[ \t]*$",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+
+async def extract_cv_facts(cv_text: str, use_cache: bool = True) -> CVFacts:
+    """Extract verifiable facts from a CV.
+
+    Results are cached by content hash; callers get their own deep copy so
+    later post-processing can't leak into the cache.
+    """
+    cache_key = content_key(cv_text.strip())
+    if use_cache:
+        cached = _cv_cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"CV facts cache hit for '{cached.personal_info.name}'")
+            return cached.model_copy(deep=True)
 
-async def extract_cv_facts(cv_text: str) -> CVFacts:
-    """Extract verifiable facts from a CV."""
     client = get_llm_client()
 
-    prompt = CV_EXTRACTION_PROMPT.format(cv_text=cv_text)
+    sections = {}
+    min_chars = settings.cv_section_extraction_min_chars
+    if 0 < min_chars <= len(cv_text):
+        sections = _split_cv_sections(cv_text)
+    experience_text = sections.pop("experience", "")
 
     try:
-        result = await client.generate_structured(
-            prompt=prompt,
-            response_model=CVFacts,
-        )
+        if experience_text and any(sections.values()):
+            result = await _extract_by_section(client, experience_text, "\n\n".join(sections.values()))
+        else:
+            result = await client.generate_structured(
+                prompt=CV_EXTRACTION_PROMPT.format(cv_text=cv_text),
+                response_model=CVFacts,
+            )
 
         # Post-process: calculate durations if missing
         for exp in result.experience:
@@ -46,7 +107,11 @@ async def extract_cv_facts(cv_text: str) -> CVFacts:
             if skill.evidence_source in valid_exp_ids
         ]
 
+        # Durations are final now; compute the total once for every consumer
+        get_total_experience_years(result)
+
         logger.info(f"Extracted CV facts for '{result.personal_info.name}'")
+        _cv_cache.set(cache_key, result.model_copy(deep=True))
         return result
 
     except Exception as e:
@@ -54,19 +119,209 @@ async def extract_cv_facts(cv_text: str) -> CVFacts:
         raise
 
 
-def _calculate_duration(start_date: str, end_date: str) -> int:
-    """Calculate duration in months between two dates."""
-    from dateutil.relativedelta import relativedelta
-    from dateutil.parser import parse as parse_date
-    from datetime import datetime
+def _split_cv_sections(cv_text: str) -> dict[str, str]:
+    """
+    Split a CV into blocks at common section headings.
+
+    Each block keeps its heading line. Text before the first heading is
+    returned under "header", and repeated sections are joined together.
+    Sections appear in the order they first occur in the CV.
+    """
+    matches = list(_HEADING_RE.finditer(cv_text))
+    header = cv_text[:matches[0].start()] if matches else cv_text
 
+    parts: dict[str, list[str]] = {"header": [header.strip()]}
+    for match, following in zip(matches, matches[1:] + [None]):
+        end = following.start() if following else len(cv_text)
+        section = _HEADING_SECTION[match.group(1).lower()]
+        parts.setdefault(section, []).append(cv_text[match.start():end].strip())
+
+    return {section: "\n\n".join(p for p in texts if p) for section, texts in parts.items()}
+
+
+async def _extract_by_section(client, experience_text: str, rest_text: str) -> CVFacts:
+    """
+    Extract a long CV as two concurrent, smaller LLM calls.
+
+    Output size drives generation latency, so the experience section (by far
+    the largest) is extracted on its own while the rest of the CV is
+    extracted in parallel; the results are merged into one CVFacts.
+    """
+    facts, section = await gather_or_cancel(
+        client.generate_structured(
+            prompt=CV_EXTRACTION_PROMPT.format(cv_text=rest_text),
+            response_model=CVFacts,
+        ),
+        client.generate_structured(
+            prompt=CV_EXPERIENCE_PROMPT.format(cv_text=experience_text),
+            response_model=ExperienceSection,
+        ),
+    )
+    facts.experience = section.experience
+    facts.skills.inferred_from_experience = section.inferred_skills
+    return facts
+
+
+def _parse_month(value: str) -> datetime:
+    """Parse a YYYY-MM date, falling back to YYYY (read as January)."""
+    value = value.strip()
     try:
-        start = parse_date(f"{start_date}-01")
-        if end_date.lower() == "present":
+        return datetime.strptime(value, "%Y-%m")
+    except ValueError:
+        # The prompt asks for YYYY-MM, but the model sometimes gives a bare year
+        return datetime.strptime(value, "%Y")
+
+
+def _calculate_duration(start_date: str, end_date: str) -> int:
+    """Calculate duration in months between two YYYY-MM (or YYYY) dates."""
+    try:
+        start = _parse_month(start_date)
+        # Experience normalizes these already; also accept raw strings here
+        if end_date.strip().casefold() in PRESENT_ALIASES:
             end = datetime.now()
         else:
-            end = parse_date(f"{end_date}-01")
-        delta = relativedelta(end, start)
-        return delta.years * 12 + delta.months
-    except Exception:
+            end = _parse_month(end_date)
+    except ValueError:
         return 0
+    return (end.year - start.year) * 12 + (end.month - start.month)
+
+
+def _skill_names(cv_facts: CVFacts) -> dict[str, str]:
+    """
+    Map casefolded skill -> first spelling seen (explicit, inferred, then
+    technologies used), built once per CVFacts instance.
+    """
+    names = cv_facts._memo.get("skill_names")
+    if names is not None:
+        return names
+
+    names = {}
+    add = names.setdefault
+    for skill in cv_facts.skills.explicitly_listed:
+        add(skill.casefold(), skill)
+    for inferred in cv_facts.skills.inferred_from_experience:
+        add(inferred.skill.casefold(), inferred.skill)
+    for exp in cv_facts.experience:
+        for resp in exp.responsibilities:
+            for tech in resp.extracted_facts.technologies:
+                add(tech.casefold(), tech)
+    for proj in cv_facts.projects:
+        for tech in proj.technologies:
+            add(tech.casefold(), tech)
+
+    cv_facts._memo["skill_names"] = names
+    return names
+
+
+def get_all_skills(cv_facts: CVFacts) -> list[str]:
+    """Get all skills from the CV (explicit, inferred, and technologies used).
+
+    Spellings differing only in case are merged, keeping the first seen.
+    """
+    return sorted(_skill_names(cv_facts).values())
+
+
+def has_skill(cv_facts: CVFacts, skill: str) -> bool:
+    """Case-insensitive check against all skills in the CV."""
+    return skill.casefold() in _skill_names(cv_facts)
+
+
+class _CorpusEntry(NamedTuple):
+    """A searchable piece of CV text with its lowercased forms precomputed."""
+    source_type: str
+    source_id: str
+    text: str
+    text_lower: str
+    technologies: frozenset[str]  # lowercased
+
+
+def _skill_corpus(cv_facts: CVFacts) -> tuple[list[tuple[str, str]], list[_CorpusEntry]]:
+    """
+    Flatten the CV into (listed skills, searchable entries), lowercased once.
+
+    Built on first use and memoized on the CVFacts instance, so repeated
+    evidence lookups don't re-lowercase every responsibility per skill.
+    """
+    corpus = cv_facts._memo.get("skill_corpus")
+    if corpus is not None:
+        return corpus
+
+    listed = [(skill.lower(), skill) for skill in cv_facts.skills.explicitly_listed]
+    entries = []
+    for exp in cv_facts.experience:
+        for resp in exp.responsibilities:
+            entries.append(_CorpusEntry(
+                "experience", exp.id, resp.original_text, resp.original_text.lower(),
+                frozenset(t.lower() for t in resp.extracted_facts.technologies),
+            ))
+        for ach in exp.achievements:
+            entries.append(_CorpusEntry(
+                "experience", exp.id, ach.original_text, ach.original_text.lower(), frozenset(),
+            ))
+    for proj in cv_facts.projects:
+        entries.append(_CorpusEntry(
+            "project", proj.name, proj.description, proj.description.lower(),
+            frozenset(t.lower() for t in proj.technologies),
+        ))
+    for cert in cv_facts.certifications:
+        entries.append(_CorpusEntry(
+            "certification", cert.name, cert.name, cert.name.lower(), frozenset(),
+        ))
+
+    corpus = cv_facts._memo["skill_corpus"] = (listed, entries)
+    return corpus
+
+
+def build_skill_evidence_index(cv_facts: CVFacts, skills: Iterable[str]) -> dict[str, list[dict]]:
+    """
+    Find evidence for many skills, each searched at most once per CV.
+
+    Each skill not yet indexed is checked against every corpus entry (a plain
+    substring scan, not a multi-pattern one). The gain is memoization: results
+    are stored on the CVFacts instance keyed by lowercased skill, so repeat
+    lookups are free. Callers that know their keyword set up front (e.g. the
+    mapper) should prime the index with it.
+
+    Returns:
+        The (shared) index mapping lowercased skill -> evidence dicts.
+    """
+    index = cv_facts._memo.setdefault("skill_evidence", {})
+    pending = [s for s in dict.fromkeys(skill.lower() for skill in skills) if s not in index]
+    if not pending:
+        return index
+
+    listed, entries = _skill_corpus(cv_facts)
+    found: dict[str, list[dict]] = {skill: [] for skill in pending}
+
+    for lowered, original in listed:
+        if lowered in found:
+            found[lowered].append({"source_type": "skill", "source_id": "skills", "text": original})
+
+    for entry in entries:
+        for skill in pending:
+            if skill in entry.technologies or skill in entry.text_lower:
+                found[skill].append(
+                    {"source_type": entry.source_type, "source_id": entry.source_id, "text": entry.text}
+                )
+
+    index.update(found)
+    return index
+
+
+def get_skill_evidence(cv_facts: CVFacts, skill: str) -> list[dict]:
+    """
+    Find all evidence for a skill in the CV.
+
+    Returns a list of dicts with source_type, source_id and text.
+    """
+    skill_lower = skill.lower()
+    return list(build_skill_evidence_index(cv_facts, (skill_lower,))[skill_lower])
+
+
+def get_total_experience_years(cv_facts: CVFacts) -> float:
+    """Get total years of professional experience (memoized per CVFacts)."""
+    years = cv_facts._memo.get("total_years")
+    if years is None:
+        total_months = sum(exp.duration_months or 0 for exp in cv_facts.experience)
+        years = cv_facts._memo["total_years"] = round(total_months / 12, 1)
+    return years
@@ -4,6 +4,7 @@ Module 4: CV Generator
 Produces the tailored CV based on mapping, reorganizing and rewriting
 while maintaining factual accuracy.
 """
+import re
 from typing import Optional
 from ..models.job_requirements import JobRequirements
 from ..models.cv_facts import CVFacts
@@ -11,6 +12,7 @@ from ..models.mapping import MappingResult
 from ..models.output import (
     TailoredCV,
     TailoredHeader,
+    ContactInfo,
     TailoredExperience,
     TailoredExperienceBullet,
     TailoredSkills,
@@ -21,38 +23,31 @@ from ..models.output import (
     BorderlineItem
 )
 from ..models.options import StrictnessConfig, STRICTNESS_CONFIGS
-from ..utils.llm_client import get_llm_client
+from ..config import settings
+from ..utils.cache import LRUCache, content_key
+from ..utils.concurrency import gather_or_cancel
+from ..utils.llm_client import extract_json_object, get_llm_client
 from .job_extractor import get_keyword_priority_map
 import logging
 
 logger = logging.getLogger(__name__)
 
 
-SUMMARY_GENERATION_PROMPT = """
-Generate a professional summary for a CV tailored to this job.
-
-JOB TITLE: {job_title}
-JOB COMPANY: {company}
-
-TOP REQUIREMENTS:
-{requirements}
+# Static instructions are sent as the system instruction and the per-request
+# data as the prompt, so every call shares a cacheable prefix.
+SUMMARY_GENERATION_SYSTEM = """
+Generate a professional summary for a CV tailored to the job described in the prompt.
 
-CANDIDATE'S EXPERIENCE:
-- Total years: {total_years}
-- Current/recent title: {current_title}
-- Top skills: {top_skills}
-- Key achievements: {key_achievements}
-{user_notes_section}
 RULES:
 1. Maximum 3-4 sentences
 2. Front-load with strongest job-relevant qualifications
-3. Include 2-3 high-priority keywords naturally: {keywords}
+3. Include 2-3 of the listed high-priority keywords naturally
 4. Use quantification ONLY from the provided achievements
 5. Align title descriptor with the job title
 6. If user notes are provided, incorporate their guidance appropriately
 
 CRITICAL ACCURACY RULES - DO NOT VIOLATE:
-- Every claim must be traceable to the provided CV facts above
+- Every claim must be traceable to the provided CV facts
 - Do NOT invent achievements, metrics, skills, or experiences
 - Do NOT escalate responsibility (e.g., "helped" cannot become "led")
 - If a metric is not in the provided achievements, do not include any metric
@@ -63,45 +58,104 @@ OUTPUT FORMAT:
 Return ONLY the summary text, no additional formatting or explanation.
 """
 
+SUMMARY_GENERATION_PROMPT = """
+JOB TITLE: {job_title}
+JOB COMPANY: {company}
 
-BULLET_REWRITE_PROMPT = """
-Rewrite this CV bullet point to better align with the job requirements.
+TOP REQUIREMENTS:
+{requirements}
 
-ORIGINAL BULLET:
-{original}
+CANDIDATE'S EXPERIENCE:
+- Total years: {total_years}
+- Current/recent title: {current_title}
+- Top skills: {top_skills}
+- Key achievements: {key_achievements}
 
-JOB-RELEVANT KEYWORDS TO INTEGRATE (if naturally fitting):
-{keywords}
+HIGH-PRIORITY KEYWORDS: {keywords}
+{user_notes_section}"""
+
+
+BULLET_REWRITE_SYSTEM = """
+Rewrite the CV bullet points in the prompt (all from the same role) to better align with the job requirements.
 
-JOB RESPONSIBILITIES IT RELATES TO:
-{responsibilities}
-{user_notes_section}
 RULES:
 1. Keep ALL facts identical - same numbers, same scope, same outcome
 2. Only change language/framing to match job description style
 3. Integrate keywords ONLY where they naturally fit
 4. Maintain or improve specificity - never make it vaguer
-5. Keep bullet concise (max 2 lines)
-6. If the original is already well-written, minimal changes are fine
+5. Keep each bullet concise (max 2 lines)
+6. If an original is already well-written, minimal changes are fine
 7. If user notes are provided, incorporate their guidance where appropriate
+8. Rewrite each bullet on its own - never merge, split or move facts between bullets
 
 CRITICAL ACCURACY RULES - DO NOT VIOLATE:
 - Do NOT add new achievements or responsibilities not in the original
 - Do NOT escalate scope (e.g., "helped" cannot become "led", "assisted" cannot become "managed")
 - Do NOT add metrics if the original doesn't have them
 - Do NOT invent technologies or skills not mentioned
-- The rewritten bullet must be factually equivalent to the original
+- Each rewritten bullet must be factually equivalent to its original
 
 OUTPUT FORMAT:
-Return a JSON object:
-{{
-    "rewritten": "the rewritten bullet text",
-    "keywords_used": ["list", "of", "keywords", "integrated"],
-    "change_type": "rewrite" | "minimal" | "none",
-    "explanation": "brief explanation of changes"
-}}
+Return a JSON object with one entry per bullet, using the bullet's number as idx:
+{
+    "rewrites": [
+        {
+            "idx": 1,
+            "rewritten": "the rewritten bullet text",
+            "keywords_used": ["list", "of", "keywords", "integrated"],
+            "change_type": "rewrite" | "minimal" | "none",
+            "explanation": "brief explanation of changes"
+        }
+    ]
+}
 """
 
+BULLET_REWRITE_PROMPT = """
+ORIGINAL BULLETS:
+{bullets}
+
+JOB-RELEVANT KEYWORDS TO INTEGRATE (if naturally fitting):
+{keywords}
+
+JOB RESPONSIBILITIES THEY RELATE TO:
+{responsibilities}
+{user_notes_section}"""
+
+
+_DIGIT_RE = re.compile(r"\d")
+
+# Bullet rewrites, keyed by the bullet and the job context it was rewritten
+# for, so repeat tailoring for the same posting skips the LLM for known bullets.
+# Values are the model's reply entries for the bullet.
+_rewrite_cache: LRUCache[dict] = LRUCache(
+    settings.rewrite_cache_size, settings.extraction_cache_ttl_seconds
+)
+
+
+class _KeywordMatcher:
+    """
+    Case-insensitive substring matching of one text against a fixed keyword list.
+
+    Keywords are lowercased once up front, leaving a single lower() per text
+    plus C-level `in` checks. (An Aho-Corasick automaton would only pay off
+    for far more than the ~15 keywords matched here.)
+    """
+    
+    __slots__ = ("_keywords",)
+    
+    def __init__(self, keywords: list[str]):
+        self._keywords = [(kw, kw.lower()) for kw in keywords]
+    
+    def find(self, text: str) -> list[str]:
+        """Keywords occurring in text, in keyword order."""
+        text_lower = text.lower()
+        return [kw for kw, kw_lower in self._keywords if kw_lower in text_lower]
+    
+    def any(self, text: str) -> bool:
+        """Whether any keyword occurs in text."""
+        text_lower = text.lower()
+        return any(kw_lower in text_lower for _, kw_lower in self._keywords)
+
 
 class CVGenerator:
     """Generates tailored CVs from mapping results."""
@@ -122,20 +176,39 @@ class CVGenerator:
         self.changes_log: list[ChangeLogEntry] = []
         self.borderline_items: list[BorderlineItem] = []
         self.client = get_llm_client()
+        
+        # Keywords to integrate into experience bullets
+        self.bullet_keywords = (
+            requirements.ats_keywords.high_priority +
+            requirements.ats_keywords.medium_priority
+        )[:15]
+        self._bullet_matcher = _KeywordMatcher(self.bullet_keywords)
+        # All high/medium keywords decide which certifications and projects are relevant
+        relevant = requirements.ats_keywords.high_priority + requirements.ats_keywords.medium_priority
+        self._relevance_matcher = _KeywordMatcher(relevant)
+        self._relevant_keywords = frozenset(kw.lower() for kw in relevant)
+        self._keyword_priority_map = get_keyword_priority_map(requirements)
     
     async def generate(self) -> tuple[TailoredCV, list[ChangeLogEntry], list[BorderlineItem]]:
         """Generate the complete tailored CV."""
         
-        # Generate each section
+        # Generate each section. The summary and the bullet rewrites are
+        # independent LLM calls, so they run concurrently.
         header = self._generate_header()
-        summary = await self._generate_summary()
-        experience = await self._generate_experience()
+        summary, (experience, experience_changes, experience_borderline) = await gather_or_cancel(
+            self._generate_summary(),
+            self._generate_experience(),
+        )
+        # Merged after the gather so the log order doesn't depend on timing
+        self.changes_log.extend(experience_changes)
+        self.borderline_items.extend(experience_borderline)
         skills = self._generate_skills()
         education = self._generate_education()
         certifications = self._generate_certifications()
         projects = self._generate_projects()
         
-        cv = TailoredCV(
+        # Sections are built from validated models; no need to re-validate
+        cv = TailoredCV.model_construct(
             header=header,
             summary=summary,
             experience=experience,
@@ -173,18 +246,14 @@ class CVGenerator:
                 requires_review=False
             ))
         
-        contact = {}
         info = self.cv_facts.personal_info
-        if info.email:
-            contact["email"] = info.email
-        if info.phone:
-            contact["phone"] = info.phone
-        if info.location:
-            contact["location"] = info.location
-        if info.linkedin:
-            contact["linkedin"] = info.linkedin
-        if info.website:
-            contact["website"] = info.website
+        contact = ContactInfo(
+            email=info.email or None,
+            phone=info.phone or None,
+            location=info.location or None,
+            linkedin=info.linkedin or None,
+            website=info.website or None,
+        )
         
         return TailoredHeader(
             name=info.name,
@@ -205,11 +274,12 @@ class CVGenerator:
             current_title = self.cv_facts.experience[0].title
         
         # Get top skills from CV that match requirements
-        keyword_map = get_keyword_priority_map(self.requirements)
+        keyword_map = self._keyword_priority_map
         cv_skills = list(self.cv_facts.skills.explicitly_listed)
         top_skills = [s for s in cv_skills if s.lower() in keyword_map][:5]
         if len(top_skills) < 3:
-            top_skills.extend(cv_skills[:5 - len(top_skills)])
+            # Pad with the CV's leading skills, skipping ones already picked
+            top_skills = list(dict.fromkeys(top_skills + cv_skills))[:5]
         
         # Get key achievements (quantified ones first)
         achievements = []
@@ -245,7 +315,7 @@ class CVGenerator:
         )
         prompt = self._apply_user_instructions(prompt)
         
-        summary = await self.client.generate_text(prompt)
+        summary = await self.client.generate_text(prompt, system=SUMMARY_GENERATION_SYSTEM)
         summary = summary.strip().strip('"')
         
         # Log the change
@@ -265,59 +335,75 @@ class CVGenerator:
         
         return summary
     
-    async def _generate_experience(self) -> list[TailoredExperience]:
-        """Generate tailored experience section."""
+    async def _generate_experience(
+        self,
+    ) -> tuple[list[TailoredExperience], list[ChangeLogEntry], list[BorderlineItem]]:
+        """
+        Generate tailored experience section.
+
+        Each experience's bullets are rewritten in one LLM call, and the calls
+        for all experiences run concurrently. Returns the section plus its
+        change log and borderline items, in CV order.
+        """
         
-        # Get keywords to integrate
-        keywords = (
-            self.requirements.ats_keywords.high_priority +
-            self.requirements.ats_keywords.medium_priority
-        )[:15]
+        keywords = self.bullet_keywords
         
         # Get responsibilities for context
         responsibilities = [r.description for r in self.requirements.responsibilities[:5]]
         
-        tailored_experiences = []
-        
+        # Pick and order each experience's bullets, collecting the rewrites
+        selected = []
+        rewrites = []
         for exp in self.cv_facts.experience:
-            tailored_bullets = []
-            
             # Combine responsibilities and achievements for bullet points
-            all_items = []
-            
-            for resp in exp.responsibilities:
-                all_items.append(resp.original_text)
-            
-            for ach in exp.achievements:
-                all_items.append(ach.original_text)
+            all_items = [resp.original_text for resp in exp.responsibilities]
+            all_items.extend(ach.original_text for ach in exp.achievements)
             
-            # Score bullets by relevance to job
+            # Score bullets by relevance to job, most relevant first. Each
+            # bullet is matched once; the matches serve scoring and keywords_used.
             scored_items = []
-            for item in all_items:
-                score = self._score_bullet_relevance(item, keywords)
-                scored_items.append((score, item))
-            
-            # Sort by relevance (most relevant first)
-            scored_items.sort(reverse=True, key=lambda x: x[0])
+            for position, item in enumerate(all_items):
+                matched = self._find_keywords_in_text(item)
+                scored_items.append((self._score_bullet_relevance(item, matched), position, item, matched))
+            scored_items.sort(reverse=True, key=lambda x: x[0])  # Stable: ties keep CV order
             
-            # Rewrite top bullets if needed
-            for i, (score, original) in enumerate(scored_items[:6]):  # Keep top 6
-                if self.config.allow_reframing != "minimal" and score < 80:
-                    # Try to improve the bullet
-                    rewritten = await self._rewrite_bullet(original, keywords, responsibilities)
-                    tailored_bullets.append(rewritten)
+            # Bullets to improve are left as None and filled in after the gather
+            bullets = []
+            to_rewrite = []
+            reordered = False
+            for rank, (score, position, original, matched) in enumerate(scored_items[:6]):  # Keep top 6
+                reordered = reordered or position != rank
+                if self._needs_rewrite(score, original, matched):
+                    bullets.append(None)
+                    to_rewrite.append(original)
                 else:
-                    tailored_bullets.append(TailoredExperienceBullet(
+                    bullets.append(TailoredExperienceBullet(
                         text=original,
-                        keywords_used=self._find_keywords_in_text(original, keywords)
+                        keywords_used=matched
                     ))
+            if to_rewrite:
+                rewrites.append(self._rewrite_bullets(to_rewrite, keywords, responsibilities))
+            selected.append((exp, bullets, reordered))
+        
+        rewritten = iter(await gather_or_cancel(*rewrites))
+        
+        tailored_experiences = []
+        changes_log: list[ChangeLogEntry] = []
+        borderline_items: list[BorderlineItem] = []
+        
+        for exp, bullets, reordered in selected:
+            if None in bullets:
+                results = iter(next(rewritten))
+                for i, bullet in enumerate(bullets):
+                    if bullet is None:
+                        bullets[i], change, borderline = next(results)
+                        if change is not None:
+                            changes_log.append(change)
+                        if borderline is not None:
+                            borderline_items.append(borderline)
             
-            # Check if order changed
-            original_order = [item for _, item in enumerate(all_items[:6])]
-            new_order = [b.text for b in tailored_bullets]
-            
-            if original_order != new_order:
-                self.changes_log.append(ChangeLogEntry(
+            if reordered:
+                changes_log.append(ChangeLogEntry(
                     section="experience",
                     change_type="reorder",
                     original=f"Original order for {exp.company}",
@@ -332,104 +418,166 @@ class CVGenerator:
                 title=exp.title,
                 dates=f"{exp.start_date} - {exp.end_date}",
                 location=exp.location,
-                bullets=tailored_bullets
+                bullets=bullets
             ))
         
-        return tailored_experiences
+        return tailored_experiences, changes_log, borderline_items
     
-    def _score_bullet_relevance(self, text: str, keywords: list[str]) -> int:
-        """Score a bullet's relevance to the job."""
+    def _score_bullet_relevance(self, text: str, matched_keywords: list[str]) -> int:
+        """Score a bullet's relevance to the job, given the bullet keywords it contains."""
         score = 50  # Base score
-        text_lower = text.lower()
-        
-        for keyword in keywords:
-            if keyword.lower() in text_lower:
-                score += 10
+        score += 10 * len(matched_keywords)
         
         # Bonus for quantified results
-        if any(c.isdigit() for c in text):
+        if _DIGIT_RE.search(text):
             score += 5
         if "%" in text or "$" in text:
             score += 5
         
         return min(score, 100)
     
-    async def _rewrite_bullet(
+    def _needs_rewrite(self, score: int, text: str, matched_keywords: list[str]) -> bool:
+        """Whether a bullet is worth sending to the LLM for a rewrite."""
+        if self.config.allow_reframing == "minimal" or score >= 80:
+            return False
+        # Quantified bullets already carrying several keywords come back
+        # (nearly) unchanged, so they keep their original text
+        return not (len(matched_keywords) >= 2 and _DIGIT_RE.search(text))
+    
+    async def _rewrite_bullets(
         self,
-        original: str,
+        originals: list[str],
         keywords: list[str],
         responsibilities: list[str]
-    ) -> TailoredExperienceBullet:
-        """Rewrite a bullet to better align with job."""
-        import json
+    ) -> list[tuple[TailoredExperienceBullet, Optional[ChangeLogEntry], Optional[BorderlineItem]]]:
+        """
+        Rewrite one experience's bullets in a single LLM call.
 
+        Returns, per original bullet and in order, the bullet with its change
+        log entry and borderline item (if any) instead of recording them,
+        since calls for different experiences run concurrently. Bullets the
+        model skips, or the whole batch if the call fails, keep the original.
+        Only bullets missing from the rewrite cache are sent to the LLM.
+        """
+        
+        keyword_text = ", ".join(keywords[:10])
+        responsibility_text = "\n".join(f"- {r}" for r in responsibilities[:3])
+        
+        # Bullets already rewritten for the same job context come from the cache
+        cache_keys = [
+            content_key(original, keyword_text, responsibility_text, self.user_instructions)
+            for original in originals
+        ]
+        items = [_rewrite_cache.get(key) for key in cache_keys]
+        pending = [i for i, item in enumerate(items) if item is None]
+        if pending:
+            rewrites = await self._request_rewrites(
+                [originals[i] for i in pending], keyword_text, responsibility_text
+            )
+            for n, i in enumerate(pending, 1):
+                items[i] = rewrites.get(str(n))
+        
+        results = []
+        for i, (original, item) in enumerate(zip(originals, items)):
+            try:
+                if item is not None:
+                    results.append(self._rewrite_result(original, item))
+                    if i in pending:
+                        _rewrite_cache.set(cache_keys[i], item)
+                    continue
+            except Exception as e:
+                logger.warning(f"Failed to rewrite bullet: {e}")
+            
+            # Keep the original if the rewrite is missing or invalid
+            results.append((
+                TailoredExperienceBullet(
+                    text=original,
+                    keywords_used=self._find_keywords_in_text(original)
+                ),
+                None,
+                None,
+            ))
+        return results
+    
+    async def _request_rewrites(
+        self,
+        originals: list[str],
+        keyword_text: str,
+        responsibility_text: str
+    ) -> dict[str, dict]:
+        """Ask the LLM to rewrite bullets; returns its reply entries by bullet number."""
+        
         # Build user notes section if provided
         user_notes_section = ""
         if self.user_instructions:
             user_notes_section = f"\nUSER NOTES/INSTRUCTIONS:\n{self.user_instructions}\n"
 
         prompt = BULLET_REWRITE_PROMPT.format(
-            original=original,
-            keywords=", ".join(keywords[:10]),
-            responsibilities="\n".join(f"- {r}" for r in responsibilities[:3]),
+            bullets="\n".join(f"{i}. {original}" for i, original in enumerate(originals, 1)),
+            keywords=keyword_text,
+            responsibilities=responsibility_text,
             user_notes_section=user_notes_section
         )
         prompt = self._apply_user_instructions(prompt)
         
         try:
-            response = await self.client.generate_text(prompt)
+            response = await self.client.generate_text(prompt, system=BULLET_REWRITE_SYSTEM)
             
             # Parse JSON response
-            if "{" in response:
-                start = response.index("{")
-                end = response.rindex("}") + 1
-                data = json.loads(response[start:end])
-                
-                rewritten = data.get("rewritten", original)
-                keywords_used = data.get("keywords_used", [])
-                change_type = data.get("change_type", "none")
-                explanation = data.get("explanation", "")
-                
-                if change_type != "none":
-                    self.changes_log.append(ChangeLogEntry(
-                        section="experience",
-                        change_type="rewrite",
-                        original=original,
-                        new=rewritten,
-                        justification=explanation,
-                        confidence="medium" if change_type == "rewrite" else "high",
-                        requires_review=change_type == "rewrite"
-                    ))
-                    
-                    if change_type == "rewrite":
-                        self.borderline_items.append(BorderlineItem(
-                            content=rewritten,
-                            category="reframed_significantly",
-                            original_evidence=original,
-                            risk_level="low",
-                            user_prompt=f"Original: '{original}'\nRewritten: '{rewritten}'\nIs this an accurate reframing?"
-                        ))
-                
-                return TailoredExperienceBullet(text=rewritten, keywords_used=keywords_used)
-        
+            data = extract_json_object(response)
+            if data is not None:
+                # idx keyed as str so "2" and 2 both match
+                return {
+                    str(item.get("idx")): item
+                    for item in data.get("rewrites", [])
+                    if isinstance(item, dict)
+                }
         except Exception as e:
-            logger.warning(f"Failed to rewrite bullet: {e}")
-        
-        # Return original if rewrite fails
-        return TailoredExperienceBullet(
-            text=original,
-            keywords_used=self._find_keywords_in_text(original, keywords)
-        )
+            logger.warning(f"Failed to rewrite bullets: {e}")
+        return {}
     
-    def _find_keywords_in_text(self, text: str, keywords: list[str]) -> list[str]:
-        """Find which keywords appear in text."""
-        text_lower = text.lower()
-        return [kw for kw in keywords if kw.lower() in text_lower]
+    def _rewrite_result(
+        self,
+        original: str,
+        item: dict
+    ) -> tuple[TailoredExperienceBullet, Optional[ChangeLogEntry], Optional[BorderlineItem]]:
+        """Build the bullet, change log entry and borderline item for one rewrite."""
+        rewritten = item.get("rewritten", original)
+        keywords_used = item.get("keywords_used", [])
+        change_type = item.get("change_type", "none")
+        explanation = item.get("explanation", "")
+        change = borderline = None
+        
+        if change_type != "none":
+            change = ChangeLogEntry(
+                section="experience",
+                change_type="rewrite",
+                original=original,
+                new=rewritten,
+                justification=explanation,
+                confidence="medium" if change_type == "rewrite" else "high",
+                requires_review=change_type == "rewrite"
+            )
+            
+            if change_type == "rewrite":
+                borderline = BorderlineItem(
+                    content=rewritten,
+                    category="reframed_significantly",
+                    original_evidence=original,
+                    risk_level="low",
+                    user_prompt=f"Original: '{original}'\nRewritten: '{rewritten}'\nIs this an accurate reframing?"
+                )
+        
+        return TailoredExperienceBullet(text=rewritten, keywords_used=keywords_used), change, borderline
+    
+    def _find_keywords_in_text(self, text: str) -> list[str]:
+        """Find which bullet keywords appear in text."""
+        return self._bullet_matcher.find(text)
     
     def _generate_skills(self) -> TailoredSkills:
         """Generate prioritized skills section."""
         
-        keyword_map = get_keyword_priority_map(self.requirements)
+        keyword_map = self._keyword_priority_map
         all_skills = list(self.cv_facts.skills.explicitly_listed)
         
         # Add inferred skills if allowed
@@ -479,22 +627,12 @@ class CVGenerator:
     def _generate_certifications(self) -> list[TailoredCertification]:
         """Generate certifications section, prioritizing relevant ones."""
         
-        # Check which certifications are relevant to job
-        relevant_keywords = set(
-            kw.lower() for kw in 
-            self.requirements.ats_keywords.high_priority +
-            self.requirements.ats_keywords.medium_priority
+        # Certifications naming a job keyword come first
+        sorted_certs = sorted(
+            self.cv_facts.certifications,
+            key=lambda cert: 0 if self._relevance_matcher.any(cert.name) else 1
         )
         
-        def cert_relevance(cert):
-            name_lower = cert.name.lower()
-            for kw in relevant_keywords:
-                if kw in name_lower:
-                    return 0  # High priority
-            return 1  # Lower priority
-        
-        sorted_certs = sorted(self.cv_facts.certifications, key=cert_relevance)
-        
         return [
             TailoredCertification(
                 name=cert.name,
@@ -509,16 +647,10 @@ class CVGenerator:
         """Generate projects section if relevant to job."""
         
         # Only include projects with relevant technologies
-        relevant_keywords = set(
-            kw.lower() for kw in 
-            self.requirements.ats_keywords.high_priority +
-            self.requirements.ats_keywords.medium_priority
-        )
-        
         relevant_projects = []
         for proj in self.cv_facts.projects:
-            tech_overlap = set(t.lower() for t in proj.technologies) & relevant_keywords
-            if tech_overlap or any(kw in proj.description.lower() for kw in relevant_keywords):
+            tech_overlap = any(t.lower() in self._relevant_keywords for t in proj.technologies)
+            if tech_overlap or self._relevance_matcher.any(proj.description):
                 relevant_projects.append(TailoredProject(
                     name=proj.name,
                     description=proj.description,
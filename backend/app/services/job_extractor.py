@@ -3,19 +3,26 @@ Module 1: Job Requirements Extractor
 
 Parses job descriptions and extracts structured requirements.
 """
+from itertools import chain
 from ..models.job_requirements import (
     JobRequirements,
     Requirement,
-    RequirementCategory,
     Responsibility,
     ATSKeywords,
     CultureSignals
 )
+from ..config import settings
+from ..utils.cache import LRUCache, content_key
 from ..utils.llm_client import get_llm_client
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Repeat submissions of the same posting reuse the parsed requirements.
+_job_cache: LRUCache[JobRequirements] = LRUCache(
+    settings.extraction_cache_size, settings.extraction_cache_ttl_seconds
+)
+
 
 JOB_EXTRACTION_PROMPT = """
 Analyze the following job description and extract structured requirements.
@@ -42,16 +49,24 @@ JOB DESCRIPTION:
 """
 
 
-async def extract_job_requirements(job_description: str) -> JobRequirements:
+async def extract_job_requirements(job_description: str, use_cache: bool = True) -> JobRequirements:
     """
     Extract structured requirements from a job description.
     
     Args:
         job_description: Raw job description text
+        use_cache: Reuse a previous result for identical text
     
     Returns:
         Parsed JobRequirements object
     """
+    cache_key = content_key(job_description.strip())
+    if use_cache:
+        cached = _job_cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"Job requirements cache hit for '{cached.job_title}'")
+            return cached.model_copy(deep=True)
+
     client = get_llm_client()
     
     prompt = JOB_EXTRACTION_PROMPT.format(job_description=job_description)
@@ -73,6 +88,7 @@ async def extract_job_requirements(job_description: str) -> JobRequirements:
             result.ats_keywords.high_priority = list(all_keywords)[:10]
         
         logger.info(f"Extracted job requirements for '{result.job_title}'")
+        _job_cache.set(cache_key, result.model_copy(deep=True))
         return result
     
     except Exception as e:
@@ -80,6 +96,10 @@ async def extract_job_requirements(job_description: str) -> JobRequirements:
         raise
 
 
+# Requirement categories whose keywords count as skills
+_SKILL_CATEGORIES = frozenset({"technical_skill", "soft_skill"})
+
+
 def get_keyword_priority_map(requirements: JobRequirements) -> dict[str, str]:
     """
     Create a map of keywords to their priority level.
@@ -90,20 +110,17 @@ def get_keyword_priority_map(requirements: JobRequirements) -> dict[str, str]:
     Returns:
         Dict mapping keyword to priority (high/medium/contextual)
     """
-    priority_map = {}
-    
-    for keyword in requirements.ats_keywords.high_priority:
-        priority_map[keyword.lower()] = "high"
-    
-    for keyword in requirements.ats_keywords.medium_priority:
-        if keyword.lower() not in priority_map:
-            priority_map[keyword.lower()] = "medium"
-    
-    for keyword in requirements.ats_keywords.contextual:
-        if keyword.lower() not in priority_map:
-            priority_map[keyword.lower()] = "contextual"
-    
-    return priority_map
+    ats = requirements.ats_keywords
+    # Walk lowest priority first so higher priorities overwrite shared keywords
+    return {
+        keyword.lower(): priority
+        for priority, keywords in (
+            ("contextual", ats.contextual),
+            ("medium", ats.medium_priority),
+            ("high", ats.high_priority),
+        )
+        for keyword in keywords
+    }
 
 
 def get_all_required_skills(requirements: JobRequirements) -> list[str]:
@@ -116,13 +133,11 @@ def get_all_required_skills(requirements: JobRequirements) -> list[str]:
     Returns:
         List of skill names/keywords
     """
-    skills = set()
-    
-    for req in requirements.must_have + requirements.nice_to_have:
-        if req.category in [RequirementCategory.TECHNICAL_SKILL, RequirementCategory.SOFT_SKILL]:
-            skills.update(req.keywords)
-    
-    for resp in requirements.responsibilities:
-        skills.update(resp.implied_skills)
-    
+    skills = {
+        keyword
+        for req in chain(requirements.must_have, requirements.nice_to_have)
+        if req.category in _SKILL_CATEGORIES
+        for keyword in req.keywords
+    }
+    skills.update(skill for resp in requirements.responsibilities for skill in resp.implied_skills)
     return list(skills)
@@ -4,7 +4,7 @@ Module 3: Requirements-to-Evidence Mapper
 Creates explicit mapping between job requirements and CV evidence.
 """
 from typing import Optional
-from ..models.job_requirements import JobRequirements, Requirement, RequirementCategory
+from ..models.job_requirements import JobRequirements, Requirement
 from ..models.cv_facts import CVFacts
 from ..models.mapping import (
     MappingResult,
@@ -17,9 +17,11 @@ from ..models.mapping import (
     KeywordCoverage
 )
 from ..models.options import StrictnessConfig, STRICTNESS_CONFIGS
-from .cv_extractor import get_skill_evidence, get_all_skills, get_total_experience_years
+from .cv_extractor import (
+    build_skill_evidence_index, get_skill_evidence, get_all_skills, get_total_experience_years, has_skill,
+)
 from .job_extractor import get_keyword_priority_map
-from ..utils.llm_client import get_llm_client
+from ..utils.llm_client import extract_json_object, get_llm_client
 import logging
 
 logger = logging.getLogger(__name__)
@@ -27,6 +29,27 @@ logger = logging.getLogger(__name__)
 
 SIMILARITY_THRESHOLD = 0.6  # Threshold for considering skills as related
 
+# Static instructions go in the system instruction so every call shares them
+# as a cacheable prefix; the prompt carries only the candidate and job data.
+TRANSFERABLE_SKILLS_SYSTEM = """
+For each job requirement in the prompt, identify any of the candidate's skills that are TRANSFERABLE to it.
+Only include genuinely related skills (e.g., AWS for Azure cloud experience).
+
+Return a JSON object with one entry per requirement, using the requirement's number as req_id:
+{
+    "matches": [
+        {
+            "req_id": 1,
+            "transferable_skills": [
+                {"candidate_skill": "string", "relevance_explanation": "string"}
+            ]
+        }
+    ]
+}
+
+Use an empty transferable_skills list if no skills are transferable.
+"""
+
 
 async def map_requirements_to_evidence(
     requirements: JobRequirements,
@@ -46,17 +69,31 @@ async def map_requirements_to_evidence(
     """
     config = STRICTNESS_CONFIGS.get(strictness, STRICTNESS_CONFIGS["moderate"])
     
-    mapping_table = []
-    
-    # Process must-have requirements
-    for req in requirements.must_have:
-        entry = await _create_mapping_entry(req, "must_have", cv_facts, config)
-        mapping_table.append(entry)
-    
-    # Process nice-to-have requirements
-    for req in requirements.nice_to_have:
-        entry = await _create_mapping_entry(req, "nice_to_have", cv_facts, config)
-        mapping_table.append(entry)
+    # Search the CV once for every keyword the mapping will look up
+    build_skill_evidence_index(cv_facts, [
+        *(kw for req in requirements.must_have + requirements.nice_to_have for kw in req.keywords),
+        *requirements.ats_keywords.high_priority,
+        *requirements.ats_keywords.medium_priority,
+        *requirements.ats_keywords.contextual,
+    ])
+    
+    # Must-haves come first, then nice-to-haves, in requirement order
+    prioritized = [(req, "must_have") for req in requirements.must_have]
+    prioritized.extend((req, "nice_to_have") for req in requirements.nice_to_have)
+    evidence = [_find_direct_evidence(req, cv_facts) for req, _ in prioritized]
+    
+    # Requirements without direct evidence share one LLM call for transferable skills
+    if config.allow_inferred_skills:
+        gaps = [i for i, items in enumerate(evidence) if not items]
+        if gaps:
+            transferable = await _find_transferable_evidence([prioritized[i][0] for i in gaps], cv_facts)
+            for i, items in zip(gaps, transferable):
+                evidence[i].extend(items)
+    
+    mapping_table = [
+        _create_mapping_entry(req, priority, items, cv_facts, config)
+        for (req, priority), items in zip(prioritized, evidence)
+    ]
     
     # Calculate overall match
     overall_match = _calculate_overall_match(mapping_table, requirements)
@@ -71,21 +108,8 @@ async def map_requirements_to_evidence(
     )
 
 
-async def _create_mapping_entry(
-    requirement: Requirement,
-    priority: str,
-    cv_facts: CVFacts,
-    config: StrictnessConfig
-) -> MappingEntry:
-    """Create a mapping entry for a single requirement."""
-    
-    req_ref = RequirementRef(
-        text=requirement.description,
-        priority=priority,
-        category=requirement.category.value
-    )
-    
-    # Find evidence for this requirement
+def _find_direct_evidence(requirement: Requirement, cv_facts: CVFacts) -> list[EvidenceItem]:
+    """Find CV evidence matching a requirement's keywords."""
     evidence_items = []
     
     # Check each keyword in the requirement
@@ -101,13 +125,26 @@ async def _create_mapping_entry(
                 match_type="direct"
             ))
     
-    # Check for transferable skills if allowed
-    if config.allow_inferred_skills and not evidence_items:
-        transferable = await _find_transferable_evidence(requirement, cv_facts)
-        evidence_items.extend(transferable)
+    return evidence_items
+
+
+def _create_mapping_entry(
+    requirement: Requirement,
+    priority: str,
+    evidence_items: list[EvidenceItem],
+    cv_facts: CVFacts,
+    config: StrictnessConfig
+) -> MappingEntry:
+    """Create a mapping entry for a single requirement from its keyword/transferable evidence."""
+    
+    req_ref = RequirementRef(
+        text=requirement.description,
+        priority=priority,
+        category=requirement.category
+    )
     
     # Check experience requirements
-    if requirement.category == RequirementCategory.EXPERIENCE:
+    if requirement.category == "experience":
         exp_evidence = _check_experience_requirement(requirement, cv_facts)
         if exp_evidence:
             evidence_items.append(exp_evidence)
@@ -148,63 +185,59 @@ def _calculate_relevance_score(keyword: str, evidence: dict) -> int:
 
 
 async def _find_transferable_evidence(
-    requirement: Requirement,
+    requirements: list[Requirement],
     cv_facts: CVFacts
-) -> list[EvidenceItem]:
-    """Find transferable skills that could satisfy the requirement."""
+) -> list[list[EvidenceItem]]:
+    """
+    Find transferable skills that could satisfy each requirement, in one LLM call.
+
+    Returns the evidence for each requirement, in order.
+    """
     client = get_llm_client()
     
     all_skills = get_all_skills(cv_facts)
+    requirement_lines = "\n".join(
+        f"{i}. {req.description} (keywords: {', '.join(req.keywords)})"
+        for i, req in enumerate(requirements, 1)
+    )
     
-    # Use LLM to find related skills
-    prompt = f"""
-    The job requires: {requirement.description}
-    Keywords: {', '.join(requirement.keywords)}
-    
-    Candidate has these skills: {', '.join(all_skills)}
-    
-    Identify any skills the candidate has that are TRANSFERABLE to this requirement.
-    Only include genuinely related skills (e.g., AWS for Azure cloud experience).
-    
-    Return a JSON object with:
-    {{
-        "transferable_skills": [
-            {{"candidate_skill": "string", "relevance_explanation": "string"}}
-        ]
-    }}
-    
-    Return an empty list if no skills are transferable.
-    """
+    # The candidate's skills lead the prompt, so tailoring the same CV for
+    # several jobs keeps a longer shared prefix
+    prompt = (
+        f"CANDIDATE SKILLS: {', '.join(all_skills)}\n\n"
+        f"JOB REQUIREMENTS:\n{requirement_lines}\n"
+    )
     
+    results: list[list[EvidenceItem]] = [[] for _ in requirements]
     try:
-        response = await client.generate_text(prompt)
-        import json
+        response = await client.generate_text(prompt, system=TRANSFERABLE_SKILLS_SYSTEM)
         
         # Try to parse JSON from response
-        if "{" in response:
-            start = response.index("{")
-            end = response.rindex("}") + 1
-            data = json.loads(response[start:end])
-            
-            evidence_items = []
-            for skill_info in data.get("transferable_skills", []):
-                skill_name = skill_info.get("candidate_skill", "")
-                if skill_name:
-                    skill_evidence = get_skill_evidence(cv_facts, skill_name)
-                    for ev in skill_evidence[:1]:  # Take first evidence
-                        evidence_items.append(EvidenceItem(
-                            source_type=ev.get("source_type", "skill"),
-                            source_id=ev.get("source_id", ""),
-                            original_text=f"{ev.get('text', '')} (Transferable: {skill_info.get('relevance_explanation', '')})",
-                            relevance_score=50,  # Lower score for transferable
-                            match_type="transferable"
-                        ))
-            
-            return evidence_items
+        data = extract_json_object(response)
+        if data is not None:
+            # req_id keyed as str so "2" and 2 both match
+            matches = {
+                str(match.get("req_id")): match.get("transferable_skills", [])
+                for match in data.get("matches", [])
+                if isinstance(match, dict)
+            }
+            for i, evidence_items in enumerate(results):
+                for skill_info in matches.get(str(i + 1), []):
+                    skill_name = skill_info.get("candidate_skill", "")
+                    if skill_name:
+                        skill_evidence = get_skill_evidence(cv_facts, skill_name)
+                        for ev in skill_evidence[:1]:  # Take first evidence
+                            evidence_items.append(EvidenceItem(
+                                source_type=ev.get("source_type", "skill"),
+                                source_id=ev.get("source_id", ""),
+                                original_text=f"{ev.get('text', '')} (Transferable: {skill_info.get('relevance_explanation', '')})",
+                                relevance_score=50,  # Lower score for transferable
+                                match_type="transferable"
+                            ))
     except Exception as e:
         logger.warning(f"Failed to find transferable skills: {e}")
     
-    return []
+    return results
 
 
 def _check_experience_requirement(requirement: Requirement, cv_facts: CVFacts) -> Optional[EvidenceItem]:
@@ -300,33 +333,34 @@ def _analyze_gap(
 def _calculate_overall_match(mapping_table: list[MappingEntry], requirements: JobRequirements) -> OverallMatch:
     """Calculate overall match score."""
     
-    must_have_entries = [e for e in mapping_table if e.requirement.priority == "must_have"]
-    nice_to_have_entries = [e for e in mapping_table if e.requirement.priority == "nice_to_have"]
-    
-    # Count matches
-    must_have_matches = sum(1 for e in must_have_entries if not e.gap_analysis.has_gap or e.gap_analysis.gap_severity == "minor")
-    nice_to_have_matches = sum(1 for e in nice_to_have_entries if not e.gap_analysis.has_gap or e.gap_analysis.gap_severity == "minor")
-    
-    total_must_have = len(must_have_entries)
-    total_nice_to_have = len(nice_to_have_entries)
-    
-    # Calculate score (must-have weighted 70%, nice-to-have 30%)
-    must_have_pct = (must_have_matches / total_must_have * 100) if total_must_have > 0 else 100
-    nice_to_have_pct = (nice_to_have_matches / total_nice_to_have * 100) if total_nice_to_have > 0 else 100
-    
-    base_score = int(must_have_pct * 0.7 + nice_to_have_pct * 0.3)
-    
-    # Find strongest matches and critical gaps
+    # Count matches, strongest matches and critical gaps in one pass
+    total_must_have = must_have_matches = 0
+    total_nice_to_have = nice_to_have_matches = 0
     strongest = []
     critical_gaps = []
     
     for entry in mapping_table:
-        if entry.evidence and max((e.relevance_score for e in entry.evidence), default=0) >= 80:
+        gap = entry.gap_analysis
+        matched = not gap.has_gap or gap.gap_severity == "minor"
+        if entry.requirement.priority == "must_have":
+            total_must_have += 1
+            must_have_matches += matched
+        elif entry.requirement.priority == "nice_to_have":
+            total_nice_to_have += 1
+            nice_to_have_matches += matched
+        
+        if max((e.relevance_score for e in entry.evidence), default=0) >= 80:
             strongest.append(entry.requirement.text[:50])
         
-        if entry.gap_analysis.gap_severity == "critical":
+        if gap.gap_severity == "critical":
             critical_gaps.append(entry.requirement.text[:50])
     
+    # Calculate score (must-have weighted 70%, nice-to-have 30%)
+    must_have_pct = (must_have_matches / total_must_have * 100) if total_must_have > 0 else 100
+    nice_to_have_pct = (nice_to_have_matches / total_nice_to_have * 100) if total_nice_to_have > 0 else 100
+    
+    base_score = int(must_have_pct * 0.7 + nice_to_have_pct * 0.3)
+    
     return OverallMatch(
         score=min(base_score, 100),
         must_have_coverage=f"{must_have_matches}/{total_must_have}",
@@ -339,23 +373,21 @@ def _calculate_overall_match(mapping_table: list[MappingEntry], requirements: Jo
 def _analyze_keyword_coverage(requirements: JobRequirements, cv_facts: CVFacts) -> KeywordCoverage:
     """Analyze ATS keyword coverage."""
     
-    all_keywords = set()
-    all_keywords.update(requirements.ats_keywords.high_priority)
-    all_keywords.update(requirements.ats_keywords.medium_priority)
-    all_keywords.update(requirements.ats_keywords.contextual)
-    
-    cv_skills = set(s.lower() for s in get_all_skills(cv_facts))
+    # Deduplicated in priority order, so the lists come out in a stable order
+    all_keywords = dict.fromkeys([
+        *requirements.ats_keywords.high_priority,
+        *requirements.ats_keywords.medium_priority,
+        *requirements.ats_keywords.contextual,
+    ])
     
     present = []
     addressable = []
     missing = []
     
+    # Both checks are lookups: the skill set and the evidence index (primed
+    # with these keywords) are built once per CV
     for keyword in all_keywords:
-        keyword_lower = keyword.lower()
-        
-        if keyword_lower in cv_skills:
-            present.append(keyword)
-        elif get_skill_evidence(cv_facts, keyword):
+        if has_skill(cv_facts, keyword) or get_skill_evidence(cv_facts, keyword):
             present.append(keyword)
         else:
             # Check if we can address this through related experience
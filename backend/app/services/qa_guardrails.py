@@ -4,7 +4,8 @@ Module 5: Quality Assurance (Guardrails)
 Validates output integrity and flags potential issues.
 Ensures no fabrication and proper traceability.
 """
-from typing import Optional
+from itertools import chain
+from typing import Iterator, Optional
 from ..models.cv_facts import CVFacts
 from ..models.output import (
     TailoredCV,
@@ -14,11 +15,57 @@ from ..models.output import (
     MatchScoreBreakdown
 )
 from ..models.mapping import MappingResult
+from .cv_extractor import has_skill
+from bisect import bisect_left
 import logging
 import re
 
 logger = logging.getLogger(__name__)
 
+# Number-like patterns in bullets. Kept separate rather than one alternation:
+# overlapping matches ("30%" and "30") are all compared against the original.
+_NUMBER_PATTERNS = (
+    re.compile(r'\d+%'),          # Percentages
+    re.compile(r'\$[\d,]+'),      # Currency
+    re.compile(r'\d+[+]?'),       # Plain numbers
+    re.compile(r'\d+[kKmM]'),     # Abbreviated numbers
+)
+_NON_NUMERIC_RE = re.compile(r'[^\d.]')
+_DIGIT_RE = re.compile(r'\d')
+_KEYWORD_RE = re.compile(r'keyword', re.IGNORECASE)
+
+# Scope escalation: weak wording in the original -> stronger claims that
+# shouldn't appear in its rewrite. Order matters: the first weak word found
+# in an original decides which strong words are checked.
+_SCOPE_ESCALATIONS = {
+    'assisted': ('led', 'managed', 'directed', 'headed', 'spearheaded', 'orchestrated'),
+    'helped': ('managed', 'led', 'owned', 'drove', 'directed', 'oversaw'),
+    'participated': ('drove', 'led', 'spearheaded', 'championed', 'pioneered'),
+    'contributed': ('owned', 'led', 'managed', 'architected', 'designed'),
+    'supported': ('executed', 'led', 'managed', 'owned', 'drove'),
+    'worked on': ('led', 'managed', 'architected', 'designed', 'built'),
+    'involved in': ('led', 'owned', 'drove', 'spearheaded'),
+    'part of': ('led', 'drove', 'managed', 'owned'),
+    'collaborated': ('led', 'directed', 'managed', 'orchestrated'),
+    'member of': ('led', 'headed', 'managed'),
+    'junior': ('senior', 'lead', 'principal', 'staff'),
+    'intern': ('engineer', 'developer', 'analyst'),
+}
+
+
+def _sorted_values(numbers: set) -> list[float]:
+    """Numeric values of number-like strings, sorted; unparseable ones are skipped."""
+    values = []
+    for number in numbers:
+        cleaned = _NON_NUMERIC_RE.sub('', number)
+        if cleaned:
+            try:
+                values.append(float(cleaned))
+            except ValueError:
+                pass
+    values.sort()
+    return values
+
 
 class QAValidationError(Exception):
     """Raised when fabrication is detected."""
@@ -51,51 +98,34 @@ class QAValidator:
     
     def _check_fabricated_companies(self):
         """Ensure all companies in output exist in original."""
+        self.issues.extend(self._fabricated_companies())
+    
+    def _fabricated_companies(self) -> Iterator[str]:
         original_companies = {exp.company.lower() for exp in self.original.experience}
         
         for exp in self.tailored.experience:
             if exp.company.lower() not in original_companies:
-                self.issues.append(
-                    f"FABRICATION: Company '{exp.company}' not found in original CV"
-                )
+                yield f"FABRICATION: Company '{exp.company}' not found in original CV"
     
     def _check_fabricated_skills(self):
         """Check for skills not evidenced in original CV."""
-        # Gather all original skills and technologies
-        original_skills = set()
-        
-        for skill in self.original.skills.explicitly_listed:
-            original_skills.add(skill.lower())
-        
-        for skill in self.original.skills.inferred_from_experience:
-            original_skills.add(skill.skill.lower())
-        
-        for exp in self.original.experience:
-            for resp in exp.responsibilities:
-                for tech in resp.extracted_facts.technologies:
-                    original_skills.add(tech.lower())
-        
-        for proj in self.original.projects:
-            for tech in proj.technologies:
-                original_skills.add(tech.lower())
-        
-        # Check tailored skills
-        tailored_skills = set()
-        tailored_skills.update(s.lower() for s in self.tailored.skills.primary)
-        tailored_skills.update(s.lower() for s in self.tailored.skills.secondary)
-        tailored_skills.update(s.lower() for s in self.tailored.skills.tools)
-        
-        fabricated = tailored_skills - original_skills
-        if fabricated:
-            for skill in fabricated:
-                self.issues.append(
-                    f"FABRICATION: Skill '{skill}' not evidenced in original CV"
-                )
+        self.issues.extend(self._fabricated_skills())
+    
+    def _fabricated_skills(self) -> Iterator[str]:
+        # has_skill checks the CV's skills and technologies, collected once per CV
+        tailored = self.tailored.skills
+        reported = set()
+        for skill in chain(tailored.primary, tailored.secondary, tailored.tools):
+            skill_lower = skill.lower()
+            if skill_lower not in reported and not has_skill(self.original, skill):
+                reported.add(skill_lower)
+                yield f"FABRICATION: Skill '{skill_lower}' not evidenced in original CV"
     
     def _check_exaggerated_metrics(self):
         """Check for inflated numbers in bullets."""
         # Extract numbers from original
         original_numbers = self._extract_numbers_from_cv()
+        original_values = _sorted_values(original_numbers)
         
         # Check tailored bullets for numbers
         for exp in self.tailored.experience:
@@ -103,7 +133,7 @@ class QAValidator:
                 bullet_numbers = self._extract_numbers(bullet.text)
                 for num in bullet_numbers:
                     # Check if this number exists in original or is close
-                    if not self._number_is_valid(num, original_numbers):
+                    if not self._number_is_valid(num, original_numbers, original_values):
                         self.warnings.append(
                             f"POSSIBLE EXAGGERATION: Number '{num}' in bullet may not match original"
                         )
@@ -124,46 +154,39 @@ class QAValidator:
     
     def _extract_numbers(self, text: str) -> list[str]:
         """Extract number-like patterns from text."""
-        patterns = [
-            r'\d+%',          # Percentages
-            r'\$[\d,]+',      # Currency
-            r'\d+[+]?',       # Plain numbers
-            r'\d+[kKmM]',     # Abbreviated numbers
-        ]
-        
         numbers = []
-        for pattern in patterns:
-            matches = re.findall(pattern, text)
-            numbers.extend(matches)
+        for pattern in _NUMBER_PATTERNS:
+            numbers.extend(pattern.findall(text))
         
         return numbers
     
-    def _number_is_valid(self, num: str, original_numbers: set) -> bool:
-        """Check if a number is valid based on original CV."""
+    def _number_is_valid(self, num: str, original_numbers: set, original_values: list[float]) -> bool:
+        """
+        Check if a number is valid based on original CV.
+
+        original_values are the original numbers' numeric values, sorted, so
+        the tolerance check is a binary search rather than a scan.
+        """
         # Direct match
         if num in original_numbers:
             return True
         
         # Try to parse and compare
+        num_clean = _NON_NUMERIC_RE.sub('', num)
+        if not num_clean:
+            return True  # Can't parse, assume valid
         try:
-            # Extract numeric value
-            num_clean = re.sub(r'[^\d.]', '', num)
-            if not num_clean:
-                return True  # Can't parse, assume valid
-            
             num_val = float(num_clean)
-            
-            for orig in original_numbers:
-                orig_clean = re.sub(r'[^\d.]', '', orig)
-                if orig_clean:
-                    orig_val = float(orig_clean)
-                    # Allow if same or slightly lower (rounding)
-                    if orig_val * 0.9 <= num_val <= orig_val * 1.1:
-                        return True
         except ValueError:
-            pass
+            return False
         
-        return False
+        # Allow if within 10% of an original (orig * 0.9 <= num <= orig * 1.1):
+        # only the originals closest to num / 1.1 can qualify
+        idx = bisect_left(original_values, num_val / 1.1)
+        return any(
+            orig_val * 0.9 <= num_val <= orig_val * 1.1
+            for orig_val in original_values[max(idx - 1, 0):idx + 1]
+        )
     
     def _check_title_changes(self):
         """Check for inappropriate title changes."""
@@ -213,26 +236,11 @@ def detect_exaggeration(changes_log: list[ChangeLogEntry]) -> list[BorderlineIte
     
     for change in changes_log:
         if change.change_type == "rewrite" and change.original:
-            # Check for scope escalation - expanded list of weak -> strong word mappings
-            scope_escalations = {
-                'assisted': ['led', 'managed', 'directed', 'headed', 'spearheaded', 'orchestrated'],
-                'helped': ['managed', 'led', 'owned', 'drove', 'directed', 'oversaw'],
-                'participated': ['drove', 'led', 'spearheaded', 'championed', 'pioneered'],
-                'contributed': ['owned', 'led', 'managed', 'architected', 'designed'],
-                'supported': ['executed', 'led', 'managed', 'owned', 'drove'],
-                'worked on': ['led', 'managed', 'architected', 'designed', 'built'],
-                'involved in': ['led', 'owned', 'drove', 'spearheaded'],
-                'part of': ['led', 'drove', 'managed', 'owned'],
-                'collaborated': ['led', 'directed', 'managed', 'orchestrated'],
-                'member of': ['led', 'headed', 'managed'],
-                'junior': ['senior', 'lead', 'principal', 'staff'],
-                'intern': ['engineer', 'developer', 'analyst'],
-            }
-
+            # Only the first weak word found (in table order) is checked
             original_lower = change.original.lower()
             new_lower = change.new.lower()
 
-            for weak, strong_words in scope_escalations.items():
+            for weak, strong_words in _SCOPE_ESCALATIONS.items():
                 if weak in original_lower:
                     for strong in strong_words:
                         if strong in new_lower:
@@ -272,7 +280,7 @@ def calculate_match_score(
     # Bonus for quantified achievements aligned with job
     quantified_count = sum(
         1 for change in changes_log 
-        if change.section == "experience" and any(c.isdigit() for c in change.new)
+        if change.section == "experience" and _DIGIT_RE.search(change.new)
     )
     if quantified_count >= 3:
         bonuses.append(f"+5 for {quantified_count} quantified achievements")
@@ -281,7 +289,7 @@ def calculate_match_score(
     # Bonus for keyword integration
     keyword_changes = [
         c for c in changes_log 
-        if c.change_type == "add_keyword" or "keyword" in c.justification.lower()
+        if c.change_type == "add_keyword" or _KEYWORD_RE.search(c.justification)
     ]
     if keyword_changes:
         bonuses.append(f"+3 for keyword integration in {len(keyword_changes)} bullets")
@@ -6,10 +6,13 @@ Shared logic used by all tailor endpoints (streaming, non-streaming, upload).
 import logging
 import time
 import asyncio
+from collections import Counter
 from typing import Optional
 
+from ..config import settings
 from ..models.options import TailorRequest
-from ..models.output import TailorResult
+from ..models.output import BatchItemError, MappingSummary, TailorBatchItem, TailorResult
+from ..utils.concurrency import gather_or_cancel
 
 from .job_extractor import extract_job_requirements
 from .cv_extractor import extract_cv_facts
@@ -41,7 +44,8 @@ async def run_tailoring_pipeline(
     Steps 1+2 run in parallel (independent Gemini calls).
     Step 3 depends on 1+2.
     Step 4 depends on 3.
-    Step 5+6 run sequentially (quality check then cover letter).
+    Step 6 (cover letter) depends only on 1-3, so it runs concurrently with
+    steps 4+5 and is cancelled if either of them fails.
 
     Args:
         request: The tailoring request with job description, CV, and options.
@@ -65,7 +69,7 @@ async def run_tailoring_pipeline(
     _notify(1, "Analyzing job description...")
     _notify(2, "Extracting CV facts...")
     t0 = time.time()
-    requirements, cv_facts = await asyncio.gather(
+    requirements, cv_facts = await gather_or_cancel(
         extract_job_requirements(request.job_description),
         extract_cv_facts(request.original_cv),
     )
@@ -82,65 +86,82 @@ async def run_tailoring_pipeline(
     )
     logger.info(f"Step 3 (mapper) took {time.time()-t0:.1f}s")
 
-    # Step 4: Generate tailored CV (depends on 3)
-    _notify(4, "Generating tailored CV...")
-    t0 = time.time()
-    tailored_cv, changes_log, borderline_items = await generate_tailored_cv(
-        requirements,
-        cv_facts,
-        mapping,
-        request.options.strictness_level,
-        request.options.user_instructions,
-    )
-    logger.info(f"Step 4 (generate_cv) took {time.time()-t0:.1f}s")
-
-    # Step 5: Run quality checks (sync, no Gemini call)
-    _notify(5, "Running quality checks...")
-    is_valid, errors, warnings, match_score = run_quality_checks(
-        cv_facts,
-        tailored_cv,
-        mapping,
-        changes_log,
-        borderline_items,
-    )
-
-    if not is_valid:
-        raise TailoringError(
-            error_type="FABRICATION_DETECTED",
-            message="Quality checks detected potential fabrication",
-            details=errors,
-        )
-
-    # Step 6: Generate cover letter
-    cover_letter = None
+    # Step 6 only needs requirements, CV facts and mapping, so the cover
+    # letter is started now and overlaps CV generation and quality checks.
+    cover_letter_task = None
     if request.options.generate_cover_letter:
-        _notify(6, "Generating cover letter...")
+        t_cover = time.time()
+        cover_letter_task = asyncio.ensure_future(generate_cover_letter(
+            requirements,
+            cv_facts,
+            mapping,
+            request.options.strictness_level,
+            request.options.user_instructions,
+        ))
+
+    try:
+        # Step 4: Generate tailored CV (depends on 3)
+        _notify(4, "Generating tailored CV...")
         t0 = time.time()
-        cover_letter = await generate_cover_letter(
+        tailored_cv, changes_log, borderline_items = await generate_tailored_cv(
             requirements,
             cv_facts,
             mapping,
             request.options.strictness_level,
             request.options.user_instructions,
         )
-        logger.info(f"Step 6 (cover_letter) took {time.time()-t0:.1f}s")
-    else:
-        _notify(6, "Finalizing...")
+        logger.info(f"Step 4 (generate_cv) took {time.time()-t0:.1f}s")
+
+        # Step 5: Run quality checks (sync, no Gemini call)
+        _notify(5, "Running quality checks...")
+        is_valid, errors, warnings, match_score = run_quality_checks(
+            cv_facts,
+            tailored_cv,
+            mapping,
+            changes_log,
+            borderline_items,
+        )
+
+        if not is_valid:
+            raise TailoringError(
+                error_type="FABRICATION_DETECTED",
+                message="Quality checks detected potential fabrication",
+                details=errors,
+            )
+
+        # Step 6: Collect cover letter (usually finished by now)
+        cover_letter = None
+        if cover_letter_task is not None:
+            _notify(6, "Generating cover letter...")
+            cover_letter = await cover_letter_task
+            logger.info(f"Step 6 (cover_letter, overlapped) took {time.time()-t_cover:.1f}s")
+        else:
+            _notify(6, "Finalizing...")
+    finally:
+        # Don't leave the cover letter running if generation or QA failed;
+        # if it already failed, retrieve its error so asyncio doesn't log it
+        if cover_letter_task is not None:
+            if not cover_letter_task.done():
+                cover_letter_task.cancel()
+            elif not cover_letter_task.cancelled():
+                cover_letter_task.exception()
 
     logger.info(f"Total pipeline took {time.time()-t_total:.1f}s")
 
-    # Build mapping summary
-    mapping_summary = {
-        "overall_score": mapping.overall_match.score,
-        "must_have_coverage": mapping.overall_match.must_have_coverage,
-        "nice_to_have_coverage": mapping.overall_match.nice_to_have_coverage,
-        "strongest_matches": mapping.overall_match.strongest_matches,
-        "critical_gaps": mapping.overall_match.critical_gaps,
-        "keywords_present": mapping.keyword_coverage.present_in_cv,
-        "keywords_missing": mapping.keyword_coverage.genuinely_missing,
-    }
-
-    return TailorResult(
+    # Build mapping summary (values come from validated mapping models)
+    overall_match = mapping.overall_match
+    mapping_summary = MappingSummary.model_construct(
+        overall_score=overall_match.score,
+        must_have_coverage=overall_match.must_have_coverage,
+        nice_to_have_coverage=overall_match.nice_to_have_coverage,
+        strongest_matches=overall_match.strongest_matches,
+        critical_gaps=overall_match.critical_gaps,
+        keywords_present=mapping.keyword_coverage.present_in_cv,
+        keywords_missing=mapping.keyword_coverage.genuinely_missing,
+    )
+
+    # Every part is already a validated model, so skip re-validating the tree
+    return TailorResult.model_construct(
         tailored_cv=tailored_cv,
         cover_letter=cover_letter,
         changes_log=changes_log,
@@ -148,3 +169,47 @@ async def run_tailoring_pipeline(
         match_score=match_score,
         mapping_summary=mapping_summary,
     )
+
+
+async def run_tailoring_batch(requests: list[TailorRequest]) -> list[TailorBatchItem]:
+    """
+    Run several tailoring requests concurrently.
+
+    A CV or job description shared by several items is extracted once up
+    front, so their pipelines reuse the cached extraction instead of issuing
+    duplicate LLM calls. At most settings.batch_concurrency pipelines run at
+    a time. A failing item is reported in its slot and doesn't fail the batch.
+
+    Returns:
+        One TailorBatchItem per request, in request order.
+    """
+    semaphore = asyncio.Semaphore(max(settings.batch_concurrency, 1))
+
+    async def _warm(extraction) -> None:
+        async with semaphore:
+            try:
+                await extraction
+            except Exception:
+                pass  # the item's own pipeline run retries and reports it
+
+    async def _run(request: TailorRequest) -> TailorBatchItem:
+        async with semaphore:
+            try:
+                return TailorBatchItem(result=await run_tailoring_pipeline(request))
+            except TailoringError as e:
+                error = BatchItemError(error=e.error_type, message=e.message, details=e.details)
+            except Exception as e:
+                logger.exception("Batch item failed")
+                error = BatchItemError(error="PROCESSING_ERROR", message=str(e))
+            return TailorBatchItem(error=error)
+
+    if settings.extraction_cache_size > 0:
+        shared_cvs = [cv for cv, n in Counter(r.original_cv for r in requests).items() if n > 1]
+        shared_jobs = [job for job, n in Counter(r.job_description for r in requests).items() if n > 1]
+        if shared_cvs or shared_jobs:
+            await asyncio.gather(
+                *(_warm(extract_cv_facts(cv)) for cv in shared_cvs),
+                *(_warm(extract_job_requirements(job)) for job in shared_jobs),
+            )
+
+    return list(await asyncio.gather(*(_run(r) for r in requests)))
@@ -0,0 +1,78 @@
+"""
+In-process caches for expensive, deterministic LLM results.
+"""
+import hashlib
+import time
+from collections import OrderedDict
+from typing import BinaryIO, Generic, Hashable, Optional, TypeVar
+
+V = TypeVar("V")
+
+
+def content_key(*parts: str) -> str:
+    """Hash text content into a compact cache key (blake2b, 128-bit)."""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def stream_key(stream: BinaryIO, *parts: str, chunk_size: int = 1 << 16) -> str:
+    """
+    Hash a binary stream's content, plus text parts, into a cache key.
+
+    The stream is read in chunks from its current position and then rewound
+    to it, so a large upload is never held in memory just to be hashed.
+    """
+    start = stream.tell()
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    for chunk in iter(lambda: stream.read(chunk_size), b""):
+        digest.update(chunk)
+    stream.seek(start)
+    return digest.hexdigest()
+
+
+class LRUCache(Generic[V]):
+    """
+    Least-recently-used cache with an optional time-to-live.
+
+    Meant for use from the event loop (no locking). A maxsize of 0 or less
+    disables the cache entirely.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: Optional[float] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, V]] = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[V]:
+        """Return the cached value, or None if missing or expired."""
+        item = self._data.get(key)
+        if item is None:
+            return None
+        expires_at, value = item
+        if expires_at and expires_at < time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: V) -> None:
+        """Store a value, evicting the least recently used entries if full."""
+        if self.maxsize <= 0:
+            return
+        expires_at = time.monotonic() + self.ttl if self.ttl else 0.0
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -0,0 +1,21 @@
+"""
+Asyncio helpers shared by the services.
+"""
+import asyncio
+
+
+async def gather_or_cancel(*aws):
+    """
+    Run awaitables concurrently and return their results in order.
+
+    Unlike a bare asyncio.gather, the remaining calls are cancelled as soon as
+    one fails, so a failed LLM call doesn't leave its siblings running (and
+    billing) for results nobody will read.
+    """
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
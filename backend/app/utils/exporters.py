@@ -1,9 +1,33 @@
 """
 Export utilities for generating Markdown, DOCX, and PDF outputs.
 """
+import copy
 import io
-from typing import Optional
-from ..models.output import TailoredCV, CoverLetter
+import threading
+from pathlib import Path
+from typing import Iterator, Optional
+from ..models.output import ContactInfo, TailoredCV, CoverLetter
+
+EXPORT_CHUNK_SIZE = 64 * 1024
+
+_FONTS_DIR = Path(__file__).resolve().parents[1] / "assets" / "fonts"
+_pdf_template = None
+_pdf_template_lock = threading.Lock()
+
+
+def iter_chunks(content: bytes, chunk_size: int = EXPORT_CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Yield a rendered document in chunks, slicing a memoryview so only the
+    chunk being sent is copied (Starlette before 0.38 rejects memoryview).
+    """
+    view = memoryview(content)
+    for start in range(0, len(view), chunk_size):
+        yield bytes(view[start:start + chunk_size])
+
+
+def _contact_parts(contact: ContactInfo) -> list[str]:
+    """Email, phone and location, in header order, skipping empty ones."""
+    return [value for value in (contact.email, contact.phone, contact.location) if value]
 
 
 def generate_markdown(cv: TailoredCV, cover_letter: Optional[CoverLetter] = None) -> str:
@@ -25,15 +49,9 @@ def generate_markdown(cv: TailoredCV, cover_letter: Optional[CoverLetter] = None
     lines.append("")
     
     # Contact info
-    contact_parts = []
-    if cv.header.contact.get("email"):
-        contact_parts.append(cv.header.contact["email"])
-    if cv.header.contact.get("phone"):
-        contact_parts.append(cv.header.contact["phone"])
-    if cv.header.contact.get("location"):
-        contact_parts.append(cv.header.contact["location"])
-    if cv.header.contact.get("linkedin"):
-        contact_parts.append(f"[LinkedIn]({cv.header.contact['linkedin']})")
+    contact_parts = _contact_parts(cv.header.contact)
+    if cv.header.contact.linkedin:
+        contact_parts.append(f"[LinkedIn]({cv.header.contact.linkedin})")
     
     if contact_parts:
         lines.append(" | ".join(contact_parts))
@@ -53,8 +71,7 @@ def generate_markdown(cv: TailoredCV, cover_letter: Optional[CoverLetter] = None
             lines.append(f"### {exp.title}")
             lines.append(f"**{exp.company}** | {exp.dates}{location_str}")
             lines.append("")
-            for bullet in exp.bullets:
-                lines.append(f"- {bullet.text}")
+            lines.extend(f"- {bullet.text}" for bullet in exp.bullets)
             lines.append("")
     
     # Skills
@@ -77,17 +94,17 @@ def generate_markdown(cv: TailoredCV, cover_letter: Optional[CoverLetter] = None
             year_str = f" ({edu.year})" if edu.year else ""
             lines.append(f"**{edu.degree} in {edu.field}**{year_str}")
             lines.append(f"{edu.institution}")
-            for highlight in edu.highlights:
-                lines.append(f"- {highlight}")
+            lines.extend(f"- {highlight}" for highlight in edu.highlights)
             lines.append("")
     
     # Certifications
     if cv.certifications:
         lines.append("## Certifications")
         lines.append("")
-        for cert in cv.certifications:
-            date_str = f" ({cert.date})" if cert.date else ""
-            lines.append(f"- **{cert.name}** - {cert.issuer}{date_str}")
+        lines.extend(
+            f"- **{cert.name}** - {cert.issuer}" + (f" ({cert.date})" if cert.date else "")
+            for cert in cv.certifications
+        )
         lines.append("")
     
     # Projects
@@ -101,21 +118,17 @@ def generate_markdown(cv: TailoredCV, cover_letter: Optional[CoverLetter] = None
                 lines.append(f"*Technologies: {', '.join(proj.technologies)}*")
             lines.append("")
     
-    cv_markdown = "\n".join(lines)
-    
-    # Add cover letter if present
+    # Add cover letter if present (joined with the CV in one pass below)
     if cover_letter:
-        cl_lines = [
-            "",
+        lines.extend([
             "---",
             "",
             "# Cover Letter",
             "",
             cover_letter.full_text
-        ]
-        cv_markdown += "\n".join(cl_lines)
+        ])
     
-    return cv_markdown
+    return "\n".join(lines)
 
 
 def generate_docx(cv: TailoredCV, cover_letter: Optional[CoverLetter] = None) -> bytes:
@@ -142,6 +155,13 @@ def generate_docx(cv: TailoredCV, cover_letter: Optional[CoverLetter] = None) ->
         section.top_margin = Inches(0.5)
         section.bottom_margin = Inches(0.5)
     
+    # Looking a style up by name scans every style in the document, so
+    # resolve the bullet style once and set its id on each bullet directly
+    bullet_style_id = doc.styles["List Bullet"].style_id
+    
+    def add_bullet(text: str) -> None:
+        doc.add_paragraph(text)._p.style = bullet_style_id
+    
     # Header - Name
     name_para = doc.add_paragraph()
     name_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
@@ -156,13 +176,7 @@ def generate_docx(cv: TailoredCV, cover_letter: Optional[CoverLetter] = None) ->
     title_run.font.size = Pt(12)
     
     # Contact info
-    contact_parts = []
-    if cv.header.contact.get("email"):
-        contact_parts.append(cv.header.contact["email"])
-    if cv.header.contact.get("phone"):
-        contact_parts.append(cv.header.contact["phone"])
-    if cv.header.contact.get("location"):
-        contact_parts.append(cv.header.contact["location"])
+    contact_parts = _contact_parts(cv.header.contact)
     
     if contact_parts:
         contact_para = doc.add_paragraph()
@@ -191,7 +205,7 @@ def generate_docx(cv: TailoredCV, cover_letter: Optional[CoverLetter] = None) ->
             
             # Bullets
             for bullet in exp.bullets:
-                bullet_para = doc.add_paragraph(bullet.text, style='List Bullet')
+                add_bullet(bullet.text)
     
     # Skills
     if cv.skills.primary or cv.skills.secondary or cv.skills.tools:
@@ -220,7 +234,7 @@ def generate_docx(cv: TailoredCV, cover_letter: Optional[CoverLetter] = None) ->
             edu_para.add_run(degree_text).bold = True
             doc.add_paragraph(edu.institution)
             for highlight in edu.highlights:
-                doc.add_paragraph(highlight, style='List Bullet')
+                add_bullet(highlight)
     
     # Certifications
     if cv.certifications:
@@ -229,7 +243,7 @@ def generate_docx(cv: TailoredCV, cover_letter: Optional[CoverLetter] = None) ->
             cert_text = f"{cert.name} - {cert.issuer}"
             if cert.date:
                 cert_text += f" ({cert.date})"
-            doc.add_paragraph(cert_text, style='List Bullet')
+            add_bullet(cert_text)
     
     # Projects
     if cv.projects:
@@ -255,8 +269,34 @@ def generate_docx(cv: TailoredCV, cover_letter: Optional[CoverLetter] = None) ->
     # Save to bytes
     buffer = io.BytesIO()
     doc.save(buffer)
-    buffer.seek(0)
-    return buffer.read()
+    return buffer.getvalue()
+
+
+def _new_pdf():
+    """
+    Get a blank A4 FPDF document with the bundled DejaVu fonts registered.
+
+    Parsing the two TTF files takes about a third of a CV's render time, so
+    they are loaded into a template once per process and each document
+    starts as a deep copy of it (fpdf2 deep-copies documents itself, e.g.
+    for offset rendering).
+    """
+    global _pdf_template
+    with _pdf_template_lock:
+        if _pdf_template is None:
+            from fpdf import FPDF
+
+            regular_font = _FONTS_DIR / "DejaVuSans.ttf"
+            bold_font = _FONTS_DIR / "DejaVuSans-Bold.ttf"
+            if not regular_font.exists() or not bold_font.exists():
+                raise FileNotFoundError("PDF fonts are missing from backend/app/assets/fonts")
+
+            template = FPDF(format="A4")
+            template.set_auto_page_break(auto=True, margin=15)
+            template.add_font("DejaVu", "", str(regular_font))
+            template.add_font("DejaVu", "B", str(bold_font))
+            _pdf_template = template
+        return copy.deepcopy(_pdf_template)
 
 
 def generate_pdf(cv: TailoredCV, cover_letter: Optional[CoverLetter] = None) -> bytes:
@@ -270,53 +310,36 @@ def generate_pdf(cv: TailoredCV, cover_letter: Optional[CoverLetter] = None) ->
     Returns:
         PDF file content as bytes
     """
-    from fpdf import FPDF
-    from pathlib import Path
-
-    fonts_dir = Path(__file__).resolve().parents[1] / "assets" / "fonts"
-    regular_font = fonts_dir / "DejaVuSans.ttf"
-    bold_font = fonts_dir / "DejaVuSans-Bold.ttf"
-    if not regular_font.exists() or not bold_font.exists():
-        raise FileNotFoundError("PDF fonts are missing from backend/app/assets/fonts")
-
-    pdf = FPDF(format="A4")
-    pdf.set_auto_page_break(auto=True, margin=15)
+    pdf = _new_pdf()
     pdf.add_page()
-    pdf.add_font("DejaVu", "", str(regular_font), uni=True)
-    pdf.add_font("DejaVu", "B", str(bold_font), uni=True)
 
     def add_centered(text: str, size: int, style: str = "") -> None:
         pdf.set_font("DejaVu", style, size)
-        pdf.cell(0, 8, text, ln=True, align="C")
+        pdf.cell(0, 8, text, new_x="LMARGIN", new_y="NEXT", align="C")
 
     def add_section(title: str) -> None:
         pdf.ln(2)
         pdf.set_font("DejaVu", "B", 12)
-        pdf.cell(0, 7, title, ln=True)
+        pdf.cell(0, 7, title, new_x="LMARGIN", new_y="NEXT")
 
     def add_paragraph(text: str) -> None:
         pdf.set_font("DejaVu", "", 10)
-        pdf.multi_cell(0, 5, text)
+        pdf.multi_cell(0, 5, text, new_x="LMARGIN", new_y="NEXT")
 
     def add_bullets(items: list[str]) -> None:
-        pdf.set_font("DejaVu", "", 10)
-        for item in items:
-            pdf.multi_cell(0, 5, f"- {item}")
+        # One multi_cell for the whole list; each "\n" starts a new line
+        if items:
+            pdf.set_font("DejaVu", "", 10)
+            pdf.multi_cell(0, 5, "\n".join(f"- {item}" for item in items), new_x="LMARGIN", new_y="NEXT")
 
     # Header
     add_centered(cv.header.name, 18, "B")
     add_centered(cv.header.title, 12)
 
-    contact_parts = []
-    if cv.header.contact.get("email"):
-        contact_parts.append(cv.header.contact["email"])
-    if cv.header.contact.get("phone"):
-        contact_parts.append(cv.header.contact["phone"])
-    if cv.header.contact.get("location"):
-        contact_parts.append(cv.header.contact["location"])
+    contact_parts = _contact_parts(cv.header.contact)
     if contact_parts:
         pdf.set_font("DejaVu", "", 9)
-        pdf.multi_cell(0, 5, " | ".join(contact_parts), align="C")
+        pdf.multi_cell(0, 5, " | ".join(contact_parts), align="C", new_x="LMARGIN", new_y="NEXT")
 
     # Summary
     add_section("Summary")
@@ -327,10 +350,10 @@ def generate_pdf(cv: TailoredCV, cover_letter: Optional[CoverLetter] = None) ->
         add_section("Experience")
         for exp in cv.experience:
             pdf.set_font("DejaVu", "B", 11)
-            pdf.cell(0, 6, exp.title, ln=True)
+            pdf.cell(0, 6, exp.title, new_x="LMARGIN", new_y="NEXT")
             pdf.set_font("DejaVu", "", 10)
             location_str = f" | {exp.location}" if exp.location else ""
-            pdf.cell(0, 5, f"{exp.company} | {exp.dates}{location_str}", ln=True)
+            pdf.cell(0, 5, f"{exp.company} | {exp.dates}{location_str}", new_x="LMARGIN", new_y="NEXT")
             add_bullets([bullet.text for bullet in exp.bullets])
             pdf.ln(1)
 
@@ -350,7 +373,7 @@ def generate_pdf(cv: TailoredCV, cover_letter: Optional[CoverLetter] = None) ->
         for edu in cv.education:
             pdf.set_font("DejaVu", "B", 10)
             year_str = f" ({edu.year})" if edu.year else ""
-            pdf.cell(0, 5, f"{edu.degree} in {edu.field}{year_str}", ln=True)
+            pdf.cell(0, 5, f"{edu.degree} in {edu.field}{year_str}", new_x="LMARGIN", new_y="NEXT")
             add_paragraph(edu.institution)
             add_bullets(edu.highlights)
             pdf.ln(1)
@@ -367,7 +390,7 @@ def generate_pdf(cv: TailoredCV, cover_letter: Optional[CoverLetter] = None) ->
         add_section("Projects")
         for proj in cv.projects:
             pdf.set_font("DejaVu", "B", 10)
-            pdf.cell(0, 5, proj.name, ln=True)
+            pdf.cell(0, 5, proj.name, new_x="LMARGIN", new_y="NEXT")
             add_paragraph(proj.description)
             if proj.technologies:
                 add_paragraph(f"Technologies: {', '.join(proj.technologies)}")
@@ -382,7 +405,6 @@ def generate_pdf(cv: TailoredCV, cover_letter: Optional[CoverLetter] = None) ->
         add_paragraph(cover_letter.fit_narrative)
         add_paragraph(cover_letter.closing)
 
-    pdf_bytes = pdf.output(dest="S")
-    if isinstance(pdf_bytes, str):
-        pdf_bytes = pdf_bytes.encode("latin-1")
-    return pdf_bytes
+    # fpdf2 assembles the document into a bytearray; hand it over without
+    # another copy (the router streams it in memoryview chunks)
+    return bytes(pdf.output())
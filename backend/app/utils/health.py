@@ -0,0 +1,38 @@
+"""
+Pure ASGI health-check responder.
+
+Load balancers and uptime monitors poll the health endpoint constantly, so it
+is answered before routing, without building Request/Response objects.
+"""
+import json
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+HEALTH_PATHS = frozenset({"/health", "/api/health"})
+
+
+class HealthCheckMiddleware:
+    """Answer GET/HEAD health checks with a pre-serialized JSON body."""
+
+    def __init__(self, app: ASGIApp, payload: dict, paths: frozenset[str] = HEALTH_PATHS):
+        self.app = app
+        self.paths = paths
+        self.body = json.dumps(payload, separators=(",", ":")).encode()
+        self.headers = [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(self.body)).encode()),
+        ]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["path"] not in self.paths
+            or scope["method"] not in ("GET", "HEAD")
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        await send({"type": "http.response.start", "status": 200, "headers": self.headers})
+        body = b"" if scope["method"] == "HEAD" else self.body
+        await send({"type": "http.response.body", "body": body})
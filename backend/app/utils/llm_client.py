@@ -1,48 +1,195 @@
 """
 Gemini API wrapper for structured output generation.
 """
+import asyncio
 import json
-import google.generativeai as genai
-from typing import Type, TypeVar, Optional
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Awaitable, Callable, Iterable, Type, TypeVar, Optional
 from pydantic import BaseModel
 import logging
+import random
+import orjson
 
-from ..config import get_settings
+from ..config import settings
+from .cache import LRUCache, content_key
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T", bound=BaseModel)
 
+_json_decoder = json.JSONDecoder()
+
+# Per-call override for structured calls: Gemini's JSON mode always replies
+# with bare, well-formed JSON (no code fences or prose)
+_JSON_MODE = {"response_mime_type": "application/json"}
+
+
+def extract_json_object(text: str) -> Optional[dict]:
+    """
+    Parse the first JSON object embedded in a free-form LLM reply.
+
+    The object is located with a single forward scan; a trailing code fence
+    is dropped and the rest decoded with orjson. If the model added chatter
+    after the object, raw_decode parses just the object and ignores the rest.
+
+    Returns:
+        The decoded object, or None if the reply contains no '{'.
+
+    Raises:
+        ValueError: If the object is malformed.
+    """
+    start = text.find("{")
+    if start < 0:
+        return None
+    try:
+        return orjson.loads(text[start:].rstrip().removesuffix("```"))
+    except orjson.JSONDecodeError:
+        return _json_decoder.raw_decode(text, start)[0]
+
+
+def _is_transient(exc: Exception) -> bool:
+    """
+    True for errors worth retrying after a pause: Gemini quota errors
+    (ResourceExhausted, HTTP 429) and overload (ServiceUnavailable, 503).
+    """
+    return getattr(exc, "code", None) in (429, 503)
+
+
+def _genai():
+    """
+    Import the Gemini SDK on first use.
+
+    google.generativeai accounts for more than half of the application's
+    import time, so it is only loaded once an LLM client is actually needed.
+    """
+    import google.generativeai as genai
+    return genai
+
+
+_STRUCTURED_PROMPT = """You are an expert CV/resume analyzer and writer.
+
+OUTPUT FORMAT:
+Respond with valid JSON matching this schema:
+```json
+{schema}
+```
+
+INSTRUCTION:
+{instruction}{context}
+
+Respond ONLY with the JSON object, no additional text."""
+
+_CONTEXT_BLOCK = "\n\nCONTEXT:\n{}"
+
+
+@lru_cache(maxsize=64)
+def _schema_json(response_model: Type[BaseModel]) -> str:
+    """Compact JSON schema for a response model, built once per model."""
+    schema = LLMClient._strip_schema_descriptions(response_model.model_json_schema())
+    return orjson.dumps(schema).decode()
+
+
+@dataclass(slots=True)
+class LLMStats:
+    """In-process counters for the reply cache and Gemini calls."""
+
+    cache_hits: int = 0
+    cache_misses: int = 0
+    shared_replies: int = 0  # Served by an identical call already in flight
+    requests: int = 0
+    errors: int = 0
+    latency_total: float = 0.0
+    latency_max: float = 0.0
+    in_flight: int = 0
+    peak_in_flight: int = 0
+
+    def record_request(self, seconds: float, ok: bool) -> None:
+        self.requests += 1
+        self.errors += not ok
+        self.latency_total += seconds
+        self.latency_max = max(self.latency_max, seconds)
+
+    def snapshot(self) -> dict:
+        lookups = self.cache_hits + self.cache_misses + self.shared_replies
+        return {
+            "cache": {
+                "hits": self.cache_hits,
+                "misses": self.cache_misses,
+                "shared": self.shared_replies,
+                "hit_rate": round((lookups - self.cache_misses) / lookups, 3) if lookups else None,
+            },
+            "requests": {
+                "total": self.requests,
+                "errors": self.errors,
+                "mean_seconds": round(self.latency_total / self.requests, 3) if self.requests else None,
+                "max_seconds": round(self.latency_max, 3),
+            },
+            "in_flight": self.in_flight,
+            "peak_in_flight": self.peak_in_flight,
+        }
+
 
 class LLMClient:
     """Client for interacting with Gemini AI."""
     
     def __init__(self, api_key: Optional[str] = None):
         """Initialize the LLM client."""
-        settings = get_settings()
         self.api_key = api_key or settings.gemini_api_key
         self.model_name = settings.gemini_model
         self.max_retries = settings.max_retries
+        # Bounds outbound requests so bursts (batches, concurrent users)
+        # queue here instead of tripping Gemini's rate limits
+        self._semaphore = asyncio.Semaphore(max(settings.llm_concurrency, 1))
         
         if self.api_key:
-            genai.configure(api_key=self.api_key)
+            _genai().configure(api_key=self.api_key)
         
         self._model = None
+        self._system_models: dict[str, object] = {}
+        # Exact-match replies (model + system + prompt), so identical calls
+        # (e.g. re-tailoring the same CV to the same job) skip the round trip
+        self._responses: LRUCache[str] = LRUCache(
+            settings.llm_cache_size, settings.extraction_cache_ttl_seconds
+        )
+        # Replies still being generated, so identical concurrent calls share one
+        self._in_flight: dict[str, asyncio.Future[str]] = {}
+        self.stats = LLMStats()
+    
+    def _new_model(self, system_instruction: Optional[str] = None):
+        return _genai().GenerativeModel(
+            model_name=self.model_name,
+            generation_config={
+                "temperature": 0.1,  # Low temperature for consistent extraction
+                "top_p": 0.95,
+                "top_k": 40,
+            },
+            system_instruction=system_instruction,
+        )
     
     @property
     def model(self):
         """Get or create the generative model."""
         if self._model is None:
-            self._model = genai.GenerativeModel(
-                model_name=self.model_name,
-                generation_config={
-                    "temperature": 0.1,  # Low temperature for consistent extraction
-                    "top_p": 0.95,
-                    "top_k": 40,
-                }
-            )
+            self._model = self._new_model()
         return self._model
     
+    def _model_for(self, system: Optional[str]):
+        """
+        Get the model for a system instruction (one per distinct instruction).
+
+        Keeping static rules in the system instruction gives every call that
+        uses them an identical prompt prefix, which Gemini's implicit context
+        caching can reuse across requests.
+        """
+        if system is None:
+            return self.model
+        model = self._system_models.get(system)
+        if model is None:
+            model = self._system_models[system] = self._new_model(system)
+        return model
+    
     async def generate_structured(
         self,
         prompt: str,
@@ -52,73 +199,110 @@ class LLMClient:
         """
         Generate a structured response using Gemini's native JSON mode.
 
-        Uses response_schema for faster, more reliable structured output.
+        JSON mode guarantees well-formed JSON; the schema itself still goes in
+        the prompt, as Gemini's response_schema subset can't express these
+        models (nullable unions, $defs references, defaults).
+        """
+        full_prompt = self._build_prompt(prompt, _schema_json(response_model), context)
+
+        parsed: Optional[T] = None
+
+        async def generate_valid() -> str:
+            nonlocal parsed
+            for attempt in range(self.max_retries):
+                try:
+                    response = await self._generate(full_prompt, generation_config=_JSON_MODE)
+                    # Only replies that parse are returned (and so cached)
+                    parsed = self._parse_response(response, response_model)
+                    return response
+                except Exception as e:
+                    logger.warning(f"Attempt {attempt + 1} failed: {e}")
+                    # Transient errors were already retried with backoff in _generate
+                    if _is_transient(e) or attempt == self.max_retries - 1:
+                        raise
+
+            raise RuntimeError("Failed to generate structured response")
+
+        response = await self._single_flight(self._response_key(full_prompt), generate_valid)
+        # Callers served from the cache or another call's reply parse their own copy
+        return parsed if parsed is not None else self._parse_response(response, response_model)
+    
+    def _response_key(self, prompt: str, system: Optional[str] = None) -> str:
+        return content_key(self.model_name, system or "", prompt)
+    
+    async def _generate(
+        self,
+        prompt: str,
+        system: Optional[str] = None,
+        generation_config: Optional[dict] = None
+    ) -> str:
         """
-        schema = response_model.model_json_schema()
-        full_prompt = self._build_prompt(prompt, schema, context)
+        Generate raw text response from Gemini.
 
+        Rate-limited or overloaded requests are retried with jittered
+        exponential backoff, so concurrent callers don't retry in lockstep;
+        the concurrency slot is released while waiting so other calls can go.
+        """
         for attempt in range(self.max_retries):
             try:
-                response = await self._generate(full_prompt)
-                parsed = self._parse_response(response, response_model)
-                return parsed
+                async with self._semaphore:
+                    response = await self._timed_call(self._model_for(system), prompt, generation_config)
+                return response.text
             except Exception as e:
-                logger.warning(f"Attempt {attempt + 1} failed: {e}")
-                if attempt == self.max_retries - 1:
+                if not _is_transient(e) or attempt == self.max_retries - 1:
                     raise
-
-        raise RuntimeError("Failed to generate structured response")
-    
-    async def _generate(self, prompt: str) -> str:
-        """Generate raw text response from Gemini."""
-        response = await self.model.generate_content_async(prompt)
-        return response.text
+                base_delay = settings.llm_retry_base_delay
+                delay = base_delay * 2 ** attempt + random.uniform(0, base_delay)
+                logger.warning(f"Gemini unavailable or rate limited, retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+        raise RuntimeError("Failed to generate response")
     
+    async def _timed_call(self, model, prompt: str, generation_config: Optional[dict]):
+        """Make one Gemini call, recording its latency and outcome in `stats`."""
+        stats = self.stats
+        stats.in_flight += 1
+        stats.peak_in_flight = max(stats.peak_in_flight, stats.in_flight)
+        start = time.perf_counter()
+        ok = False
+        try:
+            response = await model.generate_content_async(prompt, generation_config=generation_config)
+            ok = True
+            return response
+        finally:
+            stats.in_flight -= 1
+            stats.record_request(time.perf_counter() - start, ok)
+
     def _build_prompt(
         self,
         instruction: str,
-        schema: dict,
+        schema_json: str,
         context: Optional[str] = None
     ) -> str:
-        """Build a prompt requesting JSON output. Strips descriptions for smaller prompts."""
-        # Strip descriptions from schema to reduce prompt size
-        compact_schema = self._strip_schema_descriptions(schema)
-
-        prompt_parts = [
-            "You are an expert CV/resume analyzer and writer.",
-            "",
-            "INSTRUCTION:",
-            instruction,
-        ]
+        """
+        Build a prompt requesting JSON output.
 
-        if context:
-            prompt_parts.extend([
-                "",
-                "CONTEXT:",
-                context,
-            ])
-
-        prompt_parts.extend([
-            "",
-            "OUTPUT FORMAT:",
-            "Respond with valid JSON matching this schema:",
-            "```json",
-            json.dumps(compact_schema),
-            "```",
-            "",
-            "Respond ONLY with the JSON object, no additional text.",
-        ])
-
-        return "\n".join(prompt_parts)
+        The preamble and schema come first and are identical for every call
+        with the same response model, so Gemini's implicit context caching
+        can reuse that prefix; the per-call instruction and context follow.
+        """
+        return _STRUCTURED_PROMPT.format(
+            schema=schema_json,
+            instruction=instruction,
+            context=_CONTEXT_BLOCK.format(context) if context else "",
+        )
 
     @staticmethod
     def _strip_schema_descriptions(schema: dict) -> dict:
-        """Remove description fields from schema to reduce token count."""
+        """Remove description annotations from schema to reduce token count.
+
+        Only string values are dropped, so a property that is itself named
+        "description" (e.g. a project's description) stays in the schema.
+        """
         if isinstance(schema, dict):
             return {
                 k: LLMClient._strip_schema_descriptions(v)
                 for k, v in schema.items()
-                if k != "description"
+                if not (k == "description" and isinstance(v, str))
             }
         elif isinstance(schema, list):
             return [LLMClient._strip_schema_descriptions(item) for item in schema]
@@ -136,19 +320,71 @@ class LLMClient:
             text = text[:-3]
         text = text.strip()
         
-        # Parse JSON
-        data = json.loads(text)
-        
-        # Validate with Pydantic
-        return model.model_validate(data)
+        # Parse and validate in a single pydantic-core pass
+        return model.model_validate_json(text)
     
-    async def generate_text(self, prompt: str, context: Optional[str] = None) -> str:
-        """Generate free-form text response."""
+    async def generate_text(
+        self,
+        prompt: str,
+        context: Optional[str] = None,
+        system: Optional[str] = None
+    ) -> str:
+        """
+        Generate free-form text response.
+
+        Pass instructions that are the same on every call as `system` and
+        only the per-request data as `prompt`.
+        """
         full_prompt = prompt
         if context:
             full_prompt = f"{prompt}\n\nContext:\n{context}"
         
-        return await self._generate(full_prompt)
+        return await self._single_flight(
+            self._response_key(full_prompt, system),
+            lambda: self._generate(full_prompt, system),
+        )
+
+    async def _single_flight(self, key: str, generate: Callable[[], Awaitable[str]]) -> str:
+        """
+        Return the cached reply for `key`, or run `generate` to produce it.
+
+        Concurrent callers with the same key await the first caller's reply
+        instead of issuing their own Gemini call. If that caller is cancelled,
+        a waiter takes over; if it fails, every waiter sees the same error.
+        """
+        while True:
+            cached = self._responses.get(key)
+            if cached is not None:
+                self.stats.cache_hits += 1
+                return cached
+            pending = self._in_flight.get(key)
+            if pending is None:
+                break
+            self.stats.shared_replies += 1
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise  # This waiter was cancelled, not the generating call
+
+        self.stats.cache_misses += 1
+        future: asyncio.Future[str] = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            response = await generate()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved; there may be no waiters
+            raise
+        finally:
+            del self._in_flight[key]
+
+        self._responses.set(key, response)
+        future.set_result(response)
+        return response
 
 
 # Global client instance
@@ -163,6 +399,16 @@ def get_llm_client() -> LLMClient:
     return _client
 
 
+def warm_up(response_models: Iterable[Type[BaseModel]]) -> None:
+    """
+    Build the Gemini model and the given response schemas ahead of the first
+    request. Blocking (imports the SDK), so run it in a thread.
+    """
+    get_llm_client().model
+    for response_model in response_models:
+        _schema_json(response_model)
+
+
 def set_llm_api_key(api_key: str):
     """Set API key for the LLM client."""
     global _client
@@ -62,6 +62,18 @@ class TestHealthEndpoints:
         assert data["status"] == "healthy"
         assert "version" in data
 
+    async def test_api_health_alias(self, client):
+        resp = await client.get("/api/health", headers={"Origin": "http://localhost:5173"})
+        assert resp.status_code == 200
+        assert resp.headers["content-type"] == "application/json"
+        assert resp.headers["access-control-allow-origin"] == "http://localhost:5173"
+        assert resp.json()["status"] == "healthy"
+
+    async def test_llm_stats(self, client):
+        resp = await client.get("/debug/llm-stats")
+        assert resp.status_code == 200
+        assert set(resp.json()) == {"cache", "requests", "in_flight", "peak_in_flight"}
+
     async def test_root(self, client):
         resp = await client.get("/")
         assert resp.status_code == 200
@@ -113,6 +125,29 @@ class TestTailorEndpoint:
         assert resp.status_code == 422
 
 
+class TestTailorBatchEndpoint:
+    async def test_items_returned_in_order_with_errors_isolated(self, client):
+        with patch("app.services.tailoring_pipeline.run_tailoring_pipeline", new_callable=AsyncMock) as mock_pipeline:
+            mock_pipeline.side_effect = [
+                _make_tailor_result(),
+                TailoringError("FABRICATION_DETECTED", "Fake company", ["Company X not found"]),
+            ]
+            resp = await client.post("/api/tailor/batch", json={"requests": [
+                {"job_description": JOB_DESCRIPTION, "original_cv": CV_TEXT},
+                {"job_description": JOB_DESCRIPTION + " Remote.", "original_cv": CV_TEXT + " "},
+            ]})
+        assert resp.status_code == 200
+        items = resp.json()["items"]
+        assert items[0]["result"]["tailored_cv"]["header"]["name"] == "Jane Doe"
+        assert items[0]["error"] is None
+        assert items[1]["result"] is None
+        assert items[1]["error"]["error"] == "FABRICATION_DETECTED"
+
+    async def test_empty_batch_rejected(self, client):
+        resp = await client.post("/api/tailor/batch", json={"requests": []})
+        assert resp.status_code == 422
+
+
 # ===================================================================
 # Tailor streaming endpoint
 # ===================================================================
@@ -160,6 +195,38 @@ class TestUploadEndpoints:
         assert resp.status_code == 400
         assert resp.json()["detail"]["error"] == "INVALID_FILE_TYPE"
 
+    async def test_upload_text_file(self, client):
+        with patch("app.routers.tailor.run_tailoring_pipeline", new_callable=AsyncMock) as mock_pipeline:
+            mock_pipeline.return_value = _make_tailor_result()
+            resp = await client.post(
+                "/api/tailor/upload",
+                data={"job_description": JOB_DESCRIPTION},
+                files={"cv_file": ("resume.txt", CV_TEXT.encode(), "text/plain")},
+            )
+        assert resp.status_code == 200
+        tailor_req = mock_pipeline.call_args.args[0]
+        assert "Jane Doe" in tailor_req.original_cv
+
+    async def test_repeat_upload_reuses_parsed_text(self, client):
+        from app.routers import tailor
+
+        tailor._upload_cache.clear()
+        with patch("app.routers.tailor.run_tailoring_pipeline", new_callable=AsyncMock) as mock_pipeline, \
+                patch("app.routers.tailor.extract_text", wraps=tailor.extract_text) as mock_extract:
+            mock_pipeline.return_value = _make_tailor_result()
+            for name in ("resume.txt", "copy.txt"):
+                resp = await client.post(
+                    "/api/tailor/upload",
+                    data={"job_description": JOB_DESCRIPTION},
+                    files={"cv_file": (name, CV_TEXT.encode(), "text/plain")},
+                )
+                assert resp.status_code == 200
+        tailor._upload_cache.clear()
+
+        mock_extract.assert_called_once()
+        first, second = (call.args[0] for call in mock_pipeline.call_args_list)
+        assert first.original_cv == second.original_cv
+
     async def test_upload_stream_invalid_file(self, client):
         resp = await client.post(
             "/api/tailor/upload/stream",
@@ -207,6 +274,43 @@ class TestExportEndpoint:
         )
         assert resp.status_code == 200
         assert "text/markdown" in resp.headers["content-type"]
+        assert int(resp.headers["content-length"]) == len(resp.content)
+
+    async def test_export_docx(self, client):
+        result = _make_tailor_result()
+        resp = await client.post(
+            "/api/export/docx",
+            json=result.model_dump(),
+        )
+        assert resp.status_code == 200
+        assert resp.content[:2] == b"PK"  # DOCX is a zip archive
+        assert int(resp.headers["content-length"]) == len(resp.content)
+
+    async def test_export_pdf(self, client):
+        result = _make_tailor_result()
+        resp = await client.post(
+            "/api/export/pdf",
+            json=result.model_dump(),
+        )
+        assert resp.status_code == 200
+        assert resp.content[:4] == b"%PDF"
+        assert int(resp.headers["content-length"]) == len(resp.content)
+
+    async def test_repeat_export_reuses_rendered_file(self, client):
+        from app.routers import tailor
+
+        tailor._export_cache.clear()
+        result = _make_tailor_result()
+        with patch("app.routers.tailor.generate_docx", wraps=tailor.generate_docx) as mock_docx:
+            first = await client.post("/api/export/docx", json=result.model_dump())
+            second = await client.post("/api/export/docx", json=result.model_dump())
+            result.tailored_cv.summary = "Changed summary."
+            third = await client.post("/api/export/docx", json=result.model_dump())
+        tailor._export_cache.clear()
+
+        assert first.content == second.content
+        assert third.status_code == 200
+        assert mock_docx.call_count == 2
 
     async def test_export_invalid_format(self, client):
         result = _make_tailor_result()
@@ -0,0 +1,106 @@
+"""
+Tests for the in-process LRU cache and the extraction caches built on it.
+"""
+import io
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.utils.cache import LRUCache, content_key, stream_key
+from app.services import cv_extractor, job_extractor
+from tests.conftest import make_cv_facts, make_job_requirements, CV_TEXT, JOB_DESCRIPTION
+
+
+# ===================================================================
+# LRUCache
+# ===================================================================
+
+class TestLRUCache:
+    def test_get_set(self):
+        cache = LRUCache(maxsize=2)
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+        assert cache.get("missing") is None
+
+    def test_evicts_least_recently_used(self):
+        cache = LRUCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # "b" is now least recently used
+        cache.set("c", 3)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+    def test_ttl_expiry(self):
+        cache = LRUCache(maxsize=2, ttl=10)
+        with patch("app.utils.cache.time.monotonic", return_value=100.0):
+            cache.set("a", 1)
+        with patch("app.utils.cache.time.monotonic", return_value=111.0):
+            assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_zero_size_disables(self):
+        cache = LRUCache(maxsize=0)
+        cache.set("a", 1)
+        assert cache.get("a") is None
+
+    def test_content_key_is_stable(self):
+        assert content_key("cv text") == content_key("cv text")
+        assert content_key("cv text") != content_key("other text")
+        assert content_key("ab", "c") != content_key("a", "bc")
+
+    def test_stream_key_hashes_content_and_rewinds(self):
+        stream = io.BytesIO(b"%PDF-1.4 cv bytes")
+        key = stream_key(stream, ".pdf", chunk_size=4)
+        assert stream.tell() == 0
+        assert key == stream_key(io.BytesIO(b"%PDF-1.4 cv bytes"), ".pdf")
+        assert key != stream_key(io.BytesIO(b"%PDF-1.4 cv bytes"), ".docx")
+        assert key != stream_key(io.BytesIO(b"other bytes"), ".pdf")
+
+
+# ===================================================================
+# Extraction caching
+# ===================================================================
+
+def _mock_client(result):
+    client = MagicMock()
+    client.generate_structured = AsyncMock(return_value=result)
+    return client
+
+
+class TestExtractionCache:
+    @pytest.fixture(autouse=True)
+    def _clear_caches(self):
+        cv_extractor._cv_cache.clear()
+        job_extractor._job_cache.clear()
+        yield
+        cv_extractor._cv_cache.clear()
+        job_extractor._job_cache.clear()
+
+    async def test_cv_extraction_cached_by_content(self):
+        client = _mock_client(make_cv_facts())
+        with patch("app.services.cv_extractor.get_llm_client", return_value=client):
+            first = await cv_extractor.extract_cv_facts(CV_TEXT)
+            second = await cv_extractor.extract_cv_facts(CV_TEXT)
+
+        assert client.generate_structured.await_count == 1
+        assert first == second
+        assert first is not second
+
+    async def test_cv_extraction_cache_bypass(self):
+        client = _mock_client(make_cv_facts())
+        with patch("app.services.cv_extractor.get_llm_client", return_value=client):
+            await cv_extractor.extract_cv_facts(CV_TEXT)
+            await cv_extractor.extract_cv_facts(CV_TEXT, use_cache=False)
+
+        assert client.generate_structured.await_count == 2
+
+    async def test_job_extraction_cached_by_content(self):
+        client = _mock_client(make_job_requirements())
+        with patch("app.services.job_extractor.get_llm_client", return_value=client):
+            first = await job_extractor.extract_job_requirements(JOB_DESCRIPTION)
+            first.must_have.clear()  # caller mutations must not leak into the cache
+            second = await job_extractor.extract_job_requirements(JOB_DESCRIPTION)
+
+        assert client.generate_structured.await_count == 1
+        assert second.must_have
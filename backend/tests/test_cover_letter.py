@@ -0,0 +1,51 @@
+"""
+Tests for cover letter generation — LLM reply parsing and template fallback.
+"""
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.services.cover_letter import generate_cover_letter
+from tests.conftest import make_cv_facts, make_job_requirements, make_mapping
+
+
+def _mock_client(reply: str) -> MagicMock:
+    client = MagicMock()
+    client.generate_text = AsyncMock(return_value=reply)
+    return client
+
+
+class TestGenerateCoverLetter:
+    @pytest.mark.anyio
+    async def test_llm_reply_parsed(self):
+        reply = (
+            '{"hook": "Hello TechCo.", "value_proposition": "I ship.", '
+            '"fit_narrative": "Great fit.", "closing": "Thanks."}'
+        )
+        client = _mock_client(reply)
+        with patch("app.services.cover_letter.get_llm_client", return_value=client):
+            letter = await generate_cover_letter(make_job_requirements(), make_cv_facts(), make_mapping())
+
+        assert letter.hook == "Hello TechCo."
+        prompt = client.generate_text.call_args.args[0]
+        assert "Jane Doe" in prompt
+        assert "Reduced latency by 30%" in prompt
+
+    @pytest.mark.anyio
+    async def test_missing_or_non_string_paragraphs_become_empty(self):
+        client = _mock_client('{"hook": "Hello.", "closing": null, "fit_narrative": 3}')
+        with patch("app.services.cover_letter.get_llm_client", return_value=client):
+            letter = await generate_cover_letter(make_job_requirements(), make_cv_facts(), make_mapping())
+
+        assert letter.hook == "Hello."
+        assert letter.value_proposition == letter.fit_narrative == letter.closing == ""
+        assert letter.model_dump()["closing"] == ""
+
+    @pytest.mark.anyio
+    async def test_falls_back_to_template_without_json(self):
+        client = _mock_client("Sorry, I can't help with that.")
+        with patch("app.services.cover_letter.get_llm_client", return_value=client):
+            letter = await generate_cover_letter(make_job_requirements(), make_cv_facts(), make_mapping())
+
+        assert "Senior Python Developer" in letter.hook
+        assert "TechCo" in letter.hook
+        assert "Reduced latency by 30%" in letter.value_proposition
@@ -0,0 +1,110 @@
+"""
+Tests for CV facts extraction — section splitting and per-section extraction.
+
+The LLM client is mocked; no API calls are made.
+"""
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.config import settings
+from app.models.cv_facts import CVFacts, Experience, ExperienceSection, InferredSkill, Skills
+from app.services import cv_extractor
+from app.services.cv_extractor import _calculate_duration, _split_cv_sections
+from tests.conftest import make_cv_facts, CV_TEXT
+
+
+LONG_CV = """Jane Doe
+jane@example.com
+
+## Work Experience
+Software Engineer, Acme Corp (2020-01 - Present)
+- Built REST APIs with Python and FastAPI
+
+Education:
+BSc Computer Science, MIT (2019)
+
+SKILLS
+Python, FastAPI, Docker
+"""
+
+
+class TestSplitSections:
+    def test_splits_at_headings(self):
+        sections = _split_cv_sections(LONG_CV)
+        assert list(sections) == ["header", "experience", "education", "skills"]
+        assert sections["header"] == "Jane Doe\njane@example.com"
+        assert sections["experience"].startswith("## Work Experience\nSoftware Engineer")
+        assert sections["skills"] == "SKILLS\nPython, FastAPI, Docker"
+
+    def test_repeated_sections_joined(self):
+        sections = _split_cv_sections("Experience\nA\n\nSkills\nB\n\nEmployment\nC")
+        assert sections["experience"] == "Experience\nA\n\nEmployment\nC"
+
+    def test_heading_words_inside_lines_ignored(self):
+        sections = _split_cv_sections("Ten years of experience in skills training")
+        assert list(sections) == ["header"]
+
+
+class TestCalculateDuration:
+    def test_year_month_dates(self):
+        assert _calculate_duration("2019-03", "2020-01") == 10
+
+    def test_year_only_dates_read_as_january(self):
+        assert _calculate_duration("2019", "2021") == 24
+        assert _calculate_duration("2019", "2019-07") == 6
+
+    def test_unparseable_date_counts_zero(self):
+        assert _calculate_duration("March 2019", "2020-01") == 0
+
+
+class TestSectionExtraction:
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self):
+        cv_extractor._cv_cache.clear()
+        yield
+        cv_extractor._cv_cache.clear()
+
+    @staticmethod
+    def _client():
+        facts = make_cv_facts(experience=[], skills=Skills(explicitly_listed=["Python"]))
+        section = ExperienceSection(
+            experience=[Experience(id="exp-1", company="Acme Corp", title="Software Engineer",
+                                   start_date="2020-01", end_date="Present")],
+            inferred_skills=[InferredSkill(skill="REST APIs", evidence_source="exp-1")],
+        )
+
+        async def generate_structured(prompt, response_model):
+            return facts if response_model is CVFacts else section
+
+        client = MagicMock()
+        client.generate_structured = AsyncMock(side_effect=generate_structured)
+        return client
+
+    @pytest.mark.anyio
+    async def test_long_cv_extracted_per_section_and_merged(self):
+        client = self._client()
+        short_threshold = settings.model_copy(update={"cv_section_extraction_min_chars": 10})
+        with patch("app.services.cv_extractor.get_llm_client", return_value=client), \
+                patch("app.services.cv_extractor.settings", short_threshold):
+            result = await cv_extractor.extract_cv_facts(LONG_CV)
+
+        assert client.generate_structured.await_count == 2
+        prompts = {call.kwargs["response_model"]: call.kwargs["prompt"]
+                   for call in client.generate_structured.await_args_list}
+        assert "Acme Corp" in prompts[ExperienceSection]
+        assert "Acme Corp" not in prompts[CVFacts]
+        assert "SKILLS" in prompts[CVFacts]
+
+        assert [exp.company for exp in result.experience] == ["Acme Corp"]
+        assert result.experience[0].duration_months is not None
+        assert result.skills.explicitly_listed == ["Python"]
+        assert [s.skill for s in result.skills.inferred_from_experience] == ["REST APIs"]
+
+    @pytest.mark.anyio
+    async def test_short_cv_uses_single_call(self):
+        client = self._client()
+        with patch("app.services.cv_extractor.get_llm_client", return_value=client):
+            await cv_extractor.extract_cv_facts(CV_TEXT)
+
+        client.generate_structured.assert_awaited_once()
+        assert client.generate_structured.await_args.kwargs["response_model"] is CVFacts
@@ -0,0 +1,217 @@
+"""
+Tests for the CV generator — batched bullet rewrites and change logging.
+
+The LLM client is mocked; no API calls are made.
+"""
+import asyncio
+import json
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.models.cv_facts import (
+    Achievement, Certification, Experience, ExtractedFacts, Project, ResponsibilityFact,
+)
+from app.services import cv_generator
+from app.services.cv_generator import CVGenerator
+from tests.conftest import make_cv_facts, make_job_requirements, make_mapping
+
+
+@pytest.fixture(autouse=True)
+def _clear_rewrite_cache():
+    cv_generator._rewrite_cache.clear()
+    yield
+    cv_generator._rewrite_cache.clear()
+
+
+def _experience(company: str, bullets: list[str]) -> Experience:
+    return Experience(
+        company=company,
+        title="Engineer",
+        start_date="2020-01",
+        end_date="2021-01",
+        responsibilities=[
+            ResponsibilityFact(original_text=b, extracted_facts=ExtractedFacts(action=b)) for b in bullets
+        ],
+    )
+
+
+def _mock_client():
+    """Client whose calls take a moment and report peak concurrency."""
+    client = MagicMock()
+    client.in_flight = client.peak = 0
+
+    async def generate_text(prompt, system=None):
+        client.in_flight += 1
+        client.peak = max(client.peak, client.in_flight)
+        await asyncio.sleep(0.01)
+        client.in_flight -= 1
+        if "ORIGINAL BULLETS:" not in prompt:
+            return "Tailored summary."
+        numbered = prompt.split("ORIGINAL BULLETS:\n", 1)[1].split("\n\n", 1)[0].splitlines()
+        return json.dumps({"rewrites": [
+            {
+                "idx": idx,
+                "rewritten": f"{line.split('. ', 1)[1]} (tailored)",
+                "keywords_used": [],
+                "change_type": "rewrite",
+                "explanation": "aligned",
+            }
+            for idx, line in enumerate(numbered, 1)
+        ]})
+
+    client.generate_text = generate_text
+    return client
+
+
+class TestGenerateExperience:
+    @pytest.mark.anyio
+    async def test_rewrites_batched_per_experience_and_keep_cv_order(self):
+        cv_facts = make_cv_facts(experience=[
+            _experience("Acme", ["Wrote code", "Fixed bugs"]),
+            _experience("Globex", ["Ran meetings"]),
+        ])
+        client = _mock_client()
+        with patch("app.services.cv_generator.get_llm_client", return_value=client):
+            generator = CVGenerator(make_job_requirements(), cv_facts, make_mapping())
+            cv, changes_log, borderline_items = await generator.generate()
+
+        # Summary + one rewrite call per experience, all in flight together
+        assert client.peak == 3
+        assert cv.summary == "Tailored summary."
+        assert [b.text for b in cv.experience[0].bullets] == ["Wrote code (tailored)", "Fixed bugs (tailored)"]
+        assert [b.text for b in cv.experience[1].bullets] == ["Ran meetings (tailored)"]
+
+        rewrites = [c.original for c in changes_log if c.section == "experience" and c.change_type == "rewrite"]
+        assert rewrites == ["Wrote code", "Fixed bugs", "Ran meetings"]
+        assert [c.section for c in changes_log][:2] == ["header", "summary"]
+        assert [b.original_evidence for b in borderline_items] == rewrites
+        # Bullets kept their CV order; rewording alone isn't a reorder
+        assert not [c for c in changes_log if c.change_type == "reorder"]
+
+    @pytest.mark.anyio
+    async def test_high_scoring_bullets_not_rewritten(self):
+        cv_facts = make_cv_facts(experience=[_experience("Acme", ["Wrote code"])])
+        cv_facts.experience[0].achievements.append(
+            Achievement(original_text="Cut Python API latency 30% saving $10k", quantified=True)
+        )
+        requirements = make_job_requirements()
+        requirements.ats_keywords.high_priority[:] = ["Python", "API", "latency"]
+        client = _mock_client()
+        with patch("app.services.cv_generator.get_llm_client", return_value=client):
+            generator = CVGenerator(requirements, cv_facts, make_mapping())
+            cv, changes_log, _ = await generator.generate()
+
+        texts = [b.text for b in cv.experience[0].bullets]
+        assert texts == ["Cut Python API latency 30% saving $10k", "Wrote code (tailored)"]
+        assert [c.original for c in changes_log if c.change_type == "reorder"] == ["Original order for Acme"]
+
+    @pytest.mark.anyio
+    async def test_quantified_bullets_with_keywords_not_rewritten(self):
+        cv_facts = make_cv_facts(experience=[_experience("Acme", ["Built 3 Python APIs", "Wrote Python code"])])
+        requirements = make_job_requirements()
+        requirements.ats_keywords.high_priority[:] = ["Python", "API"]
+        client = _mock_client()
+        with patch("app.services.cv_generator.get_llm_client", return_value=client):
+            generator = CVGenerator(requirements, cv_facts, make_mapping())
+            cv, _, _ = await generator.generate()
+
+        texts = [b.text for b in cv.experience[0].bullets]
+        assert texts == ["Built 3 Python APIs", "Wrote Python code (tailored)"]
+        assert cv.experience[0].bullets[0].keywords_used == ["Python", "API"]
+
+    @pytest.mark.anyio
+    async def test_bullets_missing_from_reply_keep_original(self):
+        cv_facts = make_cv_facts(experience=[_experience("Acme", ["Wrote code", "Fixed bugs"])])
+        reply = json.dumps({"rewrites": [
+            {"idx": "2", "rewritten": "Fixed defects", "keywords_used": [], "change_type": "minimal"},
+        ]})
+        client = MagicMock()
+        client.generate_text = AsyncMock(side_effect=["Tailored summary.", reply])
+        with patch("app.services.cv_generator.get_llm_client", return_value=client):
+            generator = CVGenerator(make_job_requirements(), cv_facts, make_mapping())
+            cv, changes_log, borderline_items = await generator.generate()
+
+        assert [b.text for b in cv.experience[0].bullets] == ["Wrote code", "Fixed defects"]
+        assert [c.new for c in changes_log if c.section == "experience" and c.change_type == "rewrite"] == [
+            "Fixed defects"
+        ]
+        assert borderline_items == []  # "minimal" changes aren't flagged for review
+
+
+class TestRewriteCache:
+    @pytest.mark.anyio
+    async def test_repeat_generation_reuses_cached_rewrites(self):
+        client = _mock_client()
+        client.generate_text = AsyncMock(wraps=client.generate_text)
+        with patch("app.services.cv_generator.get_llm_client", return_value=client):
+            first = CVGenerator(make_job_requirements(), make_cv_facts(experience=[
+                _experience("Acme", ["Wrote code"]),
+            ]), make_mapping())
+            await first.generate()
+            second = CVGenerator(make_job_requirements(), make_cv_facts(experience=[
+                _experience("Globex", ["Fixed bugs", "Wrote code"]),
+            ]), make_mapping())
+            cv, changes_log, _ = await second.generate()
+
+        bullet_prompt = client.generate_text.await_args_list[-1].args[0]
+        assert "1. Fixed bugs\n" in bullet_prompt
+        assert "Wrote code" not in bullet_prompt
+        assert [b.text for b in cv.experience[0].bullets] == ["Fixed bugs (tailored)", "Wrote code (tailored)"]
+        rewrites = [c.original for c in changes_log if c.section == "experience" and c.change_type == "rewrite"]
+        assert rewrites == ["Fixed bugs", "Wrote code"]
+
+    @pytest.mark.anyio
+    async def test_cache_keyed_by_job_context(self):
+        client = _mock_client()
+        client.generate_text = AsyncMock(wraps=client.generate_text)
+        cv_facts = make_cv_facts(experience=[_experience("Acme", ["Wrote code"])])
+        with patch("app.services.cv_generator.get_llm_client", return_value=client):
+            await CVGenerator(make_job_requirements(), cv_facts, make_mapping()).generate()
+            await CVGenerator(
+                make_job_requirements(), cv_facts, make_mapping(), user_instructions="Be concise"
+            ).generate()
+
+        bullet_prompts = [c.args[0] for c in client.generate_text.await_args_list if "ORIGINAL BULLETS:" in c.args[0]]
+        assert len(bullet_prompts) == 2
+
+
+class TestGenerateSummary:
+    @pytest.mark.anyio
+    async def test_top_skills_padded_without_duplicates(self):
+        requirements = make_job_requirements()
+        requirements.ats_keywords.high_priority[:] = ["docker"]
+        client = MagicMock()
+        client.generate_text = AsyncMock(return_value="Tailored summary.")
+        with patch("app.services.cv_generator.get_llm_client", return_value=client):
+            generator = CVGenerator(requirements, make_cv_facts(), make_mapping())
+            await generator._generate_summary()
+
+        assert "- Top skills: Docker, Python, FastAPI\n" in client.generate_text.call_args.args[0]
+
+
+class TestCertificationsAndProjects:
+    @staticmethod
+    def _generator(**cv_overrides) -> CVGenerator:
+        requirements = make_job_requirements()
+        requirements.ats_keywords.high_priority[:] = ["Python"]
+        requirements.ats_keywords.medium_priority[:] = ["AWS"]
+        with patch("app.services.cv_generator.get_llm_client"):
+            return CVGenerator(requirements, make_cv_facts(**cv_overrides), make_mapping())
+
+    def test_relevant_certifications_first(self):
+        generator = self._generator(certifications=[
+            Certification(name="Scrum Master", issuer="Scrum.org"),
+            Certification(name="aws Solutions Architect", issuer="Amazon"),
+            Certification(name="Old Cert", issuer="X", status="expired"),
+        ])
+        assert [c.name for c in generator._generate_certifications()] == [
+            "aws Solutions Architect", "Scrum Master",
+        ]
+
+    def test_projects_kept_by_technology_or_description(self):
+        generator = self._generator(projects=[
+            Project(name="Site", description="Static website", technologies=["HTML"]),
+            Project(name="Bot", description="Chat bot", technologies=["python"]),
+            Project(name="Infra", description="Terraform modules for AWS"),
+        ])
+        assert [p.name for p in generator._generate_projects()] == ["Bot", "Infra"]
@@ -0,0 +1,67 @@
+"""
+Tests for document text extraction.
+"""
+import io
+import pytest
+from unittest.mock import patch
+from docx import Document
+from fpdf import FPDF
+
+from app.config import settings
+from app.utils.document_parser import (
+    clean_extracted_text, extract_text, extract_text_from_docx, extract_text_from_pdf,
+)
+
+
+def _make_pdf(pages: list[list[str]]) -> bytes:
+    pdf = FPDF()
+    pdf.set_font("Helvetica", size=11)
+    for lines in pages:
+        pdf.add_page()
+        for line in lines:
+            pdf.cell(0, 6, line, new_x="LMARGIN", new_y="NEXT")
+    return bytes(pdf.output())
+
+
+PDF = _make_pdf([
+    ["Jane Doe", "Experience", "Software Engineer, Acme Corp"],
+    ["Skills", "Python, FastAPI"],
+])
+
+
+class TestPdfExtraction:
+    @pytest.mark.parametrize("parser", ["pdfium", "pypdf2"])
+    def test_pages_extracted_with_either_parser(self, parser):
+        with patch("app.utils.document_parser.settings", settings.model_copy(update={"pdf_parser": parser})):
+            text = extract_text_from_pdf(PDF)
+
+        assert "\r" not in text
+        first, second = text.split("\n\n")
+        assert first.splitlines() == ["Jane Doe", "Experience", "Software Engineer, Acme Corp"]
+        assert second.splitlines() == ["Skills", "Python, FastAPI"]
+
+    def test_file_object_accepted(self):
+        assert extract_text(io.BytesIO(PDF), "resume.pdf") == extract_text_from_pdf(PDF)
+
+    def test_falls_back_to_pypdf2_without_pdfium(self):
+        with patch.dict("sys.modules", {"pypdfium2": None}):
+            text = extract_text_from_pdf(PDF)
+        assert clean_extracted_text(text).startswith("Jane Doe")
+
+    def test_invalid_pdf_raises_value_error(self):
+        with pytest.raises(ValueError, match="Could not parse PDF"):
+            extract_text_from_pdf(b"not a pdf")
+
+
+class TestDocxExtraction:
+    def test_paragraphs_then_table_rows(self):
+        doc = Document()
+        for text in ("Jane Doe", "   ", "Experience"):
+            doc.add_paragraph(text)
+        table = doc.add_table(rows=2, cols=3)
+        for cell, text in zip(table.rows[0].cells, (" Python ", "", "FastAPI")):
+            cell.text = text
+        buffer = io.BytesIO()
+        doc.save(buffer)
+
+        assert extract_text_from_docx(buffer.getvalue()) == "Jane Doe\nExperience\nPython | FastAPI"
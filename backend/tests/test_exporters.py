@@ -0,0 +1,90 @@
+"""
+Tests for the Markdown/DOCX/PDF exporters.
+"""
+import io
+from unittest.mock import patch
+
+from docx import Document
+from fpdf import FPDF
+
+from app.models.output import (
+    CoverLetter, TailoredCertification, TailoredEducation, TailoredExperience, TailoredExperienceBullet,
+)
+from app.utils import exporters
+from app.utils.exporters import generate_docx, generate_markdown, generate_pdf, iter_chunks
+from tests.conftest import make_tailored_cv
+
+
+def _cover_letter() -> CoverLetter:
+    return CoverLetter(
+        hook="Dear team,",
+        value_proposition="I build APIs.",
+        fit_narrative="Your stack is mine.",
+        closing="Best, Jane",
+    )
+
+
+def test_iter_chunks_yields_bytes():
+    chunks = list(iter_chunks(b"abcdefg", chunk_size=3))
+    assert chunks == [b"abc", b"def", b"g"]
+    assert all(type(chunk) is bytes for chunk in chunks)  # Older Starlette rejects memoryview
+
+
+class TestGenerateMarkdown:
+    def test_cv_sections(self):
+        md = generate_markdown(make_tailored_cv())
+        assert md.startswith("# Jane Doe\n**Senior Python Developer**\n\njane@example.com\n\n## Summary\n")
+        assert "### Software Engineer\n**Acme Corp** | 2020 - Present\n\n- Built REST APIs" in md
+        assert md.endswith("**Tools & Technologies:** Git, Docker\n")
+
+    def test_contact_line_skips_empty_fields(self):
+        cv = make_tailored_cv()
+        cv.header.contact.location = "Berlin"
+        cv.header.contact.linkedin = "https://linkedin.com/in/jane"
+        assert "\njane@example.com | Berlin | [LinkedIn](https://linkedin.com/in/jane)\n" in generate_markdown(cv)
+
+    def test_cover_letter_appended_after_separator(self):
+        cv_only = generate_markdown(make_tailored_cv())
+        md = generate_markdown(make_tailored_cv(), _cover_letter())
+        assert md == (
+            cv_only + "\n---\n\n# Cover Letter\n\n"
+            "Dear team,\n\nI build APIs.\n\nYour stack is mine.\n\nBest, Jane"
+        )
+
+
+class TestGenerateDocx:
+    def test_bullets_use_list_style(self):
+        cv = make_tailored_cv(
+            education=[TailoredEducation(institution="MIT", degree="BSc", field="CS", highlights=["Honors"])],
+            certifications=[TailoredCertification(name="AWS", issuer="Amazon", date="2022")],
+        )
+        doc = Document(io.BytesIO(generate_docx(cv, _cover_letter())))
+
+        bullets = [p.text for p in doc.paragraphs if p.style.name == "List Bullet"]
+        assert bullets == [
+            "Built REST APIs with Python and FastAPI, reducing latency by 30%",
+            "Honors",
+            "AWS - Amazon (2022)",
+        ]
+        assert doc.paragraphs[-1].text == "Best, Jane"
+
+
+class TestGeneratePdf:
+    def test_fonts_parsed_once_per_process(self):
+        cv = make_tailored_cv(experience=[
+            TailoredExperience(
+                company="Acme Corp",
+                title="Software Engineer",
+                dates="2020 - Present",
+                bullets=[TailoredExperienceBullet(text=f"Shipped feature {i}") for i in range(3)],
+            ),
+        ])
+        with patch.object(exporters, "_pdf_template", None), \
+                patch.object(FPDF, "add_font", autospec=True, side_effect=FPDF.add_font) as add_font:
+            first = generate_pdf(cv, _cover_letter())
+            second = generate_pdf(cv)
+
+        assert add_font.call_count == 2  # regular + bold, for the template only
+        assert type(first) is bytes  # immutable, as it is shared via the export cache
+        assert first.startswith(b"%PDF") and second.startswith(b"%PDF")
+        assert len(second) < len(first)  # cover letter page not carried over
@@ -0,0 +1,35 @@
+"""
+Tests for the job requirements helpers.
+"""
+from app.models.job_requirements import Requirement, Responsibility
+from app.services.job_extractor import get_all_required_skills, get_keyword_priority_map
+from tests.conftest import make_job_requirements
+
+
+class TestKeywordPriorityMap:
+    def test_highest_priority_wins_and_keys_are_lowercase(self):
+        requirements = make_job_requirements()
+        requirements.ats_keywords.high_priority[:] = ["Python"]
+        requirements.ats_keywords.medium_priority[:] = ["python", "Docker"]
+        requirements.ats_keywords.contextual[:] = ["docker", "Agile"]
+
+        assert get_keyword_priority_map(requirements) == {
+            "python": "high",
+            "docker": "medium",
+            "agile": "contextual",
+        }
+
+
+class TestAllRequiredSkills:
+    def test_skill_keywords_and_implied_skills(self):
+        requirements = make_job_requirements(
+            nice_to_have=[
+                Requirement(description="Docker experience", category="technical_skill", keywords=["Docker"]),
+                Requirement(description="Team player", category="soft_skill", keywords=["Teamwork", "Python"]),
+                Requirement(description="AWS certified", category="certification", keywords=["AWS"]),
+            ],
+            responsibilities=[Responsibility(description="Build services", implied_skills=["REST", "Go"])],
+        )
+
+        # must_have: "Python" is an experience requirement, "REST" a technical skill
+        assert sorted(get_all_required_skills(requirements)) == ["Docker", "Go", "Python", "REST", "Teamwork"]
@@ -0,0 +1,314 @@
+"""
+Tests for the LLM client — response parsing and prompt construction.
+
+No network calls are made; the Gemini model is never instantiated.
+"""
+import asyncio
+import json
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from pydantic import ValidationError
+
+from app.config import settings
+from app.models.cv_facts import CVFacts
+from app.models.job_requirements import JobRequirements
+from app.utils.llm_client import LLMClient, _schema_json, extract_json_object, warm_up
+
+
+@pytest.fixture
+def llm():
+    return LLMClient(api_key="")
+
+
+# ===================================================================
+# Response parsing
+# ===================================================================
+
+class TestParseResponse:
+    def test_plain_json(self, llm):
+        result = llm._parse_response('{"personal_info": {"name": "Jane Doe"}}', CVFacts)
+        assert isinstance(result, CVFacts)
+        assert result.personal_info.name == "Jane Doe"
+
+    def test_fenced_json(self, llm):
+        response = '```json\n{"personal_info": {"name": "Jane Doe"}}\n```'
+        result = llm._parse_response(response, CVFacts)
+        assert result.personal_info.name == "Jane Doe"
+
+    def test_invalid_json_raises(self, llm):
+        with pytest.raises(ValidationError):
+            llm._parse_response('{"personal_info": ', CVFacts)
+
+    def test_schema_mismatch_raises(self, llm):
+        with pytest.raises(ValidationError):
+            llm._parse_response('{"experience": []}', CVFacts)
+
+
+# ===================================================================
+# Prompt construction
+# ===================================================================
+
+class TestBuildPrompt:
+    def test_schema_keeps_fields_named_description(self):
+        schema = json.loads(_schema_json(JobRequirements))
+        requirement = schema["$defs"]["Requirement"]
+        assert "description" in requirement["properties"]
+
+    def test_schema_rendered_once_per_model(self):
+        assert _schema_json(CVFacts) is _schema_json(CVFacts)
+
+    def test_static_prefix_shared_across_instructions(self, llm):
+        schema_json = _schema_json(CVFacts)
+        first = llm._build_prompt("Extract CV A", schema_json)
+        second = llm._build_prompt("Extract CV B", schema_json, context="notes")
+        prefix = first[:first.index("Extract CV A")]
+        assert second.startswith(prefix)
+        assert schema_json in prefix
+        assert second.endswith("CONTEXT:\nnotes\n\nRespond ONLY with the JSON object, no additional text.")
+
+
+# ===================================================================
+# JSON extraction from free-form replies
+# ===================================================================
+
+class TestExtractJsonObject:
+    def test_plain_object(self):
+        assert extract_json_object('{"hook": "Hi"}') == {"hook": "Hi"}
+
+    def test_fenced_object(self):
+        assert extract_json_object('```json\n{"hook": "Hi"}\n```') == {"hook": "Hi"}
+
+    def test_trailing_chatter_ignored(self):
+        reply = 'Sure! {"hook": "Hi {there}"}\nLet me know if you need {more}.'
+        assert extract_json_object(reply) == {"hook": "Hi {there}"}
+
+    def test_no_object(self):
+        assert extract_json_object("No JSON here") is None
+
+    def test_malformed_raises(self):
+        with pytest.raises(ValueError):
+            extract_json_object('{"hook": ')
+
+
+# ===================================================================
+# Concurrency limit
+# ===================================================================
+
+class TestConcurrencyLimit:
+    @pytest.mark.anyio
+    async def test_requests_in_flight_are_bounded(self, llm, monkeypatch):
+        in_flight = peak = 0
+
+        async def fake_generate_content_async(prompt, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return SimpleNamespace(text="ok")
+
+        llm._semaphore = asyncio.Semaphore(2)
+        llm._model = SimpleNamespace(generate_content_async=fake_generate_content_async)
+
+        results = await asyncio.gather(*(llm.generate_text(f"p{i}") for i in range(6)))
+
+        assert results == ["ok"] * 6
+        assert peak == 2
+
+
+# ===================================================================
+# Rate-limit retries
+# ===================================================================
+
+class RateLimited(Exception):
+    code = 429
+
+
+class Unavailable(Exception):
+    code = 503
+
+
+class TestRateLimitRetry:
+    @pytest.mark.anyio
+    async def test_retries_with_backoff_then_succeeds(self, llm):
+        replies = [RateLimited("quota"), RateLimited("quota"), SimpleNamespace(text="ok")]
+
+        async def fake_generate_content_async(prompt, **kwargs):
+            reply = replies.pop(0)
+            if isinstance(reply, Exception):
+                raise reply
+            return reply
+
+        llm._model = SimpleNamespace(generate_content_async=fake_generate_content_async)
+        with patch("app.utils.llm_client.asyncio.sleep", new_callable=AsyncMock) as sleep, \
+                patch("app.utils.llm_client.random.uniform", return_value=0.0) as jitter:
+            assert await llm.generate_text("p") == "ok"
+
+        delays = [call.args[0] for call in sleep.await_args_list]
+        assert delays == [settings.llm_retry_base_delay, settings.llm_retry_base_delay * 2]
+        jitter.assert_called_with(0, settings.llm_retry_base_delay)
+
+    @pytest.mark.anyio
+    async def test_service_unavailable_retried(self, llm):
+        fake = AsyncMock(side_effect=[Unavailable("overloaded"), SimpleNamespace(text="ok")])
+        llm._model = SimpleNamespace(generate_content_async=fake)
+        with patch("app.utils.llm_client.asyncio.sleep", new_callable=AsyncMock) as sleep:
+            assert await llm.generate_text("p") == "ok"
+
+        (delay,) = [call.args[0] for call in sleep.await_args_list]
+        assert settings.llm_retry_base_delay <= delay <= settings.llm_retry_base_delay * 2
+
+    @pytest.mark.anyio
+    async def test_other_errors_not_retried(self, llm):
+        fake = AsyncMock(side_effect=ValueError("bad request"))
+        llm._model = SimpleNamespace(generate_content_async=fake)
+        with pytest.raises(ValueError):
+            await llm.generate_text("p")
+        assert fake.await_count == 1
+
+
+# ===================================================================
+# System instructions
+# ===================================================================
+
+class TestSystemInstructionModels:
+    def test_one_model_per_system_instruction(self, llm):
+        genai = MagicMock()
+        genai.GenerativeModel.side_effect = lambda **kwargs: SimpleNamespace(**kwargs)
+        with patch("app.utils.llm_client._genai", return_value=genai):
+            rules = llm._model_for("RULES")
+            assert llm._model_for("RULES") is rules
+            assert rules.system_instruction == "RULES"
+            assert llm._model_for("OTHER") is not rules
+            assert llm._model_for(None).system_instruction is None
+        assert genai.GenerativeModel.call_count == 3
+
+
+# ===================================================================
+# Response cache
+# ===================================================================
+
+class TestResponseCache:
+    @pytest.mark.anyio
+    async def test_identical_text_calls_hit_cache(self, llm):
+        fake = AsyncMock(return_value=SimpleNamespace(text="ok"))
+        llm._model = SimpleNamespace(generate_content_async=fake)
+
+        assert await llm.generate_text("p") == "ok"
+        assert await llm.generate_text("p") == "ok"
+        assert await llm.generate_text("p", context="more") == "ok"
+        assert fake.await_count == 2
+
+    @pytest.mark.anyio
+    async def test_unparseable_structured_reply_not_cached(self, llm):
+        replies = ['{"personal_info": ', '{"personal_info": {"name": "Jane Doe"}}']
+        fake = AsyncMock(side_effect=lambda prompt, **kwargs: SimpleNamespace(text=replies.pop(0)))
+        llm._model = SimpleNamespace(generate_content_async=fake)
+
+        first = await llm.generate_structured("Extract", CVFacts)
+        second = await llm.generate_structured("Extract", CVFacts)
+
+        assert first.personal_info.name == second.personal_info.name == "Jane Doe"
+        assert fake.await_count == 2  # one retry, then served from cache
+
+
+class TestSingleFlight:
+    @staticmethod
+    def _slow_model(reply, calls):
+        async def fake_generate_content_async(prompt, **kwargs):
+            calls.append(prompt)
+            await asyncio.sleep(0.01)
+            if isinstance(reply, Exception):
+                raise reply
+            return SimpleNamespace(text=reply)
+        return SimpleNamespace(generate_content_async=fake_generate_content_async)
+
+    @pytest.mark.anyio
+    async def test_concurrent_identical_calls_share_one_request(self, llm):
+        calls = []
+        llm._model = self._slow_model('{"personal_info": {"name": "Jane Doe"}}', calls)
+
+        first, second = await asyncio.gather(
+            llm.generate_structured("Extract", CVFacts),
+            llm.generate_structured("Extract", CVFacts),
+        )
+
+        assert len(calls) == 1
+        assert first.personal_info.name == second.personal_info.name == "Jane Doe"
+        assert first is not second
+        assert llm._in_flight == {}
+
+    @pytest.mark.anyio
+    async def test_failure_reaches_every_waiter(self, llm):
+        calls = []
+        llm._model = self._slow_model(ValueError("bad request"), calls)
+
+        results = await asyncio.gather(llm.generate_text("p"), llm.generate_text("p"), return_exceptions=True)
+
+        assert len(calls) == 1
+        assert [str(r) for r in results] == ["bad request", "bad request"]
+        assert llm._in_flight == {}
+
+    @pytest.mark.anyio
+    async def test_waiter_takes_over_when_first_caller_cancelled(self, llm):
+        calls = []
+        llm._model = self._slow_model("ok", calls)
+
+        first = asyncio.create_task(llm.generate_text("p"))
+        second = asyncio.create_task(llm.generate_text("p"))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert await second == "ok"
+        assert len(calls) == 2
+        assert first.cancelled()
+
+
+class TestStats:
+    @pytest.mark.anyio
+    async def test_cache_and_request_counters(self, llm):
+        fake = AsyncMock(side_effect=[SimpleNamespace(text="ok"), ValueError("bad request")])
+        llm._model = SimpleNamespace(generate_content_async=fake)
+
+        await llm.generate_text("p")
+        await llm.generate_text("p")
+        with pytest.raises(ValueError):
+            await llm.generate_text("q")
+
+        stats = llm.stats.snapshot()
+        assert stats["cache"] == {"hits": 1, "misses": 2, "shared": 0, "hit_rate": 0.333}
+        assert stats["requests"]["total"] == 2
+        assert stats["requests"]["errors"] == 1
+        assert stats["in_flight"] == 0
+        assert stats["peak_in_flight"] == 1
+
+
+class TestStructuredJsonMode:
+    @pytest.mark.anyio
+    async def test_structured_calls_request_json_mode(self, llm):
+        fake = AsyncMock(return_value=SimpleNamespace(text='{"personal_info": {"name": "Jane Doe"}}'))
+        llm._model = SimpleNamespace(generate_content_async=fake)
+
+        await llm.generate_structured("Extract", CVFacts)
+        await llm.generate_text("Summarise")
+
+        structured, text = fake.await_args_list
+        assert structured.kwargs["generation_config"] == {"response_mime_type": "application/json"}
+        assert text.kwargs["generation_config"] is None
+
+
+# ===================================================================
+# Startup warm-up
+# ===================================================================
+
+class TestWarmUp:
+    def test_builds_model_and_schemas(self, llm):
+        genai = MagicMock()
+        with patch("app.utils.llm_client.get_llm_client", return_value=llm), \
+                patch("app.utils.llm_client._genai", return_value=genai), \
+                patch("app.utils.llm_client._schema_json") as schema_json:
+            warm_up([CVFacts, JobRequirements])
+
+        assert llm._model is genai.GenerativeModel.return_value
+        assert [call.args[0] for call in schema_json.call_args_list] == [CVFacts, JobRequirements]
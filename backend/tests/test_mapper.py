@@ -0,0 +1,80 @@
+"""
+Tests for the requirements-to-evidence mapper.
+
+The LLM client is mocked; no API calls are made.
+"""
+import json
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.models.job_requirements import Requirement
+from app.services.mapper import TRANSFERABLE_SKILLS_SYSTEM, map_requirements_to_evidence
+from tests.conftest import make_cv_facts, make_job_requirements
+
+
+class TestMapRequirements:
+    @pytest.mark.anyio
+    async def test_transferable_skills_found_in_one_call(self):
+        requirements = make_job_requirements(
+            must_have=[
+                Requirement(description="Kubernetes", category="technical_skill", keywords=["Kubernetes"]),
+                Requirement(description="Python", category="technical_skill", keywords=["Python"]),
+            ],
+            nice_to_have=[
+                Requirement(description="Rust", category="technical_skill", keywords=["Rust"]),
+            ],
+        )
+        reply = json.dumps({"matches": [
+            {"req_id": 1, "transferable_skills": []},
+            {"req_id": "2", "transferable_skills": [
+                {"candidate_skill": "Python", "relevance_explanation": "Systems programming"},
+            ]},
+        ]})
+        client = MagicMock()
+        client.generate_text = AsyncMock(return_value=reply)
+        with patch("app.services.mapper.get_llm_client", return_value=client):
+            mapping = await map_requirements_to_evidence(requirements, make_cv_facts())
+
+        # Only the requirements without direct evidence are sent, together
+        client.generate_text.assert_awaited_once()
+        prompt = client.generate_text.await_args.args[0]
+        assert client.generate_text.await_args.kwargs["system"] == TRANSFERABLE_SKILLS_SYSTEM
+        assert prompt.startswith("CANDIDATE SKILLS: ")
+        assert "1. Kubernetes (keywords: Kubernetes)" in prompt
+        assert "2. Rust (keywords: Rust)" in prompt
+        assert "Python (keywords" not in prompt
+
+        assert [(e.requirement.text, e.requirement.priority) for e in mapping.mapping_table] == [
+            ("Kubernetes", "must_have"), ("Python", "must_have"), ("Rust", "nice_to_have"),
+        ]
+        kubernetes, python, rust = mapping.mapping_table
+        assert kubernetes.evidence == []
+        assert {e.match_type for e in python.evidence} == {"direct"}
+        assert [e.match_type for e in rust.evidence] == ["transferable"]
+        assert rust.evidence[0].original_text.endswith("(Transferable: Systems programming)")
+
+    @pytest.mark.anyio
+    async def test_no_llm_call_when_everything_has_evidence(self):
+        client = MagicMock()
+        client.generate_text = AsyncMock()
+        with patch("app.services.mapper.get_llm_client", return_value=client):
+            mapping = await map_requirements_to_evidence(make_job_requirements(), make_cv_facts())
+
+        client.generate_text.assert_not_awaited()
+        assert len(mapping.mapping_table) == 3
+
+
+class TestKeywordCoverage:
+    @pytest.mark.anyio
+    async def test_keywords_split_in_priority_order(self):
+        requirements = make_job_requirements()
+        requirements.ats_keywords.high_priority[:] = ["Kubernetes", "Python"]
+        requirements.ats_keywords.medium_priority[:] = ["REST", "Python", "Rust"]
+        requirements.ats_keywords.contextual[:] = ["latency", "Agile"]
+        with patch("app.services.mapper.get_llm_client"):
+            mapping = await map_requirements_to_evidence(requirements, make_cv_facts(), strictness="conservative")
+
+        coverage = mapping.keyword_coverage
+        # "Python" is a listed skill; "REST" and "latency" only appear in CV text
+        assert coverage.present_in_cv == ["Python", "REST", "latency"]
+        assert coverage.genuinely_missing == ["Kubernetes", "Rust", "Agile"]
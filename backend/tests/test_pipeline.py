@@ -1,10 +1,12 @@
 """
 Tests for the shared tailoring pipeline.
 """
+import asyncio
+import gc
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
 
-from app.services.tailoring_pipeline import run_tailoring_pipeline, TailoringError
+from app.services.tailoring_pipeline import run_tailoring_pipeline, run_tailoring_batch, TailoringError
 from app.models.options import TailorRequest, TailorOptions
 from tests.conftest import (
     make_cv_facts, make_job_requirements, make_mapping,
@@ -49,6 +51,8 @@ class TestTailoringPipeline:
 
         assert result.tailored_cv.header.name == "Jane Doe"
         assert result.match_score.score == 75
+        assert result.mapping_summary.overall_score == 75
+        assert result.mapping_summary.must_have_coverage == "2/2"
 
     @pytest.mark.anyio
     async def test_progress_callback(self, pipeline_request):
@@ -90,3 +94,112 @@ class TestTailoringPipeline:
                 p.stop()
 
         assert exc_info.value.error_type == "FABRICATION_DETECTED"
+
+    @pytest.mark.anyio
+    async def test_extraction_failure_cancels_sibling(self, pipeline_request):
+        cancelled = asyncio.Event()
+
+        async def slow_cv_extraction(cv_text):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        mocks = _mock_pipeline_services()
+        mocks["app.services.tailoring_pipeline.extract_job_requirements"] = AsyncMock(
+            side_effect=ValueError("job extraction failed")
+        )
+        mocks["app.services.tailoring_pipeline.extract_cv_facts"] = slow_cv_extraction
+        patchers = [patch(t, m) for t, m in mocks.items()]
+        for p in patchers:
+            p.start()
+        try:
+            with pytest.raises(ValueError):
+                await run_tailoring_pipeline(pipeline_request)
+            await asyncio.wait_for(cancelled.wait(), timeout=1)
+        finally:
+            for p in patchers:
+                p.stop()
+
+        assert cancelled.is_set()
+
+    @pytest.mark.anyio
+    async def test_fabrication_cancels_cover_letter(self, pipeline_request):
+        cancelled = asyncio.Event()
+
+        async def slow_cover_letter(*args):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        async def yielding_cv_generation(*args):
+            await asyncio.sleep(0)  # let the cover letter task start
+            return make_tailored_cv(), [], []
+
+        mocks = _mock_pipeline_services()
+        mocks["app.services.tailoring_pipeline.generate_cover_letter"] = slow_cover_letter
+        mocks["app.services.tailoring_pipeline.generate_tailored_cv"] = yielding_cv_generation
+        mocks["app.services.tailoring_pipeline.run_quality_checks"] = MagicMock(
+            return_value=(False, ["Fabricated company"], [], make_match_score())
+        )
+        patchers = [patch(t, m) for t, m in mocks.items()]
+        for p in patchers:
+            p.start()
+        try:
+            with pytest.raises(TailoringError):
+                await run_tailoring_pipeline(pipeline_request)
+            await asyncio.wait_for(cancelled.wait(), timeout=1)
+        finally:
+            for p in patchers:
+                p.stop()
+
+        assert cancelled.is_set()
+
+
+    @pytest.mark.anyio
+    async def test_failed_cover_letter_retrieved_when_generation_fails(self, pipeline_request):
+        unretrieved = []
+        loop = asyncio.get_running_loop()
+        loop.set_exception_handler(lambda loop, context: unretrieved.append(context["message"]))
+
+        async def failing_cover_letter(*args):
+            raise ValueError("cover letter failed")
+
+        async def failing_cv_generation(*args):
+            await asyncio.sleep(0)  # let the cover letter task fail first
+            raise ValueError("generation failed")
+
+        mocks = _mock_pipeline_services()
+        mocks["app.services.tailoring_pipeline.generate_cover_letter"] = failing_cover_letter
+        mocks["app.services.tailoring_pipeline.generate_tailored_cv"] = failing_cv_generation
+        patchers = [patch(t, m) for t, m in mocks.items()]
+        for p in patchers:
+            p.start()
+        try:
+            with pytest.raises(ValueError, match="generation failed"):
+                await run_tailoring_pipeline(pipeline_request)
+            gc.collect()  # an unretrieved task error is reported when the task is freed
+        finally:
+            loop.set_exception_handler(None)
+            for p in patchers:
+                p.stop()
+
+        assert unretrieved == []
+
+class TestTailoringBatch:
+    @pytest.mark.anyio
+    async def test_shared_cv_extracted_once_before_pipelines(self, pipeline_request):
+        other = pipeline_request.model_copy(update={"job_description": JOB_DESCRIPTION + " Remote."})
+        with patch("app.services.tailoring_pipeline.extract_cv_facts", new_callable=AsyncMock) as mock_cv, \
+                patch("app.services.tailoring_pipeline.extract_job_requirements", new_callable=AsyncMock) as mock_job, \
+                patch("app.services.tailoring_pipeline.run_tailoring_pipeline", new_callable=AsyncMock) as mock_run:
+            items = await run_tailoring_batch([pipeline_request, other])
+
+        # Only the CV is shared; each job description is left to its own pipeline
+        mock_cv.assert_awaited_once_with(CV_TEXT)
+        mock_job.assert_not_awaited()
+        assert mock_run.await_count == 2
+        assert len(items) == 2
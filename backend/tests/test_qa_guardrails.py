@@ -80,6 +80,52 @@ class TestFabricationDetection:
         has_fab, errors = detect_fabrication(cv, tailored)
         assert not has_fab, f"Unexpected fabrication: {errors}"
 
+    def test_skills_match_inferred_and_technologies_case_insensitively(self):
+        cv = make_cv_facts()
+        tailored = make_tailored_cv(
+            skills=TailoredSkills(
+                primary=["python", "rest apis"],  # Listed skill, inferred skill
+                secondary=["fastapi"],  # Also a responsibility technology
+                tools=["Rust", "rust"],
+            ),
+        )
+        validator = QAValidator(cv, tailored)
+        validator.validate_all()
+        assert validator.issues == ["FABRICATION: Skill 'rust' not evidenced in original CV"]
+
+
+# ===================================================================
+# Metric checks
+# ===================================================================
+
+class TestMetricValidation:
+    @staticmethod
+    def _warnings(bullet: str) -> list[str]:
+        tailored = make_tailored_cv(
+            experience=[
+                TailoredExperience(
+                    company="Acme Corp",
+                    title="Software Engineer",
+                    dates="2020 - Present",
+                    bullets=[TailoredExperienceBullet(text=bullet)],
+                ),
+            ],
+        )
+        validator = QAValidator(make_cv_facts(), tailored)
+        validator.validate_all()
+        return [w for w in validator.warnings if w.startswith("POSSIBLE EXAGGERATION")]
+
+    def test_numbers_within_ten_percent_of_original_accepted(self):
+        # Original achievement: "Reduced latency by 30%"
+        assert self._warnings("Cut latency by 30%") == []
+        assert self._warnings("Cut latency by 32%") == []
+        assert self._warnings("Cut latency by 27%") == []
+
+    def test_inflated_numbers_flagged(self):
+        warnings = self._warnings("Cut latency by 40%")
+        assert "POSSIBLE EXAGGERATION: Number '40%' in bullet may not match original" in warnings
+        assert "POSSIBLE EXAGGERATION: Number '40' in bullet may not match original" in warnings
+
 
 # ===================================================================
 # Exaggeration detection
@@ -172,6 +218,20 @@ class TestMatchScoreCalculation:
         score = calculate_match_score(mapping, changes, [])
         assert any("quantified" in b.lower() for b in score.breakdown.bonuses)
 
+    def test_bonus_for_keyword_integration(self):
+        changes = [
+            ChangeLogEntry(
+                section="experience",
+                change_type="rewrite",
+                original="Built APIs",
+                new="Built REST APIs",
+                justification="Integrated the REST Keyword",
+                confidence="medium",
+            ),
+        ]
+        score = calculate_match_score(make_mapping(), changes, [])
+        assert score.breakdown.bonuses == ["+3 for keyword integration in 1 bullets"]
+
     def test_penalty_for_critical_gaps(self):
         mapping = make_mapping(
             overall_match=make_mapping().overall_match.model_copy(
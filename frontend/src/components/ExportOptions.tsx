@@ -33,7 +33,7 @@ export function ExportOptions({ result }: ExportOptionsProps) {
                 <div style="text-align: center; margin-bottom: 20px;">
                     <h1 style="margin: 0; font-size: 28px; color: #1a1a2e;">${cv.header.name}</h1>
                     <p style="margin: 5px 0; font-size: 16px; color: #666;">${cv.header.title}</p>
-                    <p style="margin: 5px 0; font-size: 12px; color: #888;">${Object.values(cv.header.contact).join(' | ')}</p>
+                    <p style="margin: 5px 0; font-size: 12px; color: #888;">${Object.values(cv.header.contact).filter(Boolean).join(' | ')}</p>
                 </div>
 
                 <div style="margin-bottom: 20px;">
@@ -156,7 +156,7 @@ export function ExportOptions({ result }: ExportOptionsProps) {
 
         let markdown = `# ${cv.header.name}\n`;
         markdown += `**${cv.header.title}**\n\n`;
-        markdown += `${Object.values(cv.header.contact).join(' | ')}\n\n`;
+        markdown += `${Object.values(cv.header.contact).filter(Boolean).join(' | ')}\n\n`;
         markdown += `## Summary\n${cv.summary}\n\n`;
 
         markdown += `## Experience\n`;
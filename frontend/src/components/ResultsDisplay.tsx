@@ -118,7 +118,7 @@ function CVPreview({ cv }: { cv: TailorResult['tailored_cv'] }) {
                     {cv.header.title}
                 </Typography>
                 <Typography variant="body2" sx={{ color: 'text.secondary' }}>
-                    {Object.values(cv.header.contact).join(' | ')}
+                    {Object.values(cv.header.contact).filter(Boolean).join(' | ')}
                 </Typography>
             </Box>
 
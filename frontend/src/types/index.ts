@@ -122,11 +122,19 @@ export interface CVFacts {
 }
 
 // Tailored Output
+export interface ContactInfo {
+    email: string | null;
+    phone: string | null;
+    location: string | null;
+    linkedin: string | null;
+    website: string | null;
+}
+
 export interface TailoredCV {
     header: {
         name: string;
         title: string;
-        contact: Record<string, string>;
+        contact: ContactInfo;
     };
     summary: string;
     experience: {